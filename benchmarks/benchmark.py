@@ -0,0 +1,258 @@
+"""
+Benchmarks for the public check paths of nptyping.
+
+Run them with `invoke benchmark`. The results are written as JSON and compared
+against the committed baseline (benchmarks/baseline.json). A benchmark that
+takes more than `threshold` times its baseline counts as a regression. Timings
+depend on the machine, so update the baseline with `invoke benchmark --save`
+on the machine that runs the comparison.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from contextlib import contextmanager
+from functools import partial
+from itertools import count
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+)
+
+import numpy as np
+
+from nptyping import (
+    DataFrame,
+    Float,
+    NDArray,
+    Shape,
+    Structure,
+    cache_info,
+    configure_cache,
+)
+from nptyping.typing_ import Literal
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+_HERE = Path(__file__).parent
+_BASELINE = _HERE / "baseline.json"
+_RESULTS = _HERE / "results.json"
+_DEFAULT_THRESHOLD = 1.5
+
+
+@contextmanager
+def caches_disabled() -> Iterator[None]:
+    """Disable all caches of nptyping, so that every check is a cold one."""
+    maxsize_per_name = {name: info.maxsize for name, info in cache_info().items()}
+    configure_cache(**{f"{name}_maxsize": 0 for name in maxsize_per_name})
+    try:
+        yield
+    finally:
+        configure_cache(
+            **{f"{name}_maxsize": size for name, size in maxsize_per_name.items()}
+        )
+
+
+def time_call(func: Callable[[], Any], number: int) -> float:
+    """Return the best time of func in microseconds per call."""
+    func()  # Warm up.
+    return min(timeit.repeat(func, number=number, repeat=7)) / number * 1e6
+
+
+def time_warm_and_cold(
+    results: Dict[str, float], name: str, func: Callable[[], Any], number: int
+) -> None:
+    """Time func with and without caches."""
+    results[f"{name}_warm"] = time_call(func, number)
+    with caches_disabled():
+        results[f"{name}_cold"] = time_call(func, number)
+
+
+def structure_expression(nr_of_fields: int, prefix: str = "f") -> str:
+    """Create a structure expression with alternating Float and Int fields."""
+    return ", ".join(
+        f"{prefix}{i}: {'Float' if i % 2 else 'Int'}" for i in range(nr_of_fields)
+    )
+
+
+def structured_array(nr_of_fields: int) -> np.ndarray:
+    """Create an array that corresponds to structure_expression."""
+    dtype = [(f"f{i}", float if i % 2 else int) for i in range(nr_of_fields)]
+    return np.zeros((8,), dtype=dtype)
+
+
+def benchmark_subscription(results: Dict[str, float]) -> None:
+    """Benchmark the creation of nptyping types."""
+    counter = count()
+    results["subscription_ndarray"] = time_call(
+        lambda: NDArray[Shape["N, 3"], Float], 10000
+    )
+    results["subscription_shape"] = time_call(lambda: Shape["N, 3"], 10000)
+    results["subscription_shape_new"] = time_call(
+        lambda: Shape[f"{next(counter)}, N, 3"], 5000
+    )
+    results["subscription_structure"] = time_call(
+        lambda: Structure["x: Float, y: Int"], 10000
+    )
+    for nr_of_fields, number in ((10, 200), (100, 20), (1000, 3)):
+        results[f"subscription_structure_new_{nr_of_fields}"] = time_call(
+            lambda n=nr_of_fields: Structure[
+                structure_expression(n, f"f{next(counter)}_")
+            ],
+            number,
+        )
+    long_expression = ", ".join(["N"] * 32)
+    results["equality_shape"] = time_call(
+        lambda: Shape[long_expression] == Shape[long_expression], 10000
+    )
+    # Neither subscription nor equality should depend on the expression length.
+    for nr_of_dimensions in (32, 512):
+        expression = ", ".join(["N"] * nr_of_dimensions)
+        shape = Shape[expression]
+        other_shape = Shape[expression.replace("N", "M")]
+        literal = Literal[f" {expression} "]
+        results[f"subscription_shape_{nr_of_dimensions}"] = time_call(
+            lambda e=expression: Shape[e], 10000
+        )
+        results[f"equality_shape_other_{nr_of_dimensions}"] = time_call(
+            lambda s=shape, other=other_shape: s == other, 10000
+        )
+        results[f"equality_shape_literal_{nr_of_dimensions}"] = time_call(
+            lambda s=shape, other=literal: s == other, 10000
+        )
+
+
+def benchmark_isinstance(results: Dict[str, float]) -> None:
+    """Benchmark instance checks of NDArray."""
+    cases = {
+        "variables": (NDArray[Shape["N, N, 3"], Float], np.zeros((64, 64, 3))),
+        "ellipsis": (NDArray[Shape["N, ..."], Float], np.zeros((4, 4, 4, 4))),
+        "labels": (
+            NDArray[Shape["[x, y] coordinates, * samples"], Float],
+            np.zeros((2, 100)),
+        ),
+        "mismatch": (NDArray[Shape["N, N"], Float], np.zeros((3, 4))),
+    }
+    for name, (type_, arr) in cases.items():
+        time_warm_and_cold(
+            results,
+            f"isinstance_{name}",
+            partial(isinstance, arr, type_),
+            10000,
+        )
+    for nr_of_fields, number in ((10, 1000), (100, 100), (1000, 10)):
+        type_ = NDArray[Any, Structure[structure_expression(nr_of_fields)]]
+        arr = structured_array(nr_of_fields)
+        time_warm_and_cold(
+            results,
+            f"isinstance_structure_{nr_of_fields}",
+            partial(isinstance, arr, type_),
+            number,
+        )
+
+
+def benchmark_dataframe(results: Dict[str, float]) -> None:
+    """Benchmark instance checks of DataFrame."""
+    if pd is None:  # pragma: no cover
+        return
+    for nr_of_columns, number in ((10, 1000), (100, 100)):
+        type_ = DataFrame[Structure[structure_expression(nr_of_columns)]]
+        df = pd.DataFrame(structured_array(nr_of_columns))
+        time_warm_and_cold(
+            results,
+            f"isinstance_dataframe_{nr_of_columns}",
+            partial(isinstance, df, type_),
+            number,
+        )
+
+
+def benchmark_import(results: Dict[str, float]) -> None:
+    """Benchmark the import time of nptyping with `python -X importtime`."""
+    timings = []
+    for _ in range(5):
+        # Numpy is imported upfront, to measure the time of nptyping itself.
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import numpy, nptyping"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=_HERE.parent,
+        )
+        for line in process.stderr.splitlines():
+            # Format: "import time: self [us] | cumulative | imported package"
+            _, cumulative, package = line.split("|")
+            if package.strip() == "nptyping":
+                timings.append(float(cumulative))
+    results["import_nptyping"] = min(timings)
+
+
+def run_benchmarks() -> Dict[str, float]:
+    """Run all benchmarks and return the results in microseconds."""
+    results: Dict[str, float] = {}
+    benchmark_subscription(results)
+    benchmark_isinstance(results)
+    benchmark_dataframe(results)
+    benchmark_import(results)
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> bool:
+    """Print the results against the baseline and return whether all is fine."""
+    success = True
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<45} {result:>12.2f}us {'(new)':>10}")
+            continue
+        ratio = result / baseline[name]
+        regression = ratio > threshold
+        success = success and not regression
+        marker = "REGRESSION" if regression else ""
+        print(f"{name:<45} {result:>12.2f}us {ratio:>9.2f}x {marker}")
+    return success
+
+
+def main() -> int:
+    """Run the benchmarks, write the results and compare them."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", default=str(_RESULTS))
+    parser.add_argument("--baseline", default=str(_BASELINE))
+    parser.add_argument("--threshold", type=float, default=_DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks()
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__ if pd is not None else None,
+        "platform": platform.platform(),
+        "unit": "us",
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", "utf8")
+    if args.save:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n", "utf8")
+        print(f"Stored the baseline in {args.baseline}")
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text("utf8"))["results"]
+    success = compare(results, baseline, args.threshold)
+    if not success:
+        print(f"Some benchmarks regressed more than {args.threshold}x the baseline.")
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,18 +21,34 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+from nptyping.acheck import acheck
 from nptyping.assert_isinstance import assert_isinstance
+from nptyping.cache import (
+    CacheInfo,
+    cache_info,
+    configure_cache,
+)
+from nptyping.check import check
+from nptyping.check_all import check_all
+from nptyping.check_contents import check_contents
+from nptyping.check_npy import NpyCheck, check_npy
+from nptyping.check_npz import NpzCheck, check_npz
+from nptyping.checking import checking, set_checking
 from nptyping.error import (
     InvalidArgumentsError,
     InvalidDTypeError,
+    InvalidInstanceError,
     InvalidShapeError,
     InvalidStructureError,
     NPTypingError,
 )
+from nptyping.explain import Mismatch, explain
 from nptyping.ndarray import NDArray
 from nptyping.package_info import __version__
 from nptyping.pandas_.dataframe import DataFrame
+from nptyping.parallel import configure_parallelism
 from nptyping.recarray import RecArray
+from nptyping.registry_info import registry_info
 from nptyping.shape import Shape
 from nptyping.shape_expression import (
     normalize_shape_expression,
@@ -105,11 +121,34 @@ from nptyping.typing_ import (
     Void,
     Void0,
 )
+from nptyping.value_constraints import (
+    Bounds,
+    Excludes,
+    Finite,
+    ValueConstraint,
+)
 
 __all__ = [
     "NDArray",
     "RecArray",
+    "acheck",
     "assert_isinstance",
+    "check",
+    "check_all",
+    "check_contents",
+    "check_npy",
+    "NpyCheck",
+    "check_npz",
+    "NpzCheck",
+    "explain",
+    "Mismatch",
+    "configure_parallelism",
+    "checking",
+    "set_checking",
+    "configure_cache",
+    "cache_info",
+    "CacheInfo",
+    "registry_info",
     "validate_shape_expression",
     "normalize_shape_expression",
     "NPTypingError",
@@ -117,8 +156,13 @@ __all__ = [
     "InvalidShapeError",
     "InvalidStructureError",
     "InvalidDTypeError",
+    "InvalidInstanceError",
     "Shape",
     "Structure",
+    "Bounds",
+    "Excludes",
+    "Finite",
+    "ValueConstraint",
     "__version__",
     "DType",
     "Number",
@@ -0,0 +1,100 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from functools import partial
+from threading import Event
+from typing import (
+    Any,
+    Callable,
+    Optional,
+    Type,
+)
+
+from nptyping.checking import should_check
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.pandas_.dataframe import DataFrameMeta  # type: ignore[attr-defined]
+from nptyping.parallel import check_values_in_parallel
+
+
+async def acheck(
+    instance: Any, cls: Type[Any], timeout: Optional[float] = None
+) -> bool:
+    """
+    Check instance against cls without blocking the event loop. The cheap
+    checks (type, shape and dtype) are done inline. The expensive checks (the
+    values of an NDArray with value constraints and the structure of a
+    DataFrame) are done in the default executor of the running loop. The
+    checking mode and the caches are shared with isinstance.
+    :param instance: the instance that is checked against cls.
+    :param cls: the type against which instance is checked.
+    :param timeout: the maximum number of seconds to wait for the expensive
+    checks, or None to wait indefinitely.
+    :return: True if instance is an instance of cls.
+    :raises asyncio.TimeoutError: if the checks took longer than timeout.
+    """
+    if not should_check():
+        return _check_type(instance, cls)
+
+    # pylint: disable=protected-access
+    if isinstance(cls, NDArrayMeta):
+        constraints = cls.__args__[2:]
+        layout_is_ok: bool = cls._layout_check(instance)
+        if not constraints or not layout_is_ok:
+            return layout_is_ok
+        stop = Event()
+        func = partial(check_values_in_parallel, instance, constraints, stop=stop)
+        return await _run_in_executor(func, timeout, stop)
+
+    if isinstance(cls, DataFrameMeta) and cls.__args__[0] is not Any:
+        func = partial(cls._check_instance, instance)
+        return await _run_in_executor(func, timeout)
+
+    return isinstance(instance, cls)
+
+
+def _check_type(instance: Any, cls: Type[Any]) -> bool:
+    # Check the type of instance only, as isinstance does with checking off.
+    # pylint: disable=protected-access
+    expected_type = cls
+    if isinstance(cls, NDArrayMeta):
+        expected_type = cls._array_type
+    elif isinstance(cls, DataFrameMeta):
+        expected_type = cls._get_pandas().DataFrame
+    return isinstance(instance, expected_type)
+
+
+async def _run_in_executor(
+    func: Callable[[], bool], timeout: Optional[float], stop: Optional[Event] = None
+) -> bool:
+    # Run func in the default executor. Upon a timeout or cancellation, the
+    # stop event tells func to stop early. The asyncio module is imported here
+    # to keep it from slowing down the import of nptyping. It has been
+    # imported already by whoever runs the loop.
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await asyncio.wait_for(loop.run_in_executor(None, func), timeout)
+    finally:
+        if stop is not None:
+            stop.set()
@@ -28,6 +28,10 @@ from typing import (
     TypeVar,
 )
 
+from nptyping.explain import describe, explain
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.pandas_.dataframe import DataFrameMeta  # type: ignore[attr-defined]
+
 try:
     from typing import TypeGuard  # type: ignore[attr-defined]
 except ImportError:  # pragma: no cover
@@ -47,6 +51,13 @@ def assert_isinstance(
     :param message: any message that is displayed when the assert check fails.
     :return: the type of cls.
     """
-    message = message or f"instance={instance!r}, cls={cls!r}"
-    assert isinstance(instance, cls), message
+    assert isinstance(instance, cls), message or _create_message(instance, cls)
     return True
+
+
+def _create_message(instance: Any, cls: Type[Any]) -> str:
+    # Create the message upon failure only. Arrays and data frames are not
+    # repr'd, as that is expensive for large ones.
+    if not isinstance(cls, (NDArrayMeta, DataFrameMeta)):
+        return f"instance={instance!r}, cls={cls!r}"
+    return f"instance={describe(instance)}, cls={cls!r}: {explain(instance, cls)}"
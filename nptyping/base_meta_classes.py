@@ -21,18 +21,22 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import copyreg
+import operator
 from abc import ABCMeta, abstractmethod
-from inspect import FrameInfo
+from types import FrameType
 from typing import (
     Any,
+    Callable,
     Dict,
-    List,
     Optional,
-    Set,
     Tuple,
     TypeVar,
+    Union,
 )
+from weakref import WeakValueDictionary
 
+from nptyping.cache import create_cache
 from nptyping.error import InvalidArgumentsError, NPTypingError
 
 _T = TypeVar("_T")
@@ -73,6 +77,7 @@ class FinalMeta(ABCMeta):
     def __init_subclass__(cls, implementation: Optional[str] = None) -> None:
         # implementation is made Optional here, to allow other meta classes to
         # inherit.
+        super().__init_subclass__()
         cls._name_per_meta_cls[cls] = implementation
 
     def __new__(cls, name: str, *args: Any, **kwargs: Any) -> type:
@@ -118,17 +123,42 @@ class SubscriptableMeta(ABCMeta):
     new type is returned for every unique set of arguments.
     """
 
-    _all_types: Dict[Tuple[type, Tuple[Any, ...]], type] = {}
+    # Types are kept here for as long as they are in use elsewhere, so that
+    # the same arguments give the same type without leaking unused types.
+    _all_types: "WeakValueDictionary[Tuple[type, Tuple[Any, ...]], type]" = (
+        WeakValueDictionary()
+    )
     _parameterized: bool = False
 
+    def __init_subclass__(  # pylint: disable=bad-mcs-classmethod-argument
+        cls, **kwargs: Any
+    ) -> None:
+        super().__init_subclass__(**kwargs)
+        # Pickle looks up classes by their names and ignores any __reduce__ on
+        # their meta classes, unless it is registered with copyreg.
+        copyreg.pickle(cls, cls.__reduce__)
+
+    def __reduce__(cls) -> Union[str, Tuple[Callable[..., Any], Tuple[Any, ...]]]:
+        # A parameterized type is reduced to its base type and its arguments,
+        # so that unpickling it is a mere subscription that returns the type
+        # from the registry if it exists already.
+        if not cls._parameterized:
+            return cls.__name__
+        args = cls.__args__  # type: ignore[attr-defined]
+        item = args[0] if len(args) == 1 else args
+        return operator.getitem, (cls.__bases__[0], item)
+
     @abstractmethod
     def _get_item(cls, item: Any) -> Tuple[Any, ...]:
         ...  # pragma: no cover
 
-    def _get_module(cls, stack: List[FrameInfo], module: str) -> str:
+    def _get_module(cls, frame: Optional[FrameType], module: str) -> str:
         # The magic below makes Python's help function display a meaningful
-        # text with nptyping types.
-        return "typing" if stack[1][3] == "formatannotation" else module
+        # text with nptyping types. The given frame is that of __module__, so
+        # its caller is the one that wants to know the module.
+        caller = frame.f_back if frame else None
+        is_formatannotation = caller and caller.f_code.co_name == "formatannotation"
+        return "typing" if is_formatannotation else module
 
     def _get_additional_values(
         cls, item: Any  # pylint: disable=unused-argument
@@ -156,13 +186,15 @@ class SubscriptableMeta(ABCMeta):
         cls, args: Tuple[Any, ...], additional_values: Dict[str, Any]
     ) -> type:
         key = (cls, args)
-        if key not in cls._all_types:
-            cls._all_types[key] = type(
+        result = cls._all_types.get(key)
+        if result is None:
+            result = type(
                 cls.__name__,
                 (cls,),
                 {"__args__": args, "_parameterized": True, **additional_values},
             )
-        return cls._all_types[key]
+            cls._all_types[key] = result
+        return result
 
 
 class ComparableByArgsMeta(ABCMeta):
@@ -197,7 +229,8 @@ class ContainerMeta(
     Base meta class for "containers" such as Shape and Structure.
     """
 
-    _known_expressions: Set[str] = set()
+    # Types by their expressions as given, both raw and normalized.
+    _type_per_expression = create_cache("expression", maxsize=1024)
     __args__: Tuple[str, ...]
 
     @abstractmethod
@@ -214,16 +247,22 @@ class ContainerMeta(
                 f"Unexpected argument of type {type(item)}, expecting a string."
             )
 
-        if item in cls._known_expressions:
-            # No need to do costly validations and normalizations if it has been done
-            # before.
-            return (item,)
-
         cls._validate_expression(item)
         norm_shape_expression = cls._normalize_expression(item)
-        cls._known_expressions.add(norm_shape_expression)
         return (norm_shape_expression,)
 
+    def __getitem__(cls, item: Any) -> type:
+        # No need to do costly validations, normalizations and preparations if
+        # the expression has been seen before, in whatever spelling.
+        if not isinstance(item, str):
+            return super().__getitem__(item)
+        result: Any = cls._type_per_expression.get((cls, item))
+        if result is None:
+            result = super().__getitem__(item)
+            cls._type_per_expression.put((cls, item), result)
+            cls._type_per_expression.put((cls, result.__args__[0]), result)
+        return result  # type: ignore[no-any-return]
+
     def __subclasscheck__(cls, subclass: Any) -> bool:
         type_match = type(subclass) == type(  # pylint: disable=unidiomatic-typecheck
             cls
@@ -236,13 +275,27 @@ class ContainerMeta(
         return f"{cls.__name__}['{cls.__args__[0]}']"
 
     def __eq__(cls, other: Any) -> bool:
-        result = cls is other
-        if not result and hasattr(cls, "__args__") and hasattr(other, "__args__"):
-            normalized_args = tuple(
-                cls._normalize_expression(str(arg)) for arg in other.__args__
-            )
-            result = cls.__args__ == normalized_args
-        return result
+        # Containers are interned by their normalized expressions, so they can
+        # be compared by their arguments without normalizing anything. Other
+        # objects, such as a Literal, are compared by the normalized expression
+        # of their argument, which is cached along with the container.
+        if type(other) is type(cls):  # pylint: disable=unidiomatic-typecheck
+            return cls is other or cls.__args__ == other.__args__
+        if isinstance(other, type):
+            return False
+        args = getattr(other, "__args__", None)
+        if not isinstance(args, tuple) or len(args) != 1:
+            return False
+        return cls.__args__[0] == cls._get_normalized_expression(args[0])
+
+    def _get_normalized_expression(cls, item: Any) -> Optional[str]:
+        # Return the normalized form of the given expression, or None if it is
+        # not a valid expression.
+        base = cls.__bases__[0] if cls._parameterized else cls
+        try:
+            return base[item].__args__[0]  # type: ignore[index, no-any-return]
+        except NPTypingError:
+            return None
 
     def __hash__(cls) -> int:
         return hash(cls.__args__)
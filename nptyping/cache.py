@@ -0,0 +1,201 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+)
+
+from nptyping.error import InvalidArgumentsError
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A thread safe cache that holds at most maxsize items. When full, the least
+    recently used item is evicted. Hits, misses and evictions are counted.
+    Lookups take no lock, so that hits are cheap. The statistics of lookups
+    may therefore be slightly off under concurrent use.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value that is stored with key, or default if there is none.
+        :param key: the key of the value.
+        :param default: the value that is returned upon a miss.
+        :return: the stored value or default.
+        """
+        # Both operations are atomic. If the item is evicted in between by
+        # another thread, it counts as a miss.
+        try:
+            value = self._data[key]
+            self._data.move_to_end(key)
+        except KeyError:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store value with key, evicting the least recently used item if the
+        cache is full.
+        :param key: the key of the value.
+        :param value: the value that is to be stored.
+        :return: None.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of items, evicting items if needed.
+        :param maxsize: the new maximum number of items.
+        :return: None.
+        """
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all items and reset the statistics.
+        :return: None.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the statistics of this cache.
+        :return: a CacheInfo instance.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._data),
+            )
+
+    def _evict(self) -> None:
+        # Remove the least recently used items until the size fits. The lock
+        # must be held by the caller.
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+
+def create_cache(name: str, maxsize: int = 128) -> LRUCache:
+    """
+    Create a new LRUCache that can be configured with configure_cache and
+    that is reported by cache_info.
+    :param name: the name under which the cache is known.
+    :param maxsize: the initial maximum number of items.
+    :return: a new LRUCache.
+    """
+    cache = LRUCache(maxsize)
+    _cache_per_name[name] = cache
+    return cache
+
+
+def configure_cache(
+    expression_maxsize: Optional[int] = None,
+    shape_maxsize: Optional[int] = None,
+    structure_maxsize: Optional[int] = None,
+    dataframe_maxsize: Optional[int] = None,
+    ndarray_maxsize: Optional[int] = None,
+) -> None:
+    """
+    Configure the maximum sizes of the caches that nptyping uses for instance
+    checking. Caches that are not given are left untouched. A maxsize of 0
+    disables a cache.
+    :param expression_maxsize: the maximum number of Shape and Structure
+    types that are cached by their expressions.
+    :param shape_maxsize: the maximum number of cached shape checks.
+    :param structure_maxsize: the maximum number of cached structure checks.
+    :param dataframe_maxsize: the maximum number of cached DataFrame checks.
+    :param ndarray_maxsize: the maximum number of cached NDArray checks of
+    shapes and dtypes.
+    :return: None.
+    """
+    maxsize_per_name = {
+        "expression": expression_maxsize,
+        "shape": shape_maxsize,
+        "structure": structure_maxsize,
+        "dataframe": dataframe_maxsize,
+        "ndarray": ndarray_maxsize,
+    }
+    # All sizes are validated before any cache is changed.
+    for name, maxsize in maxsize_per_name.items():
+        is_size = isinstance(maxsize, int) and not isinstance(maxsize, bool)
+        if maxsize is not None and not (is_size and maxsize >= 0):
+            raise InvalidArgumentsError(
+                f"Unexpected maxsize {maxsize!r} for the {name} cache, expecting"
+                " an int of 0 or more."
+            )
+    for name, maxsize in maxsize_per_name.items():
+        if maxsize is not None:
+            _cache_per_name[name].resize(maxsize)
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """
+    Return the statistics of all caches that nptyping uses for instance
+    checking.
+    :return: a dict with a CacheInfo per cache name.
+    """
+    return {name: cache.info() for name, cache in _cache_per_name.items()}
+
+
+_cache_per_name: Dict[str, LRUCache] = {}
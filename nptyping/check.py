@@ -0,0 +1,189 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import inspect
+import sys
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from nptyping.checking import should_check
+from nptyping.error import InvalidInstanceError
+from nptyping.explain import explain
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.pandas_.dataframe import DataFrameMeta  # type: ignore[attr-defined]
+from nptyping.shape_expression import bind_shape_variables
+from nptyping.value_constraints import ValueConstraint
+
+if sys.version_info >= (3, 9):
+    from typing import get_type_hints
+else:  # pragma: no cover
+    from typing_extensions import get_type_hints
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_Validator = Callable[[Any, Dict[str, int]], None]
+
+
+def check(func: _F) -> _F:
+    """
+    A decorator that checks the arguments and the return value of func
+    against their nptyping type hints on every call. The hints are inspected
+    only once. Shape variables are shared within a call: a variable must have
+    the same size in all arguments and in the return value. The checking mode
+    (see set_checking) is consulted once per call. The return value of a
+    coroutine function is checked once it is awaited.
+    :param func: the function that is to be checked.
+    :return: a wrapper around func that checks its arguments and return value.
+    """
+    signature = inspect.signature(func)
+    hints = get_type_hints(func, include_extras=True)
+    positional: List[Tuple[int, str, _Validator]] = []
+    keyword: List[Tuple[str, _Validator]] = []
+    var_positional: Optional[Tuple[int, _Validator]] = None
+    var_keyword: Optional[_Validator] = None
+    for index, (name, parameter) in enumerate(signature.parameters.items()):
+        validator = _create_validator(
+            f"Argument '{name}' of {func.__qualname__}", hints.get(name)
+        )
+        if validator is None:
+            continue
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            var_positional = (index, validator)
+        elif parameter.kind == parameter.VAR_KEYWORD:
+            var_keyword = validator
+        elif parameter.kind == parameter.KEYWORD_ONLY:
+            keyword.append((name, validator))
+        else:
+            positional.append((index, name, validator))
+            if parameter.kind == parameter.POSITIONAL_OR_KEYWORD:
+                keyword.append((name, validator))
+    named = set(signature.parameters)
+    return_validator = _create_validator(
+        f"The return value of {func.__qualname__}", hints.get("return")
+    )
+
+    def _check_arguments(
+        args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Dict[str, int]:
+        # Check the arguments and return the shape variables that they bound.
+        variables: Dict[str, int] = {}
+        for index, _, validator in positional:
+            if index < len(args):
+                validator(args[index], variables)
+        for name, validator in keyword:
+            if name in kwargs:
+                validator(kwargs[name], variables)
+        if var_positional:
+            index, validator = var_positional
+            for arg in args[index:]:
+                validator(arg, variables)
+        if var_keyword:
+            for name, value in kwargs.items():
+                if name not in named:
+                    var_keyword(value, variables)
+        return variables
+
+    return _create_wrapper(func, _check_arguments, return_validator)
+
+
+def _create_wrapper(
+    func: _F,
+    check_arguments: Callable[[Tuple[Any, ...], Dict[str, Any]], Dict[str, int]],
+    return_validator: Optional[_Validator],
+) -> _F:
+    # Return a wrapper around func that checks its arguments and its return
+    # value. The return value of a coroutine function is checked once awaited.
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not should_check():
+                return await func(*args, **kwargs)
+            variables = check_arguments(args, kwargs)
+            result = await func(*args, **kwargs)
+            if return_validator:
+                return_validator(result, variables)
+            return result
+
+        return cast(_F, _async_wrapper)
+
+    @wraps(func)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not should_check():
+            return func(*args, **kwargs)
+        variables = check_arguments(args, kwargs)
+        result = func(*args, **kwargs)
+        if return_validator:
+            return_validator(result, variables)
+        return result
+
+    return cast(_F, _wrapper)
+
+
+def _resolve_annotated(hint: Any) -> Any:
+    # Return the type of an Annotated hint, with the value constraints in its
+    # metadata added if it is an NDArray. Other hints are returned as is.
+    metadata = getattr(hint, "__metadata__", None)
+    if metadata is None:
+        return hint
+    origin = hint.__origin__
+    constraints = [value for value in metadata if isinstance(value, ValueConstraint)]
+    if not constraints or not isinstance(origin, NDArrayMeta):
+        return origin
+    # pylint: disable=protected-access
+    base = origin.__bases__[0] if origin._parameterized else origin
+    return base[(*origin.__args__, *constraints)]
+
+
+def _create_validator(subject: str, hint: Any) -> Optional[_Validator]:
+    # Return a function that validates a value against hint, or None if hint
+    # is not an nptyping type that can be checked.
+    hint = _resolve_annotated(hint)
+    if not isinstance(hint, (NDArrayMeta, DataFrameMeta)):
+        return None
+
+    # Only shapes with variables need binding, the rest is up to isinstance.
+    shape = hint.__args__[0] if isinstance(hint, NDArrayMeta) else Any
+    matcher = None if shape is Any or not shape.matcher.variables else shape.matcher
+
+    def _validator(value: Any, variables: Dict[str, int]) -> None:
+        # The checking mode has already been consulted for this call.
+        if not hint._check_instance(value):  # pylint: disable=protected-access
+            raise InvalidInstanceError(
+                f"{subject} is not an instance of {hint}: {explain(value, hint)}."
+            )
+        if matcher and not bind_shape_variables(value.shape, matcher, variables):
+            raise InvalidInstanceError(
+                f"{subject} has shape {value.shape}, which does not correspond to"
+                f" {shape} with the variables {variables} of the same call."
+            )
+
+    return _validator
@@ -0,0 +1,65 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Type,
+)
+
+import numpy as np
+
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+
+
+def check_all(instances: Iterable[Any], cls: Type[Any]) -> List[bool]:
+    """
+    Check all given instances against cls and return a list with the outcome
+    for each instance. When cls is an NDArray (or RecArray), arrays that share
+    their type, shape and dtype are checked only once, unless cls has value
+    constraints.
+    :param instances: the instances that are to be checked.
+    :param cls: the type against which the instances are checked.
+    :return: a list of booleans, True for every instance of cls.
+    """
+    has_constraints = isinstance(cls, NDArrayMeta) and len(cls.__args__) > 2
+    if not isinstance(cls, NDArrayMeta) or has_constraints:
+        # The verdict on values cannot be shared among arrays.
+        return [isinstance(instance, cls) for instance in instances]
+
+    result = []
+    verdict_per_key: Dict[Hashable, bool] = {}
+    for instance in instances:
+        if not isinstance(instance, np.ndarray):
+            result.append(False)
+            continue
+        key = (type(instance), instance.shape, instance.dtype)
+        verdict = verdict_per_key.get(key)
+        if verdict is None:
+            verdict = isinstance(instance, cls)
+            verdict_per_key[key] = verdict
+        result.append(verdict)
+    return result
@@ -0,0 +1,60 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from typing import Any, Type
+
+from nptyping.error import InvalidArgumentsError
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.parallel import check_values_in_parallel
+from nptyping.value_constraints import DEFAULT_BLOCK_SIZE
+
+
+def check_contents(
+    instance: Any, cls: Type[Any], block_size: int = DEFAULT_BLOCK_SIZE
+) -> bool:
+    """
+    Check instance against cls, including the value constraints of cls, with a
+    memory use that is bounded by block_size rather than the size of instance.
+    The values are checked in blocks along the first axis, that share one
+    scratch buffer, until the first block that violates a constraint. Pages of
+    a read-only np.memmap are released once their block has been checked.
+    Large arrays are checked by multiple threads, see configure_parallelism.
+    The instance is checked fully, regardless of the checking mode.
+    :param instance: the array that is checked against cls.
+    :param cls: an NDArray type, possibly with value constraints.
+    :param block_size: the (approximate) number of values per block.
+    :return: True if instance is an instance of cls.
+    """
+    if not isinstance(cls, NDArrayMeta):
+        raise InvalidArgumentsError(
+            f"Unexpected argument {cls}, expecting an NDArray or a RecArray."
+        )
+    if block_size < 1:
+        raise InvalidArgumentsError(
+            f"Unexpected block_size {block_size}, expecting an int of 1 or more."
+        )
+    layout_is_ok = cls._layout_check(instance)  # pylint: disable=protected-access
+    constraints = cls.__args__[2:]
+    return layout_is_ok and check_values_in_parallel(
+        instance, constraints, block_size, release_pages=True
+    )
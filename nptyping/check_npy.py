@@ -0,0 +1,128 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from os import PathLike
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    NamedTuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from nptyping.error import InvalidArgumentsError
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.recarray import RecArrayMeta  # type: ignore[attr-defined]
+from nptyping.typing_ import ShapeTuple
+
+
+class NpyCheck(NamedTuple):
+    """
+    The outcome of checking a .npy file by its header. It is truthy if the
+    array in the file is an instance of the type. The array data starts at
+    offset, so it can be memory-mapped with np.memmap without loading it.
+    """
+
+    is_instance: bool
+    shape: ShapeTuple
+    dtype: np.dtype  # type: ignore[type-arg]
+    fortran_order: bool
+    offset: int
+
+    def __bool__(self) -> bool:
+        return self.is_instance
+
+
+def check_npy(file: Union[str, "PathLike[str]", BinaryIO], cls: Type[Any]) -> NpyCheck:
+    """
+    Check whether the array in the given .npy file is an instance of cls,
+    reading only the header of the file. The shape and dtype are checked the
+    same as with isinstance, regardless of the checking mode. Value
+    constraints cannot be checked without reading the data, so cls cannot
+    have any.
+    :param file: the path of a .npy file, or a binary file object that is
+    positioned at the start of a .npy file.
+    :param cls: the NDArray against which the array in the file is checked.
+    :return: an NpyCheck that is truthy if the array is an instance of cls.
+    """
+    validate_npy_type(cls)
+    if isinstance(file, (str, PathLike)):
+        with open(file, "rb") as fileobj:
+            return read_npy_check(fileobj, cls)
+    return read_npy_check(file, cls)
+
+
+def validate_npy_type(cls: Type[Any]) -> None:
+    """
+    Raise an InvalidArgumentsError if cls cannot be checked by the header of a
+    .npy file.
+    :param cls: the type that is to be validated.
+    :return: None.
+    """
+    if not isinstance(cls, NDArrayMeta):
+        raise InvalidArgumentsError(
+            f"Unexpected argument {cls}, expecting an NDArray or a RecArray."
+        )
+    if len(cls.__args__) > 2:
+        raise InvalidArgumentsError(
+            f"Unexpected argument {cls}, value constraints cannot be checked"
+            " from the header of a .npy file."
+        )
+
+
+def read_npy_check(fileobj: IO[bytes], cls: Type[Any]) -> NpyCheck:
+    """
+    Read the header of the .npy file at the current position of fileobj and
+    check it against cls, which is expected to be valid. Afterwards, fileobj
+    is positioned at the start of the array data.
+    :param fileobj: a binary file object that is positioned at the start of a
+    .npy file.
+    :param cls: the NDArray against which the array in the file is checked.
+    :return: an NpyCheck that is truthy if the array is an instance of cls.
+    """
+    # pylint: disable=protected-access
+    version = npy_format.read_magic(fileobj)  # type: ignore[no-untyped-call]
+    if version == (1, 0):
+        header = npy_format.read_array_header_1_0(  # type: ignore[no-untyped-call]
+            fileobj
+        )
+    elif version == (2, 0):
+        header = npy_format.read_array_header_2_0(  # type: ignore[no-untyped-call]
+            fileobj
+        )
+    else:
+        # Version 3.0 has no public reader. It only differs from 2.0 in that
+        # the header is encoded in utf8 rather than latin1.
+        header = npy_format._read_array_header(  # type: ignore[attr-defined]
+            fileobj, version
+        )
+    shape, fortran_order, dtype = header
+    # A .npy file is loaded as a plain array, never as a recarray.
+    is_instance = not isinstance(cls, RecArrayMeta) and cls._shape_and_dtype_check(
+        shape, dtype
+    )
+    return NpyCheck(is_instance, shape, dtype, fortran_order, fileobj.tell())
@@ -0,0 +1,92 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from os import PathLike
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Type,
+    Union,
+)
+
+from nptyping.check_npy import (
+    NpyCheck,
+    read_npy_check,
+    validate_npy_type,
+)
+
+
+class NpzCheck(NamedTuple):
+    """
+    The outcome of checking a .npz archive by the headers of its members. It
+    is truthy if no members are missing or extra and all members are
+    instances of their types. The checks hold an NpyCheck per member that is
+    both expected and present.
+    """
+
+    missing: List[str]
+    extra: List[str]
+    failed: List[str]
+    checks: Dict[str, NpyCheck]
+
+    def __bool__(self) -> bool:
+        return not (self.missing or self.extra or self.failed)
+
+
+def check_npz(
+    file: Union[str, "PathLike[str]", BinaryIO], schema: Mapping[str, Type[Any]]
+) -> NpzCheck:
+    """
+    Check the members of the given .npz archive against schema, reading only
+    the header of every member. The data of a member is not decompressed,
+    apart from the chunk that holds its header. The names in schema are those
+    under which np.load gives the arrays, i.e. without ".npy".
+    :param file: the path of a .npz archive, or a binary file object of one.
+    :param schema: the NDArray per member name against which the members are
+    checked. These cannot have value constraints.
+    :return: an NpzCheck that is truthy if the archive corresponds to schema.
+    """
+    # The zipfile module is imported here to keep it from slowing down the
+    # import of nptyping.
+    from zipfile import ZipFile  # pylint: disable=import-outside-toplevel
+
+    for cls in schema.values():
+        validate_npy_type(cls)
+    with ZipFile(file) as archive:
+        member_per_name = {
+            member[: -len(".npy")] if member.endswith(".npy") else member: member
+            for member in archive.namelist()
+        }
+        checks = {}
+        for name, cls in schema.items():
+            if name in member_per_name:
+                with archive.open(member_per_name[name]) as fileobj:
+                    checks[name] = read_npy_check(fileobj, cls)
+    missing = [name for name in schema if name not in member_per_name]
+    extra = [name for name in member_per_name if name not in schema]
+    failed = [name for name, npy_check in checks.items() if not npy_check]
+    return NpzCheck(missing, extra, failed, checks)
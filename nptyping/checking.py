@@ -0,0 +1,111 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from random import random
+from typing import (
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from nptyping.error import InvalidArgumentsError
+
+try:
+    from typing import Literal  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+    from typing_extensions import Literal  # type: ignore[attr-defined,misc,assignment]
+
+CheckingMode = Literal["on", "off", "sample"]
+
+
+def set_checking(mode: CheckingMode, rate: float = 1.0) -> None:
+    """
+    Set how nptyping types check instances for the whole process. With "on",
+    instances are fully checked. With "off", an instance check of an NDArray
+    reduces to isinstance(instance, numpy.ndarray) (and likewise for RecArray
+    and DataFrame). With "sample", instances are fully checked with a
+    probability of rate.
+    :param mode: "on", "off" or "sample".
+    :param rate: the fraction of checks that is done fully with "sample".
+    :return: None.
+    """
+    global _process_mode, _is_always_on  # pylint: disable=global-statement
+    _process_mode = _create_mode(mode, rate)
+    _is_always_on = _process_mode[0] == "on" and not _is_context_used
+
+
+@contextmanager
+def checking(mode: CheckingMode, rate: float = 1.0) -> Iterator[None]:
+    """
+    A context manager that sets how nptyping types check instances within its
+    scope. The setting is kept in a context variable, so it applies to the
+    current thread or asyncio task only. See set_checking for the modes.
+    :param mode: "on", "off" or "sample".
+    :param rate: the fraction of checks that is done fully with "sample".
+    :return: a context manager.
+    """
+    global _is_context_used, _is_always_on  # pylint: disable=global-statement
+    token = _context_mode.set(_create_mode(mode, rate))
+    _is_context_used, _is_always_on = True, False
+    try:
+        yield
+    finally:
+        _context_mode.reset(token)
+
+
+def should_check() -> bool:
+    """
+    Return whether an instance check should be done fully, according to the
+    current mode.
+    :return: True if a full check should be done.
+    """
+    if _is_always_on:
+        return True
+    mode, rate = _context_mode.get() or _process_mode
+    return mode == "on" or (mode == "sample" and random() < rate)
+
+
+def _create_mode(mode: str, rate: float) -> Tuple[str, float]:
+    # Validate the given mode and rate and return them as a tuple.
+    if mode not in ("on", "off", "sample"):
+        raise InvalidArgumentsError(
+            f"Unexpected checking mode '{mode}', expecting 'on', 'off' or 'sample'."
+        )
+    if not 0.0 <= rate <= 1.0:
+        raise InvalidArgumentsError(
+            f"Unexpected rate {rate}, expecting a number between 0 and 1."
+        )
+    return mode, rate
+
+
+_process_mode = ("on", 1.0)  # type: Tuple[str, float]
+# Whether checking is on without consulting the modes. A context mode can
+# outlive its context manager in a copied context (e.g. of an asyncio task),
+# so once a context mode was set, the modes are always consulted.
+_is_context_used = False
+_is_always_on = True
+_context_mode: ContextVar[Optional[Tuple[str, float]]] = ContextVar(
+    "nptyping_checking_mode", default=None
+)
@@ -43,5 +43,9 @@ class InvalidDTypeError(NPTypingError):
     """Raised when an argument is not a DType."""
 
 
+class InvalidInstanceError(NPTypingError):
+    """Raised when a value does not correspond to its nptyping type hint."""
+
+
 class DependencyError(NPTypingError):
     """Raised when a dependency has not been installed."""
@@ -0,0 +1,180 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+
+from nptyping.ndarray import NDArrayMeta  # type: ignore[attr-defined]
+from nptyping.pandas_.dataframe import DataFrameMeta  # type: ignore[attr-defined]
+from nptyping.pandas_.typing_ import dtype_per_name as pandas_dtype_per_name
+from nptyping.recarray import RecArrayMeta  # type: ignore[attr-defined]
+from nptyping.shape_expression import explain_shape
+from nptyping.structure import Structure
+from nptyping.structure_expression import explain_structure
+from nptyping.typing_ import dtype_per_name, name_per_dtype
+from nptyping.value_constraints import (
+    DEFAULT_BLOCK_SIZE,
+    ValueConstraint,
+    can_check_values,
+    check_values,
+    iterate_blocks,
+)
+
+
+class Mismatch(NamedTuple):
+    """
+    A report on why an instance does not correspond to a type. The kind is
+    one of "type", "shape", "dtype", "structure" and "values". The other
+    attributes are set only if they apply to the kind.
+    """
+
+    cls: Any
+    kind: str
+    message: str
+    dimension: Optional[int] = None
+    variables: Optional[Dict[str, int]] = None
+    field: Optional[str] = None
+    constraint: Optional[ValueConstraint] = None
+    rows: Optional[Tuple[int, int]] = None
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def explain(instance: Any, cls: Type[Any]) -> Optional[Mismatch]:
+    """
+    Explain why instance is not an instance of cls. The instance is checked
+    fully, regardless of the checking mode, and the report is only created if
+    the check fails.
+    :param instance: the instance that is checked against cls.
+    :param cls: the type against which instance is checked.
+    :return: None if instance is an instance of cls, otherwise a Mismatch.
+    """
+    # pylint: disable=protected-access
+    if isinstance(cls, NDArrayMeta):
+        return None if cls._check_instance(instance) else _explain_array(instance, cls)
+    if isinstance(cls, DataFrameMeta):
+        if cls._check_instance(instance):
+            return None
+        return _explain_dataframe(instance, cls)
+    if isinstance(instance, cls):
+        return None
+    return _type_mismatch(instance, cls, cls)
+
+
+def describe(value: Any) -> str:
+    """
+    Return a short description of the given value that is cheap to create,
+    also for large arrays and data frames.
+    :param value: the value that is to be described.
+    :return: a description with the type and (if any) the shape and dtype.
+    """
+    attributes = ", ".join(
+        f"{attribute}={getattr(value, attribute)}"
+        for attribute in ("shape", "dtype")
+        if hasattr(value, attribute)
+    )
+    name = type(value).__name__
+    return f"{name}({attributes})" if attributes else name
+
+
+def _explain_array(instance: Any, cls: NDArrayMeta) -> Optional[Mismatch]:
+    shape, dtype, constraints = cls.__args__[0], cls.__args__[1], cls.__args__[2:]
+    expected_type: Any = np.recarray if isinstance(cls, RecArrayMeta) else np.ndarray
+    if not isinstance(instance, expected_type):
+        return _type_mismatch(instance, cls, expected_type)
+
+    if shape is not Any:
+        shape_explanation = explain_shape(instance.shape, shape.matcher)
+        if shape_explanation:
+            dimension, message, variables = shape_explanation
+            return Mismatch(cls, "shape", message, dimension, variables)
+
+    if dtype is not Any and issubclass(dtype, Structure):
+        structure_explanation = explain_structure(
+            instance.dtype, dtype, dtype_per_name  # type: ignore[arg-type]
+        )
+        if structure_explanation:
+            field, message = structure_explanation
+            return Mismatch(cls, "structure", message, field=field)
+    elif dtype is not Any and not issubclass(instance.dtype.type, dtype):
+        message = f"dtype {instance.dtype} is not a {name_per_dtype[dtype]}"
+        return Mismatch(cls, "dtype", message)
+
+    return _explain_values(instance, cls, constraints)
+
+
+def _explain_values(
+    instance: Any, cls: NDArrayMeta, constraints: Tuple[ValueConstraint, ...]
+) -> Optional[Mismatch]:
+    # Without constraints, the instance can only have changed since its check.
+    if not constraints:
+        return None
+    if not can_check_values(instance.dtype):
+        message = f"values of dtype {instance.dtype} cannot be checked"
+        return Mismatch(cls, "values", message, constraint=constraints[0])
+    for constraint in constraints:
+        start = 0
+        for block in iterate_blocks(instance, DEFAULT_BLOCK_SIZE):
+            end = start + (len(block) if block.ndim else 1)
+            if not check_values(block, [constraint]):
+                message = f"values in rows {start} to {end} violate {constraint}"
+                return Mismatch(
+                    cls, "values", message, constraint=constraint, rows=(start, end)
+                )
+            start = end
+    # The values changed in the meantime.
+    return _type_mismatch(instance, cls, cls)  # pragma: no cover
+
+
+def _explain_dataframe(instance: Any, cls: DataFrameMeta) -> Mismatch:
+    expected_type = cls._get_pandas().DataFrame  # pylint: disable=protected-access
+    if not isinstance(instance, expected_type):
+        return _type_mismatch(instance, cls, expected_type)
+    structured_dtype = np.dtype(
+        [(column, dtype.str) for column, dtype in instance.dtypes.items()]
+    )
+    structure_explanation = explain_structure(
+        structured_dtype,
+        cls.__args__[0],
+        pandas_dtype_per_name,  # type: ignore[arg-type]
+    )
+    if not structure_explanation:
+        # The data frame changed in the meantime.
+        return _type_mismatch(instance, cls, cls)  # pragma: no cover
+    field, message = structure_explanation
+    return Mismatch(cls, "structure", message, field=field)
+
+
+def _type_mismatch(instance: Any, cls: Any, expected_type: Any) -> Mismatch:
+    name = getattr(expected_type, "__name__", expected_type)
+    message = f"expected an instance of {name}, got {describe(instance)}"
+    return Mismatch(cls, "type", message)
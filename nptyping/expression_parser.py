@@ -0,0 +1,129 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import re
+from typing import List, Tuple
+
+# A token consists of the whitespace that precedes it and its text, which is
+# either a word, an ellipsis or any other single character. The text of the
+# last token is always empty, marking the end of the expression.
+Token = Tuple[str, str]
+
+
+class UnexpectedTokenError(Exception):
+    """
+    Raised by TokenReader when an expression is not as expected. It is meant
+    to be turned into a more meaningful error by the parser that uses it.
+    """
+
+
+def tokenize(expression: str) -> List[Token]:
+    """
+    Split the given expression into tokens in a single pass.
+    :param expression: the expression that is to be split.
+    :return: a list of tokens, of which the last one marks the end.
+    """
+    # Without trailing whitespace, every attempt to match a token succeeds,
+    # which keeps tokenizing linear.
+    stripped_expression = expression.rstrip()
+    tokens: List[Token] = _REGEX_TOKEN.findall(stripped_expression)
+    tokens.append((expression[len(stripped_expression) :], ""))
+    return tokens
+
+
+class TokenReader:
+    """
+    Reads the tokens of an expression from left to right for recursive
+    descent parsers.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self._tokens = tokenize(expression)
+        self._index = 0
+
+    def peek(self) -> str:
+        """
+        Return the text of the next token without consuming it.
+        :return: the text of the next token or "" at the end.
+        """
+        return self._tokens[self._index][1]
+
+    def follows_whitespace(self) -> bool:
+        """
+        Return whether the next token is preceded by whitespace.
+        :return: True if there is whitespace before the next token.
+        """
+        return bool(self._tokens[self._index][0])
+
+    def next(self) -> str:
+        """
+        Consume the next token and return its text. The end is never consumed.
+        :return: the text of the next token or "" at the end.
+        """
+        text = self._tokens[self._index][1]
+        if text:
+            self._index += 1
+        return text
+
+    def accept(self, text: str) -> bool:
+        """
+        Consume the next token if it has the given text.
+        :param text: the text of the token that is accepted.
+        :return: True if the next token was consumed.
+        """
+        if self._tokens[self._index][1] != text:
+            return False
+        self._index += 1
+        return True
+
+    def expect(self, text: str) -> None:
+        """
+        Consume the next token, which must have the given text. Use "" to
+        expect the end of the expression.
+        :param text: the text of the token that is expected.
+        :return: None.
+        """
+        if self._tokens[self._index][1] != text:
+            raise UnexpectedTokenError(self.peek())
+        if text:
+            self._index += 1
+
+    def read_until(self, text: str) -> str:
+        """
+        Consume all tokens up to (not including) the first token with the
+        given text or the end and return them as they were in the expression.
+        :param text: the text of the token that stops reading.
+        :return: the part of the expression that was read.
+        """
+        start = self._index
+        while self.peek() not in (text, ""):
+            self._index += 1
+        parts = [
+            f"{whitespace}{text}"
+            for whitespace, text in self._tokens[start : self._index]
+        ]
+        parts.append(self._tokens[self._index][0])
+        return "".join(parts)
+
+
+_REGEX_TOKEN = re.compile(r"(\s*)(\w+|\.\.\.|\S)")
@@ -23,7 +23,13 @@ SOFTWARE.
 """
 import inspect
 from abc import ABC
-from typing import Any, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
 
@@ -35,17 +41,21 @@ from nptyping.base_meta_classes import (
     PrintableMeta,
     SubscriptableMeta,
 )
+from nptyping.cache import create_cache
+from nptyping.checking import should_check
 from nptyping.error import InvalidArgumentsError
 from nptyping.nptyping_type import NPTypingType
 from nptyping.shape import Shape
-from nptyping.shape_expression import check_shape
+from nptyping.shape_expression import create_shape_check
 from nptyping.structure import Structure
 from nptyping.structure_expression import check_structure, check_type_names
 from nptyping.typing_ import (
     DType,
+    ShapeTuple,
     dtype_per_name,
     name_per_dtype,
 )
+from nptyping.value_constraints import ValueConstraint, check_values
 
 
 class NDArrayMeta(
@@ -62,41 +72,51 @@ class NDArrayMeta(
     such as instance checking.
     """
 
-    __args__: Tuple[Shape, DType]
+    __args__: Tuple[Any, ...]  # Shape, DType and any ValueConstraints.
     _parameterized: bool
+    # The type that instances must have.
+    _array_type: type = np.ndarray
+    # Check the shape and dtype of an array, the type, shape and dtype of an
+    # instance and an instance including its values respectively.
+    _shape_and_dtype_check: Callable[[ShapeTuple, np.dtype], bool]
+    _layout_check: Callable[[Any], bool]
+    _instance_check: Callable[[Any], bool]
 
     @property
     def __module__(cls) -> str:
-        return cls._get_module(inspect.stack(), "nptyping.ndarray")
+        return cls._get_module(inspect.currentframe(), "nptyping.ndarray")
 
     def _get_item(cls, item: Any) -> Tuple[Any, ...]:
         cls._check_item(item)
         shape, dtype = cls._get_from_tuple(item)
-        return shape, dtype
+        constraints = cls._get_constraints(item[2:], dtype)
+        return (shape, dtype, *constraints)
+
+    def _create_type(
+        cls, args: Tuple[Any, ...], additional_values: Dict[str, Any]
+    ) -> type:
+        # Every type gets checks that are specialized for its arguments.
+        return super()._create_type(
+            args, {**additional_values, **_create_checks(cls._array_type, args)}
+        )
 
     def __instancecheck__(  # pylint: disable=bad-mcs-method-argument
         self, instance: Any
     ) -> bool:
-        shape, dtype = self.__args__
-        dtype_is_structure = issubclass(dtype, Structure)
-        structure_is_ok = dtype_is_structure and check_structure(
-            instance.dtype, dtype, dtype_per_name
-        )
-        return (
-            isinstance(instance, np.ndarray)
-            and (shape is Any or check_shape(instance.shape, shape))
-            and (
-                dtype is Any
-                or structure_is_ok
-                or issubclass(instance.dtype.type, dtype)
-            )
-        )
+        if not should_check():
+            return isinstance(instance, self._array_type)
+        return self._instance_check(instance)
+
+    def _check_instance(cls, instance: Any) -> bool:
+        # Check the instance fully, regardless of the checking mode.
+        return cls._instance_check(instance)
 
     def __str__(cls) -> str:
-        shape, dtype = cls.__args__
+        shape, dtype, *constraints = cls.__args__
+        constraints_str = "".join(f", {constraint}" for constraint in constraints)
         return (
             f"{cls.__name__}[{cls._shape_expression_to_str(shape)}, "
-            f"{cls._dtype_to_str(dtype)}]"
+            f"{cls._dtype_to_str(dtype)}{constraints_str}]"
         )
 
     def _is_literal_like(cls, item: Any) -> bool:
@@ -107,8 +127,9 @@ class NDArrayMeta(
         # Check if the item is what we expect and raise if it is not.
         if not isinstance(item, tuple):
             raise InvalidArgumentsError(f"Unexpected argument of type {type(item)}.")
-        if len(item) > 2:
-            raise InvalidArgumentsError(f"Unexpected argument {item[2]}.")
+        for argument in item[2:]:
+            if not isinstance(argument, ValueConstraint):
+                raise InvalidArgumentsError(f"Unexpected argument {argument}.")
 
     def _get_from_tuple(cls, item: Tuple[Any, ...]) -> Tuple[Shape, DType]:
         # Return the Shape Expression and DType from a tuple.
@@ -116,6 +137,16 @@ class NDArrayMeta(
         dtype = cls._get_dtype(item[1])
         return shape, dtype
 
+    def _get_constraints(
+        cls, constraints: Tuple[ValueConstraint, ...], dtype: DType
+    ) -> Tuple[ValueConstraint, ...]:
+        # Return the value constraints without duplicates.
+        if constraints and dtype is not Any and issubclass(dtype, Structure):
+            raise InvalidArgumentsError(
+                "Value constraints cannot be combined with a Structure."
+            )
+        return tuple(dict.fromkeys(constraints))
+
     def _get_shape(cls, dtype_candidate: Any) -> Shape:
         if dtype_candidate is Any or dtype_candidate is Shape:
             shape = Any
@@ -171,6 +202,106 @@ class NDArrayMeta(
         return "Any" if shape_expression is Any else str(shape_expression)
 
 
+def _accept(_: Any) -> bool:
+    # A check for the parts of a type that are Any.
+    return True
+
+
+def _create_checks(array_type: type, args: Tuple[Any, ...]) -> Dict[str, Any]:
+    # Create the checks of a type with the given arguments. The verdicts of
+    # structure checks are worth caching, other checks are cheaper than a
+    # lookup.
+    shape, dtype, *constraints = args
+    shape_check = _accept if shape is Any else create_shape_check(shape)
+    dtype_check = _accept if dtype is Any else _create_dtype_check(dtype)
+    is_cached = dtype is not Any and issubclass(dtype, Structure)
+    shape_and_dtype_check = _create_shape_and_dtype_check(
+        shape_check, dtype_check, is_cached
+    )
+    if is_cached:
+        layout_check = _create_cached_layout_check(array_type, shape_and_dtype_check)
+    else:
+        layout_check = _create_layout_check(array_type, shape_check, dtype_check)
+    return {
+        "_shape_and_dtype_check": shape_and_dtype_check,
+        "_layout_check": layout_check,
+        "_instance_check": _create_instance_check(layout_check, tuple(constraints)),
+    }
+
+
+def _create_layout_check(
+    array_type: type,
+    shape_check: Callable[[ShapeTuple], bool],
+    dtype_check: Callable[[np.dtype], bool],
+) -> Callable[[Any], bool]:
+    # Create a function that checks the type, shape and dtype of an instance.
+    if shape_check is _accept and dtype_check is _accept:
+        return lambda instance: isinstance(instance, array_type)
+    if dtype_check is _accept:
+        return lambda instance: isinstance(instance, array_type) and shape_check(
+            instance.shape
+        )
+    if shape_check is _accept:
+        return lambda instance: isinstance(instance, array_type) and dtype_check(
+            instance.dtype
+        )
+    return (
+        lambda instance: isinstance(instance, array_type)
+        and shape_check(instance.shape)
+        and dtype_check(instance.dtype)
+    )
+
+
+def _create_cached_layout_check(
+    array_type: type, shape_and_dtype_check: Callable[[ShapeTuple, np.dtype], bool]
+) -> Callable[[Any], bool]:
+    # Create a function that checks the type, shape and dtype of an instance
+    # with a check of the shape and dtype that caches its verdicts.
+    return lambda instance: isinstance(instance, array_type) and shape_and_dtype_check(
+        instance.shape, instance.dtype
+    )
+
+
+def _create_shape_and_dtype_check(
+    shape_check: Callable[[ShapeTuple], bool],
+    dtype_check: Callable[[np.dtype], bool],
+    is_cached: bool,
+) -> Callable[[ShapeTuple, np.dtype], bool]:
+    # Create a function that checks the shape and dtype of an array, which
+    # need not be loaded. The verdict depends on nothing but those, so it can
+    # be cached by them.
+    if not is_cached:
+        return lambda shape, dtype: shape_check(shape) and dtype_check(dtype)
+
+    def _check(shape: ShapeTuple, dtype: np.dtype) -> bool:
+        key = (_check, shape, dtype)
+        result: Optional[bool] = _layout_cache.get(key)
+        if result is None:
+            result = shape_check(shape) and dtype_check(dtype)
+            _layout_cache.put(key, result)
+        return result
+
+    return _check
+
+
+def _create_instance_check(
+    layout_check: Callable[[Any], bool], constraints: Tuple[ValueConstraint, ...]
+) -> Callable[[Any], bool]:
+    # Create a function that checks an instance including its values.
+    if not constraints:
+        return layout_check
+    return lambda instance: layout_check(instance) and check_values(
+        instance, constraints
+    )
+
+
+def _create_dtype_check(dtype: DType) -> Callable[[np.dtype], bool]:
+    # Create a function that checks whether a dtype corresponds to dtype.
+    if issubclass(dtype, Structure):
+        return lambda dtype_: check_structure(dtype_, dtype, dtype_per_name)
+    return lambda dtype_: issubclass(dtype_.type, dtype)
+
+
 class NDArray(NPTypingType, ABC, metaclass=NDArrayMeta):
     """
     An nptyping equivalent of numpy ndarray.
@@ -194,3 +325,9 @@ class NDArray(NPTypingType, ABC, metaclass=NDArrayMeta):
     """
 
     __args__ = (Any, Any)
+    _shape_and_dtype_check = _create_shape_and_dtype_check(_accept, _accept, False)
+    _layout_check = _create_layout_check(np.ndarray, _accept, _accept)
+    _instance_check = _layout_check
+
+
+_layout_cache = create_cache("ndarray", maxsize=1024)
@@ -23,11 +23,14 @@ SOFTWARE.
 """
 import inspect
 from abc import ABC
-from typing import Any, Tuple
+from typing import (
+    Any,
+    Optional,
+    Tuple,
+)
 
 import numpy as np
 
-from nptyping import InvalidArgumentsError
 from nptyping.base_meta_classes import (
     FinalMeta,
     ImmutableMeta,
@@ -36,16 +39,17 @@ from nptyping.base_meta_classes import (
     PrintableMeta,
     SubscriptableMeta,
 )
-from nptyping.error import DependencyError
+from nptyping.cache import create_cache
+from nptyping.checking import should_check
+from nptyping.error import DependencyError, InvalidArgumentsError
 from nptyping.nptyping_type import NPTypingType
 from nptyping.pandas_.typing_ import dtype_per_name
 from nptyping.structure import Structure
 from nptyping.structure_expression import check_structure
 
-try:
-    import pandas as pd
-except ImportError:  # pragma: no cover
-    pd = None  # type: ignore[misc, assignment]
+# Pandas is imported upon the first instance check, as importing it is slow.
+_pandas: Any = None
+_dataframe_cache = create_cache("dataframe")
 
 
 class DataFrameMeta(
@@ -68,24 +72,45 @@ class DataFrameMeta(
     def __instancecheck__(  # pylint: disable=bad-mcs-method-argument
         self, instance: Any
     ) -> bool:
-        structure = self.__args__[0]
+        if not should_check():
+            return isinstance(instance, self._get_pandas().DataFrame)
+        return self._check_instance(instance)
 
-        if pd is None:
-            raise DependencyError(  # pragma: no cover
-                "Pandas needs to be installed for instance checking. Use `pip "
-                "install nptyping[pandas]` or `pip install nptyping[complete]`"
-            )
+    def _check_instance(cls, instance: Any) -> bool:
+        # Check the instance fully, regardless of the checking mode.
+        structure = cls.__args__[0]
 
-        if not isinstance(instance, pd.DataFrame):
+        if not isinstance(instance, cls._get_pandas().DataFrame):
             return False
 
         if structure is Any:
             return True
 
-        structured_dtype = np.dtype(
-            [(column, dtype.str) for column, dtype in instance.dtypes.items()]
-        )
-        return check_structure(structured_dtype, structure, dtype_per_name)
+        # Data frames with the same columns and dtypes share their verdict.
+        column_dtypes = tuple(instance.dtypes.items())
+        key = (structure, column_dtypes)
+        result: Optional[bool] = _dataframe_cache.get(key)
+        if result is None:
+            structured_dtype = np.dtype(
+                [(column, dtype.str) for column, dtype in column_dtypes]
+            )
+            result = check_structure(structured_dtype, structure, dtype_per_name)
+            _dataframe_cache.put(key, result)
+        return result
+
+    def _get_pandas(cls) -> Any:
+        # Return the pandas module or raise if it is not installed.
+        global _pandas  # pylint: disable=global-statement
+        if _pandas is None:
+            try:
+                import pandas  # pylint: disable=import-outside-toplevel
+            except ImportError as err:  # pragma: no cover
+                raise DependencyError(
+                    "Pandas needs to be installed for instance checking. Use `pip "
+                    "install nptyping[pandas]` or `pip install nptyping[complete]`"
+                ) from err
+            _pandas = pandas
+        return _pandas
 
     def _get_item(cls, item: Any) -> Tuple[Structure]:
         if item is Any:
@@ -105,7 +130,7 @@ class DataFrameMeta(
 
     @property
     def __module__(cls) -> str:
-        return cls._get_module(inspect.stack(), "nptyping.pandas_.dataframe")
+        return cls._get_module(inspect.currentframe(), "nptyping.pandas_.dataframe")
 
     def _check_item(cls, item: Any) -> None:
         # Check if the item is what we expect and raise if it is not.
@@ -0,0 +1,151 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import os
+from threading import Event, Lock
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Sequence,
+    Set,
+)
+
+import numpy as np
+
+from nptyping.error import InvalidArgumentsError
+from nptyping.value_constraints import (
+    DEFAULT_BLOCK_SIZE,
+    ValueConstraint,
+    check_values,
+    iterate_blocks,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor  # pragma: no cover
+
+# The number of slabs per worker. More slabs balance the load better and
+# allow an earlier stop upon a violation.
+_SLABS_PER_WORKER = 4
+
+
+def configure_parallelism(
+    max_workers: Optional[int] = None, min_size: Optional[int] = None
+) -> None:
+    """
+    Configure the threads that check the values of large arrays. Settings that
+    are not given are left untouched.
+    :param max_workers: the maximum number of threads, 1 disables threading.
+    :param min_size: the minimum number of values of an array to be checked
+    with threads; smaller arrays are checked in the calling thread.
+    :return: None.
+    """
+    global _max_workers, _min_size, _executor  # pylint: disable=global-statement
+    for name, value in (("max_workers", max_workers), ("min_size", min_size)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise InvalidArgumentsError(
+                f"Unexpected {name} {value!r}, expecting an int of 1 or more."
+            )
+    with _lock:
+        if max_workers is not None and max_workers != _max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+                _executor = None
+            _max_workers = max_workers
+        if min_size is not None:
+            _min_size = min_size
+
+
+def check_values_in_parallel(
+    array: np.ndarray,  # type: ignore[type-arg]
+    constraints: Sequence[ValueConstraint],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    release_pages: bool = False,
+    stop: Optional[Event] = None,
+) -> bool:
+    """
+    Check the values of array against all constraints like check_values. An
+    array of at least min_size values is split into slabs along the first axis
+    that are checked concurrently on a shared thread pool. NumPy releases the
+    GIL during the reductions, so the slabs are really checked in parallel.
+    Upon the first violation, the remaining slabs are cancelled.
+    :param array: the array of which the values are checked.
+    :param constraints: the constraints that the values must satisfy.
+    :param block_size: the (approximate) number of values per block.
+    :param release_pages: if True and array is a read-only np.memmap, the
+    pages of every checked block are released.
+    :param stop: an optional event; once set, checking stops and False is
+    returned. When threads are used, it is also set once checking is done.
+    :return: True if all values satisfy all constraints.
+    """
+    executor = _get_executor()
+    if executor is None or not constraints or array.size < _min_size:
+        return check_values(array, constraints, block_size, release_pages, stop)
+
+    # The executor exists, so concurrent.futures has been imported already.
+    from concurrent.futures import (  # pylint: disable=import-outside-toplevel
+        FIRST_COMPLETED,
+        wait,
+    )
+
+    nr_of_slabs = _max_workers * _SLABS_PER_WORKER
+    slab_size = max(block_size, -(-array.size // nr_of_slabs))
+    stop = Event() if stop is None else stop
+    pending: Set["Future[bool]"] = set()
+    try:
+        # A submit fails if the executor was shut down concurrently, after
+        # which the slabs that were submitted already are cancelled.
+        for slab in iterate_blocks(array, slab_size):
+            pending.add(
+                executor.submit(
+                    check_values, slab, constraints, block_size, release_pages, stop
+                )
+            )
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if not all(future.result() for future in done):
+                return False
+        return True
+    finally:
+        stop.set()
+        for future in pending:
+            future.cancel()
+
+
+def _get_executor() -> Optional["ThreadPoolExecutor"]:
+    # Return the shared executor, creating it upon first use. Return None if
+    # threading has been disabled. The concurrent.futures module is imported
+    # here to keep it from slowing down the import of nptyping.
+    global _executor  # pylint: disable=global-statement
+    with _lock:
+        if _max_workers > 1 and _executor is None:
+            # pylint: disable-next=import-outside-toplevel
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(_max_workers, thread_name_prefix="nptyping")
+        return _executor
+
+
+_lock = Lock()
+_executor = None  # type: Optional[ThreadPoolExecutor]
+_max_workers = os.cpu_count() or 1
+_min_size = 2**22  # About 32 MB of 64 bit values.
@@ -27,7 +27,12 @@ from typing import Any, Tuple
 import numpy as np
 
 from nptyping.error import InvalidArgumentsError
-from nptyping.ndarray import NDArray, NDArrayMeta
+from nptyping.ndarray import (
+    NDArray,
+    NDArrayMeta,
+    _accept,
+    _create_layout_check,
+)
 from nptyping.structure import Structure
 from nptyping.typing_ import DType
 
@@ -38,8 +43,12 @@ class RecArrayMeta(NDArrayMeta, implementation="RecArray"):
     from NDArrayMeta.
     """
 
+    _array_type = np.recarray
+
     def _get_item(cls, item: Any) -> Tuple[Any, ...]:
         cls._check_item(item)
+        if len(item) > 2:
+            raise InvalidArgumentsError(f"Unexpected argument {item[2]}.")
         shape, dtype = cls._get_from_tuple(item)
         return shape, dtype
 
@@ -52,14 +61,7 @@ class RecArrayMeta(NDArrayMeta, implementation="RecArray"):
 
     @property
     def __module__(cls) -> str:
-        return cls._get_module(inspect.stack(), "nptyping.recarray")
-
-    def __instancecheck__(  # pylint: disable=bad-mcs-method-argument
-        self, instance: Any
-    ) -> bool:
-        return isinstance(instance, np.recarray) and NDArrayMeta.__instancecheck__(
-            self, instance
-        )
+        return cls._get_module(inspect.currentframe(), "nptyping.recarray")
 
 
 class RecArray(NDArray, metaclass=RecArrayMeta):
@@ -76,3 +78,6 @@ class RecArray(NDArray, metaclass=RecArrayMeta):
     >>> RecArray[Shape["2, 2"], Any]
     RecArray[Shape['2, 2'], Any]
     """
+
+    _layout_check = _create_layout_check(np.recarray, _accept, _accept)
+    _instance_check = _layout_check
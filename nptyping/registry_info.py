@@ -0,0 +1,39 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+from collections import Counter
+from typing import Dict
+
+from nptyping.base_meta_classes import SubscriptableMeta
+
+
+def registry_info() -> Dict[str, int]:
+    """
+    Return the number of parameterized types (e.g. NDArray[Any, Float]) that
+    are currently alive, per nptyping type. Types that are no longer in use
+    are removed from the registry by the garbage collector.
+    :return: a dict with the number of types per nptyping type name.
+    """
+    # pylint: disable=protected-access
+    keys = list(SubscriptableMeta._all_types.keys())
+    return dict(Counter(cls.__name__ for cls, _ in keys))
@@ -27,9 +27,9 @@ from typing import Any, Dict
 from nptyping.base_meta_classes import ContainerMeta
 from nptyping.nptyping_type import NPTypingType
 from nptyping.shape_expression import (
-    get_dimensions,
+    compile_shape_expression,
     normalize_shape_expression,
-    remove_labels,
+    parse_shape_expression,
     validate_shape_expression,
 )
 
@@ -46,9 +46,11 @@ class ShapeMeta(ContainerMeta, implementation="Shape"):
         return normalize_shape_expression(item)
 
     def _get_additional_values(cls, item: Any) -> Dict[str, Any]:
-        dim_strings = get_dimensions(item)
-        dim_string_without_labels = remove_labels(dim_strings)
-        return {"prepared_args": dim_string_without_labels}
+        parsed_shape_expression = parse_shape_expression(item)
+        return {
+            "prepared_args": parsed_shape_expression.get_sizes(),
+            "matcher": parsed_shape_expression.compile(),
+        }
 
 
 class Shape(NPTypingType, ABC, metaclass=ShapeMeta):
@@ -73,3 +75,4 @@ class Shape(NPTypingType, ABC, metaclass=ShapeMeta):
 
     __args__ = ("*, ...",)
     prepared_args = "*, ..."
+    matcher = compile_shape_expression("*, ...")
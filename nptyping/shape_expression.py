@@ -21,25 +21,29 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import re
 import string
-from functools import lru_cache
+from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
+    NamedTuple,
+    Optional,
+    Tuple,
     Union,
 )
 
+from nptyping.cache import create_cache
 from nptyping.error import InvalidShapeError
+from nptyping.expression_parser import TokenReader, UnexpectedTokenError
 from nptyping.typing_ import ShapeExpression, ShapeTuple
 
 if TYPE_CHECKING:
     from nptyping.shape import Shape  # pragma: no cover
 
 
-@lru_cache()
 def check_shape(shape: ShapeTuple, target: "Shape") -> bool:
     """
     Check whether the given shape corresponds to the given shape_expression.
@@ -47,120 +51,312 @@ def check_shape(shape: ShapeTuple, target: "Shape") -> bool:
     :param target: the shape expression to which shape is tested.
     :return: True if the given shape corresponds to shape_expression.
     """
-    target_shape = _handle_ellipsis(shape, target.prepared_args)
-    return _check_dimensions_against_shape(shape, target_shape)
+    key = (shape, target)
+    result: Optional[bool] = _shape_cache.get(key)
+    if result is None:
+        result = match_shape(shape, target.matcher)
+        _shape_cache.put(key, result)
+    return result
 
 
-def validate_shape_expression(shape_expression: Union[ShapeExpression, Any]) -> None:
+def create_shape_check(target: "Shape") -> Callable[[ShapeTuple], bool]:
     """
-    Validate shape_expression and raise an InvalidShapeError if it is not
-    considered valid.
-    :param shape_expression: the shape expression to validate.
-    :return: None.
+    Create a function that checks whether a shape corresponds to the given
+    Shape. Shapes without an ellipsis and without variables that occur more
+    than once are checked by comparing the number of dimensions and the fixed
+    sizes only. Other shapes are matched with the compiled shape expression.
+    :param target: the Shape to which shapes are tested.
+    :return: a function that takes a shape and returns a bool.
     """
-    shape_expression_no_quotes = shape_expression.replace("'", "").replace('"', "")
-    if shape_expression is not Any and not re.match(
-        _REGEX_SHAPE_EXPRESSION, shape_expression_no_quotes
-    ):
-        raise InvalidShapeError(
+    matcher: ShapeMatcher = target.matcher
+    dimensions, _, has_ellipsis = matcher
+    variable_dimensions = [dim for dim in dimensions if dim < _WILDCARD]
+    if has_ellipsis or len(variable_dimensions) != len(set(variable_dimensions)):
+        return lambda shape: match_shape(shape, matcher)
+
+    nr_of_dimensions = len(dimensions)
+    fixed_indices = [index for index, dim in enumerate(dimensions) if dim >= 0]
+    if len(fixed_indices) == nr_of_dimensions:
+        return lambda shape: shape == dimensions
+    if not fixed_indices:
+        return lambda shape: len(shape) == nr_of_dimensions
+
+    # An itemgetter returns a single item for one index and a tuple otherwise.
+    get_fixed_sizes = itemgetter(*fixed_indices)
+    fixed_sizes: Union[int, Tuple[int, ...]] = get_fixed_sizes(dimensions)
+    return lambda shape: len(
+        shape
+    ) == nr_of_dimensions and fixed_sizes == get_fixed_sizes(shape)
+
+
+class ShapeMatcher(NamedTuple):
+    """
+    A shape expression that is compiled into integers. Fixed dimension sizes
+    are kept as they are, wildcards and variables are encoded as negative
+    numbers. This allows for matching shapes without any string handling.
+    """
+
+    dimensions: Tuple[int, ...]
+    variables: Tuple[str, ...]
+    has_ellipsis: bool
+
+
+class ShapeDimension(NamedTuple):
+    """
+    A dimension of a parsed shape expression with its size (a number, a
+    variable, a wildcard or a breakdown such as "[x, y]") and its labels.
+    """
+
+    size: str
+    labels: Tuple[str, ...]
+
+
+class ParsedShapeExpression(NamedTuple):
+    """
+    A shape expression that is parsed into its dimensions.
+    """
+
+    dimensions: Tuple[ShapeDimension, ...]
+    has_ellipsis: bool
+
+    def normalize(self) -> ShapeExpression:
+        """
+        Return the normalized shape expression, e.g. without superfluous
+        whitespaces, making similar expressions look the same.
+        :return: a normalized shape expression.
+        """
+        dim_strings = [
+            "".join((dim.size, *(f" {label}" for label in dim.labels)))
+            for dim in self.dimensions
+        ]
+        if self.has_ellipsis:
+            dim_strings.append("...")
+        return ", ".join(dim_strings)
+
+    def get_sizes(self) -> List[str]:
+        """
+        Return the sizes of all dimensions without labels, with a breakdown
+        replaced by its number of labels and with a trailing "..." if there is
+        an ellipsis.
+        :return: a list of dimension sizes as strings.
+        """
+        sizes = [
+            str(dim.size.count(",") + 1) if dim.size[0] == "[" else dim.size
+            for dim in self.dimensions
+        ]
+        if self.has_ellipsis:
+            sizes.append("...")
+        return sizes
+
+    def compile(self) -> "ShapeMatcher":
+        """
+        Compile this shape expression into a ShapeMatcher.
+        :return: a ShapeMatcher that can be used with match_shape.
+        """
+        variables: List[str] = []
+        dimensions: List[int] = []
+        for size in self.get_sizes()[: len(self.dimensions)]:
+            if _is_wildcard(size):
+                dimensions.append(_WILDCARD)
+            elif _is_variable(size):
+                if size not in variables:
+                    variables.append(size)
+                dimensions.append(_WILDCARD - 1 - variables.index(size))
+            else:
+                dimensions.append(int(size))
+        return ShapeMatcher(tuple(dimensions), tuple(variables), self.has_ellipsis)
+
+
+def parse_shape_expression(shape_expression: ShapeExpression) -> ParsedShapeExpression:
+    """
+    Parse the given shape expression in linear time and raise an
+    InvalidShapeError if it is not considered valid.
+    :param shape_expression: the shape expression that is to be parsed.
+    :return: the parsed shape expression.
+    """
+    reader = TokenReader(shape_expression.replace("'", "").replace('"', ""))
+    try:
+        dimensions = [_parse_dimension(reader)]
+        has_ellipsis = False
+        while reader.accept(","):
+            if reader.accept("..."):
+                has_ellipsis = True
+                break
+            dimensions.append(_parse_dimension(reader))
+        reader.expect("")
+    except UnexpectedTokenError:
+        raise InvalidShapeError(  # pylint: disable=raise-missing-from
             f"'{shape_expression}' is not a valid shape expression."
         )
+    return ParsedShapeExpression(tuple(dimensions), has_ellipsis)
 
 
-def normalize_shape_expression(shape_expression: ShapeExpression) -> ShapeExpression:
+def compile_shape_expression(shape_expression: ShapeExpression) -> ShapeMatcher:
     """
-    Normalize the given shape expression, e.g. by removing whitespaces, making
-    similar expressions look the same.
-    :param shape_expression: the shape expression that is to be normalized.
-    :return: a normalized shape expression.
+    Compile the given (valid) shape expression into a ShapeMatcher.
+    :param shape_expression: the shape expression that is to be compiled.
+    :return: a ShapeMatcher that can be used with match_shape.
+    """
+    return parse_shape_expression(shape_expression).compile()
+
+
+def match_shape(shape: ShapeTuple, matcher: ShapeMatcher) -> bool:
+    """
+    Check whether the given shape corresponds to the given ShapeMatcher.
+    :param shape: the shape in question.
+    :param matcher: the compiled shape expression to which shape is tested.
+    :return: True if the given shape corresponds to matcher.
     """
-    shape_expression = shape_expression.replace("'", "").replace('"', "")
-    # Replace whitespaces right before labels with $.
-    shape_expression = re.sub(rf"\s*{_REGEX_LABEL}", r"$\1", shape_expression)
-    # Let all commas be followed by a $.
-    shape_expression = shape_expression.replace(",", ",$")
-    # Remove all whitespaces left.
-    shape_expression = re.sub(r"\s*", "", shape_expression)
-    # Remove $ right after a bracket.
-    shape_expression = re.sub(r"\[\$+", "[", shape_expression)
-    # Replace $ with a single space.
-    shape_expression = re.sub(r"\$+", " ", shape_expression)
-    return shape_expression
+    dimensions, variables, has_ellipsis = matcher
+    nr_of_dimensions = len(dimensions)
+    if len(shape) != nr_of_dimensions and not (
+        has_ellipsis and len(shape) > nr_of_dimensions
+    ):
+        return False
+    # An ellipsis repeats the last dimension for all remaining sizes.
+    last_dimension = dimensions[-1]
+    assigned: List[Optional[int]] = [None] * len(variables)
+    for index, size in enumerate(shape):
+        dimension = dimensions[index] if index < nr_of_dimensions else last_dimension
+        if dimension >= 0:
+            if size != dimension:
+                return False
+        elif dimension != _WILDCARD:
+            slot = _WILDCARD - 1 - dimension
+            assigned_size = assigned[slot]
+            if assigned_size is None:
+                assigned[slot] = size
+            elif assigned_size != size:
+                return False
+    return True
 
 
-def get_dimensions(shape_expression: str) -> List[str]:
+def bind_shape_variables(
+    shape: ShapeTuple, matcher: ShapeMatcher, variables: Dict[str, int]
+) -> bool:
     """
-    Find all "break downs" (the parts between brackets) in a shape expressions
-    and replace them with mere dimension sizes.
+    Bind the variables of the given matcher to their sizes in shape and add
+    them to variables. Variables that are already in variables must have the
+    same size. The given shape is expected to correspond to matcher.
+    :param shape: the shape of which the sizes are bound.
+    :param matcher: the compiled shape expression that holds the variables.
+    :param variables: the sizes that are bound so far, by variable name.
+    :return: True if no variable got bound to a different size.
+    """
+    dimensions, variable_names, _ = matcher
+    nr_of_dimensions = len(dimensions)
+    last_dimension = dimensions[-1]
+    for index, size in enumerate(shape):
+        dimension = dimensions[index] if index < nr_of_dimensions else last_dimension
+        if dimension < _WILDCARD:
+            name = variable_names[_WILDCARD - 1 - dimension]
+            if variables.setdefault(name, size) != size:
+                return False
+    return True
 
-    :param shape_expression: the shape expression that gets the break downs replaced.
-    :return: a list of dimensions without break downs.
+
+def explain_shape(
+    shape: ShapeTuple, matcher: ShapeMatcher
+) -> Optional[Tuple[Optional[int], str, Dict[str, int]]]:
     """
-    shape_expression_without_breakdowns = shape_expression
-    for dim_breakdown in re.findall(
-        r"(\[[^\]]+\])", shape_expression_without_breakdowns
+    Explain why the given shape does not correspond to the given ShapeMatcher.
+    :param shape: the shape in question.
+    :param matcher: the compiled shape expression to which shape is tested.
+    :return: None if shape corresponds to matcher, otherwise the index of the
+    first dimension that does not (None if the number of dimensions differs),
+    a message and the variables that were bound up to that dimension.
+    """
+    dimensions, variable_names, has_ellipsis = matcher
+    nr_of_dimensions = len(dimensions)
+    variables: Dict[str, int] = {}
+    if len(shape) != nr_of_dimensions and not (
+        has_ellipsis and len(shape) > nr_of_dimensions
     ):
-        dim_size = len(dim_breakdown.split(","))
-        shape_expression_without_breakdowns = (
-            shape_expression_without_breakdowns.replace(dim_breakdown, str(dim_size))
-        )
-    return shape_expression_without_breakdowns.split(",")
+        expected = f"at least {nr_of_dimensions}" if has_ellipsis else nr_of_dimensions
+        message = f"shape {shape} has {len(shape)} dimension(s), expected {expected}"
+        return None, message, variables
+    last_dimension = dimensions[-1]
+    for index, size in enumerate(shape):
+        dimension = dimensions[index] if index < nr_of_dimensions else last_dimension
+        if dimension >= 0 and size != dimension:
+            message = (
+                f"dimension {index} of shape {shape} has size {size}, expected"
+                f" {dimension}"
+            )
+            return index, message, variables
+        if dimension < _WILDCARD:
+            name = variable_names[_WILDCARD - 1 - dimension]
+            bound_size = variables.setdefault(name, size)
+            if bound_size != size:
+                message = (
+                    f"dimension {index} of shape {shape} has size {size}, expected"
+                    f" {name}={bound_size}"
+                )
+                return index, message, variables
+    return None
 
 
-def remove_labels(dimensions: List[str]) -> List[str]:
+def validate_shape_expression(shape_expression: Union[ShapeExpression, Any]) -> None:
+    """
+    Validate shape_expression and raise an InvalidShapeError if it is not
+    considered valid.
+    :param shape_expression: the shape expression to validate.
+    :return: None.
     """
-    Remove all labels (words that start with a lowercase).
+    if shape_expression is not Any:
+        parse_shape_expression(shape_expression)
+
 
-    :param dimensions: a list of dimensions.
-    :return: a copy of the given list without labels.
+def normalize_shape_expression(shape_expression: ShapeExpression) -> ShapeExpression:
+    """
+    Normalize the given shape expression, e.g. by removing whitespaces, making
+    similar expressions look the same.
+    :param shape_expression: the shape expression that is to be normalized.
+    :return: a normalized shape expression.
     """
-    return [re.sub(r"\b[a-z]\w*", "", dim).strip() for dim in dimensions]
+    return parse_shape_expression(shape_expression).normalize()
 
 
-def _check_dimensions_against_shape(shape: ShapeTuple, target: List[str]) -> bool:
-    # Walk through the shape and test them against the given target,
-    # taking into consideration variables, wildcards, etc.
+def _parse_dimension(reader: TokenReader) -> ShapeDimension:
+    # Parse a dimension size, followed by any labels that are separated by
+    # whitespaces.
+    text = reader.next()
+    if text == "[":
+        breakdown = [_parse_label(reader)]
+        while reader.accept(","):
+            breakdown.append(_parse_label(reader))
+        reader.expect("]")
+        size = f"[{', '.join(breakdown)}]"
+    elif _is_wildcard(text) or _is_size(text) or _is_variable(text):
+        size = text
+    else:
+        raise UnexpectedTokenError(text)
+    labels = []
+    while _is_label(reader.peek()) and reader.follows_whitespace():
+        labels.append(reader.next())
+    return ShapeDimension(size, tuple(labels))
 
-    if len(shape) != len(target):
-        return False
-    shape_as_strings = (str(dim) for dim in shape)
-    variables: Dict[str, str] = {}
-    for dim, target_dim in zip(shape_as_strings, target):
-        if _is_wildcard(target_dim) or _is_assignable_var(dim, target_dim, variables):
-            continue
-        if dim != target_dim:
-            return False
-    return True
 
+def _parse_label(reader: TokenReader) -> str:
+    text = reader.next()
+    if not _is_label(text):
+        raise UnexpectedTokenError(text)
+    return text
 
-def _handle_ellipsis(shape: ShapeTuple, target: List[str]) -> List[str]:
-    # Let the ellipsis allows for any number of dimensions by replacing the
-    # ellipsis with the dimension size repeated the number of times that
-    # corresponds to the shape of the instance.
-    if target[-1] == "...":
-        dim_to_repeat = target[-2]
-        target = target[0:-1]
-        if len(shape) > len(target):
-            difference = len(shape) - len(target)
-            target += difference * [dim_to_repeat]
-    return target
 
+def _is_size(text: str) -> bool:
+    # Return whether text is a fixed dimension size.
+    return text.isascii() and text.isdigit()
 
-def _is_assignable_var(dim: str, target_dim: str, variables: Dict[str, str]) -> bool:
-    # Return whether target_dim is a variable and can be assigned with dim.
-    return _is_variable(target_dim) and _can_assign_variable(dim, target_dim, variables)
+
+def _is_label(text: str) -> bool:
+    # Return whether text is a label (a word that starts with a lowercase).
+    return text[:1] in _LOWERCASE
 
 
 def _is_variable(dim: str) -> bool:
     # Return whether dim is a variable.
-    return dim[0] in string.ascii_uppercase
-
-
-def _can_assign_variable(dim: str, target_dim: str, variables: Dict[str, str]) -> bool:
-    # Check and assign a variable.
-    assignable = variables.get(target_dim) in (None, dim)
-    variables[target_dim] = dim
-    return assignable
+    return dim[:1] in _UPPERCASE
 
 
 def _is_wildcard(dim: str) -> bool:
@@ -169,22 +365,7 @@ def _is_wildcard(dim: str) -> bool:
     return dim == "*"
 
 
-_REGEX_SEPARATOR = r"(\s*,\s*)"
-_REGEX_DIMENSION_SIZE = r"(\s*[0-9]+\s*)"
-_REGEX_VARIABLE = r"(\s*\b[A-Z]\w*\s*)"
-_REGEX_LABEL = r"(\s*\b[a-z]\w*\s*)"
-_REGEX_LABELS = rf"({_REGEX_LABEL}({_REGEX_SEPARATOR}{_REGEX_LABEL})*)"
-_REGEX_WILDCARD = r"(\s*\*\s*)"
-_REGEX_DIMENSION_BREAKDOWN = rf"(\s*\[{_REGEX_LABELS}\]\s*)"
-_REGEX_DIMENSION = (
-    rf"({_REGEX_DIMENSION_SIZE}"
-    rf"|{_REGEX_VARIABLE}"
-    rf"|{_REGEX_WILDCARD}"
-    rf"|{_REGEX_DIMENSION_BREAKDOWN})"
-)
-_REGEX_DIMENSION_WITH_LABEL = rf"({_REGEX_DIMENSION}(\s+{_REGEX_LABEL})*)"
-_REGEX_DIMENSIONS = (
-    rf"{_REGEX_DIMENSION_WITH_LABEL}({_REGEX_SEPARATOR}{_REGEX_DIMENSION_WITH_LABEL})*"
-)
-_REGEX_DIMENSIONS_ELLIPSIS = rf"({_REGEX_DIMENSIONS}{_REGEX_SEPARATOR}\.\.\.\s*)"
-_REGEX_SHAPE_EXPRESSION = rf"^({_REGEX_DIMENSIONS}|{_REGEX_DIMENSIONS_ELLIPSIS})$"
+_shape_cache = create_cache("shape")
+_WILDCARD = -1
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
@@ -31,8 +31,9 @@ from typing import (
 from nptyping.base_meta_classes import ContainerMeta
 from nptyping.nptyping_type import NPTypingType
 from nptyping.structure_expression import (
-    create_name_to_type_dict,
+    StructureField,
     normalize_structure_expression,
+    parse_structure_expression,
     validate_structure_expression,
 )
 
@@ -51,9 +52,11 @@ class StructureMeta(ContainerMeta, implementation="Structure"):
         return normalize_structure_expression(item)
 
     def _get_additional_values(cls, item: Any) -> Dict[str, Any]:
+        parsed_structure_expression = parse_structure_expression(item)
         return {
-            "_type_per_name": create_name_to_type_dict(item),
-            "_has_wildcard": item.replace(" ", "").endswith(",*"),
+            "_type_per_name": parsed_structure_expression.get_type_per_name(),
+            "_field_per_name": parsed_structure_expression.get_field_per_name(),
+            "_has_wildcard": parsed_structure_expression.has_wildcard,
         }
 
 
@@ -69,7 +72,8 @@ class Structure(NPTypingType, ABC, metaclass=StructureMeta):
 
     """
 
-    _type_per_name = {}
+    _type_per_name: Dict[str, str] = {}
+    _field_per_name: Dict[str, StructureField] = {}
     _has_wildcard = False
 
     @classmethod
@@ -96,6 +100,16 @@ class Structure(NPTypingType, ABC, metaclass=StructureMeta):
         """
         return list(cls._type_per_name.keys())
 
+    @classmethod
+    def get_fields(cls) -> Dict[str, StructureField]:
+        """
+        Return a dict with all names and their fields in this Structure. A
+        StructureField holds the type name and the Shape of a subarray (if
+        any) of a field.
+        :return: a dict with a StructureField per name.
+        """
+        return cls._field_per_name
+
     @classmethod
     def get_type(cls, name: str) -> str:
         """
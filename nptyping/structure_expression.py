@@ -21,16 +21,17 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import re
+import string
 from collections import Counter, defaultdict
 from difflib import get_close_matches
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
-    Generator,
     List,
     Mapping,
+    NamedTuple,
+    Optional,
     Tuple,
     Type,
     Union,
@@ -38,12 +39,14 @@ from typing import (
 
 import numpy as np
 
+from nptyping.cache import create_cache
 from nptyping.error import InvalidShapeError, InvalidStructureError
+from nptyping.expression_parser import TokenReader, UnexpectedTokenError
 from nptyping.shape import Shape
 from nptyping.shape_expression import (
+    ParsedShapeExpression,
     check_shape,
-    normalize_shape_expression,
-    validate_shape_expression,
+    parse_shape_expression,
 )
 from nptyping.typing_ import StructureExpression
 
@@ -61,14 +64,7 @@ def validate_structure_expression(
     :return: None.
     """
     if structure_expression is not Any:
-        if not re.match(_REGEX_STRUCTURE_EXPRESSION, structure_expression):
-            raise InvalidStructureError(
-                f"'{structure_expression}' is not a valid structure expression."
-            )
-        _validate_structure_expression_contains_no_multiple_field_names(
-            structure_expression
-        )
-        _validate_sub_array_expressions(structure_expression)
+        parse_structure_expression(structure_expression)
 
 
 def check_structure(
@@ -86,66 +82,97 @@ def check_structure(
     occur in a structure expression.
     :return: True if the given dtype is valid with the given target.
     """
-    fields: Mapping[str, Any] = structured_dtype.fields or {}  # type: ignore[assignment]
-
-    # Add the wildcard to the lexicon. We want to do this here to keep
-    # knowledge on wildcards in one place (this module).
-    type_per_name_with_wildcard: Dict[str, type] = {
-        **type_per_name,
-        "*": object,
-    }  # type: ignore[arg-type]
+    # The lexicon is part of the key by its identity. It is stored along with
+    # the result to keep it alive, so that its id cannot be reused.
+    key = (structured_dtype, target, id(type_per_name))
+    cached: Optional[Tuple[Dict[str, type], bool]] = _structure_cache.get(key)
+    if cached is None:
+        result = _check_structure(structured_dtype, target, type_per_name)
+        _structure_cache.put(key, (type_per_name, result))
+        return result
+    return cached[1]
+
+
+def _check_structure(
+    structured_dtype: np.dtype,  # type: ignore[type-arg]
+    target: "Structure",
+    type_per_name: Dict[str, type],
+) -> bool:
+    return explain_structure(structured_dtype, target, type_per_name) is None
 
-    if target.has_wildcard():
-        # Check from the Target's perspective. All fields in the Target should be
-        # in the subject.
-        def iterator() -> Generator[Tuple[str, Tuple[np.dtype, int]], None, None]:  # type: ignore[type-arg] # pylint: disable=line-too-long
-            for name_ in target.get_names():
-                yield name_, fields.get(name_)  # type: ignore[misc]
 
-    else:
-        # Check from the subject's perspective. All fields in the subject
-        # should be in the target.
-        if set(target.get_names()) != set(fields.keys()):
-            return False
-
-        def iterator() -> Generator[Tuple[str, Tuple[np.dtype, int]], None, None]:  # type: ignore[type-arg] # pylint: disable=line-too-long
-            for name_, dtype_tuple_ in fields.items():
-                yield name_, dtype_tuple_  # type: ignore[misc]
+def explain_structure(
+    structured_dtype: np.dtype,  # type: ignore[type-arg]
+    target: "Structure",
+    type_per_name: Dict[str, type],
+) -> Optional[Tuple[str, str]]:
+    """
+    Explain why the given structured_dtype does not correspond to the given
+    target Structure.
+    :param structured_dtype: the dtype in question.
+    :param target: the target Structure that is checked against.
+    :param type_per_name: a dict that holds the types by their names as they
+    occur in a structure expression.
+    :return: None if structured_dtype corresponds to target, otherwise the
+    name of the first field that does not and a message.
+    """
+    fields: Mapping[str, Any] = structured_dtype.fields or {}  # type: ignore[assignment]
+    target_fields = target.get_fields()
+
+    # All fields in the target should always be in the subject.
+    for name, target_field in target_fields.items():
+        dtype_tuple = fields.get(name)
+        if dtype_tuple is None:
+            return name, f"field '{name}' is missing"
+        message = _explain_structure_field(
+            name, dtype_tuple[0], target_field, type_per_name
+        )
+        if message:
+            return name, message
 
-    for name, dtype_tuple in iterator():
-        field_in_target_not_in_subject = dtype_tuple is None
-        if field_in_target_not_in_subject or not _check_structure_field(
-            name, dtype_tuple, target, type_per_name_with_wildcard
-        ):
-            return False
-    return True
+    # Without a wildcard, all fields in the subject should be in the target.
+    if not target.has_wildcard():
+        for name in fields:
+            if name not in target_fields:
+                return name, f"field '{name}' is not in {target}"
+    return None
 
 
-def _check_structure_field(
+def _explain_structure_field(
     name: str,
-    dtype_tuple: Tuple[np.dtype, int],  # type: ignore[type-arg]
-    target: "Structure",
-    type_per_name_with_wildcard: Dict[str, type],
-) -> bool:
-    dtype = dtype_tuple[0]
-    target_type_name = target.get_type(name)
-    target_type_shape_match = re.search(_REGEX_FIELD_SHAPE, target_type_name)
+    dtype: np.dtype,  # type: ignore[type-arg]
+    target_field: "StructureField",
+    type_per_name: Dict[str, type],
+) -> Optional[str]:
     actual_type = dtype.type
-    if target_type_shape_match:
+    if target_field.shape is not None:
         if not dtype.subdtype:
-            # the dtype does not contain a shape.
-            return False
+            return (
+                f"field '{name}' has dtype {dtype}, expected a subarray of"
+                f" {target_field.shape}"
+            )
         actual_type = dtype.subdtype[0].type
-        target_type_shape = target_type_shape_match.group(1)
-        shape_corresponds = check_shape(dtype.shape, Shape[target_type_shape])
+        shape_corresponds = check_shape(dtype.shape, target_field.shape)
         if not shape_corresponds:
-            return False
-        target_type_name = target_type_name.replace(
-            target_type_shape_match.group(0), ""
-        )
-    check_type_name(target_type_name, type_per_name_with_wildcard)
-    target_type = type_per_name_with_wildcard[target_type_name]
-    return issubclass(actual_type, target_type)
+            return (
+                f"field '{name}' has shape {dtype.shape}, expected"
+                f" {target_field.shape}"
+            )
+    target_type = _get_type(target_field.type_name, type_per_name)
+    if not issubclass(actual_type, target_type):
+        return f"field '{name}' has dtype {dtype}, expected {target_field.type_name}"
+    return None
+
+
+def _get_type(type_name: str, type_per_name: Dict[str, type]) -> type:
+    # Return the type that corresponds to type_name or raise if there is none.
+    # We want to handle the wildcard here to keep knowledge on wildcards in
+    # one place (this module).
+    if type_name == _FIELD_TYPE_WILDCARD:
+        return object
+    if type_name not in type_per_name:
+        check_type_name(type_name, type_per_name)
+    return type_per_name[type_name]
 
 
 def check_type_names(
@@ -159,8 +186,8 @@ def check_type_names(
     :param type_per_name: the context that determines which type names are valid.
     :return: None.
     """
-    for type_ in structure.get_types():
-        check_type_name(type_, type_per_name)
+    for field in structure.get_fields().values():
+        _get_type(field.type_name, type_per_name)
 
 
 def check_type_name(type_name: str, type_per_name: Dict[str, Type[object]]) -> None:
@@ -197,14 +224,157 @@ def normalize_structure_expression(
     :param structure_expression: the structure expression that is to be normalized.
     :return: a normalized structure expression.
     """
-    structure_expression = re.sub(r"\s*", "", structure_expression)
-    type_to_names_dict = _create_type_to_names_dict(structure_expression)
-    normalized_structure_expression = _type_to_names_dict_to_str(type_to_names_dict)
-    result = normalized_structure_expression.replace(",", ", ").replace("  ", " ")
-    has_wildcard_end = structure_expression.replace(" ", "").endswith(",*")
-    if has_wildcard_end:
-        result += ", *"
-    return result
+    return parse_structure_expression(structure_expression).normalize()
+
+
+class StructureField(NamedTuple):
+    """
+    A field of a Structure with the name of its type and the Shape of its
+    subarray if it has any.
+    """
+
+    type_name: str
+    shape: Optional[Shape]
+
+
+class ParsedStructureField(NamedTuple):
+    """
+    A field of a parsed structure expression with all the names that share
+    it, its type name and the parsed shape of its subarray if it has any.
+    """
+
+    names: Tuple[str, ...]
+    type_name: str
+    shape: Optional[ParsedShapeExpression]
+
+    def get_type(self) -> str:
+        """
+        Return the type of this field as it appears in a normalized structure
+        expression, e.g. "Float[2, 2]".
+        :return: the type with the normalized shape of its subarray if any.
+        """
+        if self.shape is None:
+            return self.type_name
+        return f"{self.type_name}[{self.shape.normalize()}]"
+
+
+class ParsedStructureExpression(NamedTuple):
+    """
+    A structure expression that is parsed into its fields.
+    """
+
+    fields: Tuple[ParsedStructureField, ...]
+    has_wildcard: bool
+
+    def get_names_per_type(self) -> Dict[str, List[str]]:
+        """
+        Return the field names per type, sorted by type and then by name.
+        :return: a dict with a sorted list of field names per type.
+        """
+        names_per_type: Dict[str, List[str]] = defaultdict(list)
+        for field in self.fields:
+            names_per_type[field.get_type()] += field.names
+        return {
+            type_: sorted(names_per_type[type_]) for type_ in sorted(names_per_type)
+        }
+
+    def normalize(self) -> StructureExpression:
+        """
+        Return the normalized structure expression with the fields grouped and
+        sorted by type, making similar expressions look the same.
+        :return: a normalized structure expression.
+        """
+        field_strings = []
+        for type_, names in self.get_names_per_type().items():
+            names_joined = ", ".join(names)
+            if len(names) > 1:
+                names_joined = f"[{names_joined}]"
+            field_strings.append(f"{names_joined}{_FIELD_TYPE_POINTER} {type_}")
+        if self.has_wildcard:
+            field_strings.append(_FIELD_TYPE_WILDCARD)
+        return ", ".join(field_strings)
+
+    def get_type_per_name(self) -> Dict[str, str]:
+        """
+        Return the type (str) per field name, e.g. {"x": "Float[2, 2]"}.
+        :return: a dict with names and their types, both as strings.
+        """
+        return {
+            name: type_
+            for type_, names in self.get_names_per_type().items()
+            for name in names
+        }
+
+    def get_field_per_name(self) -> Dict[str, StructureField]:
+        """
+        Return the StructureField per field name.
+        :return: a dict with names and their fields.
+        """
+        field_per_name = {}
+        shape_per_parsed_shape: Dict[ParsedShapeExpression, Any] = {}
+        for field in self.fields:
+            shape = None
+            if field.shape is not None:
+                if field.shape not in shape_per_parsed_shape:
+                    shape_expression = field.shape.normalize()
+                    shape_per_parsed_shape[field.shape] = Shape[shape_expression]
+                shape = shape_per_parsed_shape[field.shape]
+            for name in field.names:
+                field_per_name[name] = StructureField(field.type_name, shape)
+        return {name: field_per_name[name] for name in self.get_type_per_name()}
+
+
+def parse_structure_expression(
+    structure_expression: StructureExpression,
+) -> ParsedStructureExpression:
+    """
+    Parse the given structure expression in linear time and raise an
+    InvalidStructureError if it is deemed invalid.
+    :param structure_expression: the structure expression that is to be parsed.
+    :return: the parsed structure expression.
+    """
+    reader = TokenReader(structure_expression)
+    try:
+        fields = [_parse_field(reader)]
+        has_wildcard = False
+        while reader.accept(_SEPARATOR):
+            if reader.accept(_FIELD_TYPE_WILDCARD):
+                has_wildcard = True
+                break
+            fields.append(_parse_field(reader))
+        reader.expect("")
+    except UnexpectedTokenError:
+        raise InvalidStructureError(  # pylint: disable=raise-missing-from
+            f"'{structure_expression}' is not a valid structure expression."
+        )
+    _validate_field_names_occur_once(fields, structure_expression)
+    # Sub arrays often share their shape, which then needs to be parsed once.
+    shape_per_expression: Dict[str, ParsedShapeExpression] = {}
+    parsed_fields = []
+    for names, type_name, shape_expression in fields:
+        shape = None
+        if shape_expression is not None:
+            shape = shape_per_expression.get(shape_expression)
+            if shape is None:
+                shape = _parse_sub_array(shape_expression, structure_expression)
+                shape_per_expression[shape_expression] = shape
+        parsed_fields.append(ParsedStructureField(names, type_name, shape))
+    return ParsedStructureExpression(tuple(parsed_fields), has_wildcard)
+
+
+def create_name_to_field_dict(
+    structure_expression: StructureExpression,
+) -> Dict[str, StructureField]:
+    """
+    Create a dict with a name as key and a StructureField as value from the
+    given structure expression. Structure["x: Int, y: Float[2, 2]"] would
+    yield {"x": StructureField("Int", None),
+           "y": StructureField("Float", Shape["2, 2"])}.
+    :param structure_expression: the structure expression from which the dict
+    is extracted.
+    :return: a dict with names and their fields.
+    """
+    return parse_structure_expression(structure_expression).get_field_per_name()
 
 
 def create_name_to_type_dict(
@@ -218,30 +388,52 @@ def create_name_to_type_dict(
     is extracted.
     :return: a dict with names and their types, both as strings.
     """
-    type_to_names_dict = _create_type_to_names_dict(structure_expression)
-    return {
-        name.strip(): type_.strip()
-        for type_, names in type_to_names_dict.items()
-        for name in names
-    }
-
-
-def _validate_structure_expression_contains_no_multiple_field_names(
+    return parse_structure_expression(structure_expression).get_type_per_name()
+
+
+def _parse_field(
+    reader: TokenReader,
+) -> Tuple[Tuple[str, ...], str, Optional[str]]:
+    # Parse a field into its names, its type name and the shape expression of
+    # its subarray as it is given (if any).
+    if reader.accept("["):
+        names = [_parse_name(reader)]
+        while reader.accept(_SEPARATOR):
+            names.append(_parse_name(reader))
+        if len(names) < 2:
+            raise UnexpectedTokenError(reader.peek())
+        reader.expect("]")
+    else:
+        names = [_parse_name(reader)]
+    reader.expect(_FIELD_TYPE_POINTER)
+    if reader.accept(_FIELD_TYPE_WILDCARD):
+        type_name = _FIELD_TYPE_WILDCARD
+    else:
+        type_name = _parse_name(reader)
+    shape = None
+    if reader.accept("["):
+        # The shape expression is validated later on, so just take it as is.
+        shape = reader.read_until("]")
+        if not shape:
+            raise UnexpectedTokenError(reader.peek())
+        reader.expect("]")
+    return tuple(names), type_name, shape
+
+
+def _parse_name(reader: TokenReader) -> str:
+    # Parse a field name or a type name.
+    text = reader.next()
+    if text[:1] not in _NAME_START:
+        raise UnexpectedTokenError(text)
+    return text
+
+
+def _validate_field_names_occur_once(
+    fields: List[Tuple[Tuple[str, ...], str, Optional[str]]],
     structure_expression: StructureExpression,
 ) -> None:
     # Validate that there are not multiple occurrences of the same field names.
-    matches = re.findall(_REGEX_FIELD, re.sub(r"\s*", "", structure_expression))
-    field_name_combinations = [match[0].split(":")[0] for match in matches]
-    field_names: List[str] = []
-    for field_name_combination in field_name_combinations:
-        field_name_combination_match = re.match(
-            _REGEX_FIELD_NAMES_COMBINATION, field_name_combination
-        )
-        if field_name_combination_match:
-            field_names += field_name_combination_match.group(2).split(_SEPARATOR)
-        else:
-            field_names.append(field_name_combination)
-    field_name_counter = Counter(field_names)
+    field_name_counter = Counter(name for names, _, _ in fields for name in names)
     field_names_occurring_multiple_times = [
         field_name for field_name, amount in field_name_counter.items() if amount > 1
     ]
@@ -257,83 +449,21 @@ def _validate_structure_expression_contains_no_multiple_field_names(
         )
 
 
-def _validate_sub_array_expressions(structure_expression: str) -> None:
-    # Validate that the given structure expression does not contain any shape
-    # expressions for sub arrays that are invalid.
-    for field_match in re.findall(_REGEX_FIELD, structure_expression):
-        field_type = field_match[0].split(_FIELD_TYPE_POINTER)[1]
-        type_shape_match = re.search(_REGEX_FIELD_SHAPE, field_type)
-        if type_shape_match:
-            type_shape = type_shape_match[1]
-            try:
-                validate_shape_expression(type_shape)
-            except InvalidShapeError as err:
-                raise InvalidStructureError(
-                    f"'{structure_expression}' is not a valid structure"
-                    f" expression; {str(err)}"
-                ) from err
-
-
-def _create_type_to_names_dict(
-    structure_expression: StructureExpression,
-) -> Dict[str, List[str]]:
-    # Create a dictionary with field names per type, sorted by type and then by
-    # name.
-    names_per_type: Dict[str, List[str]] = defaultdict(list)
-    for field_match in re.findall(_REGEX_FIELD, structure_expression):
-        field_name_combination, field_type = field_match[0].split(_FIELD_TYPE_POINTER)
-        field_name_combination_match = re.match(
-            _REGEX_FIELD_NAMES_COMBINATION, field_name_combination
-        )
-        field_type_shape_match = re.search(_REGEX_FIELD_SHAPE, field_type)
-        if field_name_combination_match:
-            field_names = field_name_combination_match.group(2).split(_SEPARATOR)
-        else:
-            field_names = [field_name_combination]
-        if field_type_shape_match:
-            type_shape = field_type_shape_match.group(1)
-            normalized_type_shape = normalize_shape_expression(type_shape)
-            field_type = field_type.replace(
-                field_type_shape_match.group(0), f"[{normalized_type_shape}]"
-            )
-        names_per_type[field_type] += field_names
-    return {
-        field_type: sorted(names_per_type[field_type])
-        for field_type in sorted(names_per_type.keys())
-    }
-
-
-def _type_to_names_dict_to_str(type_to_names_dict: Dict[str, List[str]]) -> str:
-    # Turn the given dict into a structure expression.
-    field_strings = []
-    for field_type, field_names in type_to_names_dict.items():
-        field_names_joined = f"{_SEPARATOR}".join(field_names)
-        if len(field_names) > 1:
-            field_names_joined = f"[{field_names_joined}]"
-        field_strings.append(f"{field_names_joined}{_FIELD_TYPE_POINTER} {field_type}")
-    return f"{_SEPARATOR}".join(field_strings)
+def _parse_sub_array(
+    shape_expression: str, structure_expression: StructureExpression
+) -> ParsedShapeExpression:
+    # Parse the shape expression of a sub array.
+    try:
+        return parse_shape_expression(shape_expression)
+    except InvalidShapeError as err:
+        raise InvalidStructureError(
+            f"'{structure_expression}' is not a valid structure"
+            f" expression; {str(err)}"
+        ) from err
 
 
+_structure_cache = create_cache("structure")
 _SEPARATOR = ","
 _FIELD_TYPE_POINTER = ":"
-_REGEX_SEPARATOR = rf"(\s*{_SEPARATOR}\s*)"
-_REGEX_FIELD_NAME = r"(\s*[a-zA-Z]\w*\s*)"
-_REGEX_FIELD_NAMES = rf"({_REGEX_FIELD_NAME}({_REGEX_SEPARATOR}{_REGEX_FIELD_NAME})+)"
-_REGEX_FIELD_NAMES_COMBINATION = rf"(\s*\[{_REGEX_FIELD_NAMES}\]\s*)"
-_REGEX_FIELD_LEFT = rf"({_REGEX_FIELD_NAME}|{_REGEX_FIELD_NAMES_COMBINATION})"
-_REGEX_FIELD_TYPE = r"(\s*[a-zA-Z]\w*\s*)"
-_REGEX_FIELD_TYPE_WILDCARD = r"(\s*\*\s*)"
-_REGEX_FIELD_SHAPE = r"\[([^\]]+)\]"
-_REGEX_FIELD_SHAPE_MAYBE = rf"\s*({_REGEX_FIELD_SHAPE})?\s*"
-_REGEX_FIELD_RIGHT = (
-    rf"({_REGEX_FIELD_TYPE}|{_REGEX_FIELD_TYPE_WILDCARD}){_REGEX_FIELD_SHAPE_MAYBE}"
-)
-_REGEX_FIELD_TYPE_POINTER = rf"(\s*{_FIELD_TYPE_POINTER}\s*)"
-_REGEX_FIELD = (
-    rf"(\s*{_REGEX_FIELD_LEFT}{_REGEX_FIELD_TYPE_POINTER}{_REGEX_FIELD_RIGHT}\s*)"
-)
-_REGEX_STRUCTURE_EXPRESSION = (
-    rf"^({_REGEX_FIELD}"
-    rf"({_REGEX_SEPARATOR}{_REGEX_FIELD})*"
-    rf"({_REGEX_SEPARATOR}{_REGEX_FIELD_TYPE_WILDCARD})?)$"
-)
+_FIELD_TYPE_WILDCARD = "*"
+_NAME_START = frozenset(string.ascii_letters)
@@ -0,0 +1,332 @@
+"""
+MIT License
+
+Copyright (c) 2023 Ramon Hagenaars
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import mmap
+from abc import ABC, abstractmethod
+from numbers import Real
+from threading import Event
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from nptyping.error import InvalidArgumentsError
+
+# The number of values that are reduced at once. Blocks of this size fit in
+# the CPU cache, so the reductions that follow the first one are cheap.
+DEFAULT_BLOCK_SIZE = 65536
+
+# Only the values of these dtypes can be checked against value constraints.
+_CHECKABLE_DTYPES = (np.integer, np.floating, np.bool_)
+
+# Pages of memory-mapped arrays can be released on platforms with madvise.
+_CAN_RELEASE_PAGES = hasattr(mmap.mmap, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+
+
+class ValueConstraint(ABC):
+    """
+    Base class of the constraints on the values of an NDArray. A constraint is
+    checked against the minimum and the maximum of a block of values, so that
+    all constraints of a type can share a single pass over the values.
+    Constraints that need the individual values set needs_values and override
+    check_block.
+    """
+
+    __slots__ = ()
+    needs_values = False
+
+    @abstractmethod
+    def check_extremes(self, minimum: Any, maximum: Any) -> bool:
+        """
+        Check whether values with the given extremes satisfy this constraint.
+        :param minimum: the minimum of the values, NaN if any value is NaN.
+        :param maximum: the maximum of the values, NaN if any value is NaN.
+        :return: True if the values satisfy this constraint.
+        """
+
+    def check_block(  # pylint: disable=unused-argument
+        self,
+        block: np.ndarray,  # type: ignore[type-arg]
+        minimum: Any,
+        maximum: Any,
+        scratch: np.ndarray,  # type: ignore[type-arg]
+    ) -> bool:
+        """
+        Check the values of a block of which the extremes satisfy all
+        constraints. Only invoked if needs_values is set.
+        :param block: the values that are to be checked.
+        :param minimum: the minimum of the block.
+        :param maximum: the maximum of the block.
+        :param scratch: a boolean buffer with the shape of block, to be used
+        as output of element-wise operations.
+        :return: True if the values satisfy this constraint.
+        """
+        return True  # pragma: no cover
+
+    def _get_key(self) -> Hashable:
+        # Return what identifies this constraint among those of its type.
+        return repr(self)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self._get_key() == other._get_key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._get_key()))
+
+
+class Bounds(ValueConstraint):
+    """
+    Constrains all values to lie within [lower, upper]. A bound that is None is
+    not checked. NaN values never lie within bounds.
+
+    >>> Bounds(0, 1)
+    Bounds(0, 1)
+    >>> Bounds(lower=0)
+    Bounds(lower=0)
+    """
+
+    __slots__ = ("lower", "upper")
+
+    def __init__(self, lower: Optional[Real] = None, upper: Optional[Real] = None):
+        for bound in (lower, upper):
+            if bound is not None and not isinstance(bound, Real):
+                raise InvalidArgumentsError(
+                    f"Unexpected bound {bound!r}, expecting a real number or None."
+                )
+        if lower is not None and upper is not None and lower > upper:
+            raise InvalidArgumentsError(
+                f"Unexpected bounds, lower {lower} is greater than upper {upper}."
+            )
+        self.lower = lower
+        self.upper = upper
+
+    def check_extremes(self, minimum: Any, maximum: Any) -> bool:
+        return bool(
+            (self.lower is None or minimum >= self.lower)
+            and (self.upper is None or maximum <= self.upper)
+        )
+
+    def _get_key(self) -> Hashable:
+        # Bounds are compared by value, e.g. Bounds(0) equals Bounds(0.0).
+        return _normalize(self.lower), _normalize(self.upper)
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        # Instances have no __dict__, which pickle protocols 0 and 1 need.
+        return Bounds, (self.lower, self.upper)
+
+    def __repr__(self) -> str:
+        if self.lower is None and self.upper is None:
+            return "Bounds()"
+        if self.lower is None:
+            return f"Bounds(upper={self.upper})"
+        if self.upper is None:
+            return f"Bounds(lower={self.lower})"
+        return f"Bounds({self.lower}, {self.upper})"
+
+
+class _Finite(ValueConstraint):
+    # Constrains all values to be finite: no NaN and no infinity.
+
+    __slots__ = ()
+
+    def check_extremes(self, minimum: Any, maximum: Any) -> bool:
+        return bool(np.isfinite(minimum) and np.isfinite(maximum))
+
+    def __repr__(self) -> str:
+        return "Finite"
+
+    def __reduce__(self) -> str:
+        # Unpickle to the one instance that there is.
+        return "Finite"
+
+
+Finite = _Finite()
+
+
+class Excludes(ValueConstraint):
+    """
+    Constrains all values to differ from the given (sentinel) values. NaN can
+    be excluded as well.
+
+    >>> Excludes(-9999, np.nan)
+    Excludes(-9999, nan)
+    """
+
+    __slots__ = ("values",)
+    needs_values = True
+
+    def __init__(self, *values: Real):
+        if not values:
+            raise InvalidArgumentsError("Excludes needs at least one value.")
+        for value in values:
+            if not isinstance(value, Real):
+                raise InvalidArgumentsError(
+                    f"Unexpected value {value!r}, expecting a real number."
+                )
+        self.values: Tuple[Any, ...] = values
+
+    def check_extremes(self, minimum: Any, maximum: Any) -> bool:
+        return True
+
+    def check_block(
+        self,
+        block: np.ndarray,  # type: ignore[type-arg]
+        minimum: Any,
+        maximum: Any,
+        scratch: np.ndarray,  # type: ignore[type-arg]
+    ) -> bool:
+        # NaN propagates through min, so only a block with NaN has a NaN
+        # minimum. Values outside of the extremes need no comparison.
+        has_nan = np.isnan(minimum)
+        for value in self.values:
+            if np.isnan(value):
+                if has_nan:
+                    return False
+            elif has_nan or minimum <= value <= maximum:
+                np.equal(block, value, out=scratch)
+                if scratch.any():
+                    return False
+        return True
+
+    def _get_key(self) -> Hashable:
+        # The order and the repetition of values do not matter.
+        return frozenset(_normalize(value) for value in self.values)
+
+    def __reduce__(self) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        # Instances have no __dict__, which pickle protocols 0 and 1 need.
+        return Excludes, self.values
+
+    def __repr__(self) -> str:
+        return f"Excludes({', '.join(repr(value) for value in self.values)})"
+
+
+def check_values(
+    array: np.ndarray,  # type: ignore[type-arg]
+    constraints: Sequence[ValueConstraint],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    release_pages: bool = False,
+    stop: Optional[Event] = None,
+) -> bool:
+    """
+    Check the values of array against all constraints. The minimum and maximum
+    of each block are computed once and shared by all constraints. Checking
+    stops at the first block that violates a constraint. Element-wise checks
+    reuse one scratch buffer of the size of a block, so that no temporaries of
+    the size of array are allocated.
+    :param array: the array of which the values are checked.
+    :param constraints: the constraints that the values must satisfy.
+    :param block_size: the (approximate) number of values per block.
+    :param release_pages: if True and array is a read-only np.memmap, the
+    pages of every checked block are released.
+    :param stop: an optional event; once set, checking stops and False is
+    returned.
+    :return: True if all values satisfy all constraints.
+    """
+    if not constraints:
+        return True
+    if not can_check_values(array.dtype):
+        return False
+    value_constraints = [c for c in constraints if c.needs_values]
+    scratch = None
+    release = _create_page_releaser(array) if release_pages else None
+    for block in iterate_blocks(array, block_size):
+        if stop is not None and stop.is_set():
+            return False
+        minimum = block.min()
+        maximum = block.max()
+        for constraint in constraints:
+            if not constraint.check_extremes(minimum, maximum):
+                return False
+        if value_constraints:
+            if scratch is None:
+                scratch = np.empty(block.size, dtype=bool)
+            block_scratch = scratch[: block.size].reshape(block.shape)
+            for constraint in value_constraints:
+                if not constraint.check_block(block, minimum, maximum, block_scratch):
+                    return False
+        if release is not None:
+            release(block)
+    return True
+
+
+def can_check_values(dtype: np.dtype) -> bool:  # type: ignore[type-arg]
+    """
+    Return whether values of the given dtype can be checked against value
+    constraints. Only integers, floats and booleans can.
+    :param dtype: the dtype of the values.
+    :return: True if the values can be checked.
+    """
+    return issubclass(dtype.type, _CHECKABLE_DTYPES)
+
+
+def iterate_blocks(
+    array: np.ndarray, block_size: int  # type: ignore[type-arg]
+) -> Iterator[np.ndarray]:  # type: ignore[type-arg]
+    """
+    Iterate over consecutive blocks along the first axis of array. Each block
+    is a view of about block_size values, but at least one row.
+    :param array: the array that is to be iterated over.
+    :param block_size: the (approximate) number of values per block.
+    :return: an iterator of views of array.
+    """
+    if array.size == 0:
+        return
+    if array.ndim == 0:
+        yield array
+        return
+    nr_of_rows = array.shape[0]
+    rows_per_block = max(1, block_size // (array.size // nr_of_rows))
+    for start in range(0, nr_of_rows, rows_per_block):
+        yield array[start : start + rows_per_block]
+
+
+def _create_page_releaser(
+    array: np.ndarray,  # type: ignore[type-arg]
+) -> Optional[Callable[[np.ndarray], None]]:  # type: ignore[type-arg]
+    # Return a function that releases the pages of a block of array, if array
+    # is a read-only memmap. Writable maps are left alone, as releasing their
+    # pages could drop changes.
+    mapped: Any = getattr(array, "_mmap", None)
+    if not _CAN_RELEASE_PAGES or mapped is None or getattr(array, "mode") != "r":
+        return None
+    base, _ = np.byte_bounds(np.frombuffer(mapped, dtype=np.uint8))
+
+    def _release(block: np.ndarray) -> None:  # type: ignore[type-arg]
+        low, high = np.byte_bounds(block)
+        start = (low - base) // mmap.PAGESIZE * mmap.PAGESIZE
+        mapped.madvise(mmap.MADV_DONTNEED, start, high - base - start)
+
+    return _release
+
+
+def _normalize(value: Any) -> Any:
+    # Return value such that equal numbers compare and hash equal, which
+    # includes NaN (the only value that does not equal itself).
+    return "nan" if value != value else value  # pylint: disable=comparison-with-itself
@@ -218,6 +218,15 @@ def mypy(context, py=None):
     context.run(f"{get_py(py)} -m mypy {_ROOT}")
 
 
+@task
+def benchmark(context, py=None, save=False, threshold=1.5):
+    """Run the benchmarks and compare them against the baseline."""
+    cmd = f"{get_py(py)} -m benchmarks.benchmark --threshold {threshold}"
+    if save:
+        cmd += " --save"
+    context.run(cmd)
+
+
 @task(doctest, pylint, mypy, coverage)
 @task
 def qa(context, py=None):
@@ -230,7 +239,7 @@ def qa(context, py=None):
 @task
 def black(context, check=False, py=None):
     """Run Black for formatting."""
-    cmd = f"{get_py(py)} -m black {_ROOT} setup.py tasks.py tests"
+    cmd = f"{get_py(py)} -m black {_ROOT} setup.py tasks.py tests benchmarks"
     if check:
         cmd += " --check"
     context.run(cmd)
@@ -239,7 +248,7 @@ def black(context, check=False, py=None):
 @task
 def isort(context, check=False, py=None):
     """Run isort for optimizing imports."""
-    cmd = f"{get_py(py)} -m isort {_ROOT} setup.py tasks.py tests"
+    cmd = f"{get_py(py)} -m isort {_ROOT} setup.py tasks.py tests benchmarks"
     if check:
         cmd += " --check"
     context.run(cmd)
@@ -249,7 +258,7 @@ def isort(context, check=False, py=None):
 def autoflake(context, check=False, py=None):
     """Run autoflake to remove unused imports and variables."""
     cmd = (
-        f"{get_py(py)} -m autoflake {_ROOT} setup.py tasks.py tests --recursive --in-place"
+        f"{get_py(py)} -m autoflake {_ROOT} setup.py tasks.py tests benchmarks --recursive --in-place"
         f" --remove-unused-variables --remove-all-unused-imports --expand-star-imports"
     )
     if check:
@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from typing import Any
 from unittest import TestCase
 
@@ -5,6 +7,7 @@ import pandas as pd
 
 from nptyping import DataFrame, InvalidArgumentsError
 from nptyping import Structure as S
+from nptyping import cache_info
 from nptyping.typing_ import Literal as L
 
 
@@ -42,6 +45,20 @@ class DataframeTest(TestCase):
 
         self.assertNotIsInstance(df, DataFrame[S["x: Float, y: Int, z: Obj"]])
 
+    def test_isinstance_is_cached_per_schema(self):
+        df1 = pd.DataFrame({"cached_a": [1, 2], "cached_b": [1.0, 2.0]})
+        df2 = pd.DataFrame({"cached_a": [3], "cached_b": [4.0]})
+        df3 = pd.DataFrame({"cached_a": [3.0], "cached_b": [4.0]})
+        hits_before = cache_info()["dataframe"].hits
+        misses_before = cache_info()["dataframe"].misses
+
+        self.assertIsInstance(df1, DataFrame[S["cached_a: Int, cached_b: Float"]])
+        self.assertIsInstance(df2, DataFrame[S["cached_a: Int, cached_b: Float"]])
+        self.assertNotIsInstance(df3, DataFrame[S["cached_a: Int, cached_b: Float"]])
+
+        self.assertEqual(hits_before + 1, cache_info()["dataframe"].hits)
+        self.assertEqual(misses_before + 2, cache_info()["dataframe"].misses)
+
     def test_string_is_aliased(self):
         df = pd.DataFrame(
             {
@@ -73,3 +90,14 @@ class DataframeTest(TestCase):
         self.assertEqual("DataFrame[[x, y]: Int]", str(DataFrame[S["x: Int, y: Int"]]))
         self.assertEqual("DataFrame[Any]", str(DataFrame))
         self.assertEqual("DataFrame[Any]", str(DataFrame[Any]))
+
+    def test_pandas_is_imported_lazily(self):
+        script = (
+            "import sys\n"
+            "from nptyping import DataFrame\n"
+            "assert 'pandas' not in sys.modules\n"
+            "isinstance(42, DataFrame)\n"
+            "assert 'pandas' in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from importlib import import_module
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from nptyping import (
+    Bounds,
+    DataFrame,
+    Finite,
+    Float,
+    Int,
+    NDArray,
+    RecArray,
+    Shape,
+    Structure,
+    acheck,
+    checking,
+    parallel,
+)
+
+# The modules, as nptyping exports functions of the same names.
+acheck_module = import_module("nptyping.acheck")
+checking_module = import_module("nptyping.checking")
+
+
+class ACheckTest(TestCase):
+    def test_acheck_ndarray(self):
+        arr = np.zeros((3, 2))
+
+        self.assertTrue(asyncio.run(acheck(arr, NDArray[Shape["3, 2"], Float])))
+        self.assertFalse(asyncio.run(acheck(arr, NDArray[Shape["2, 2"], Float])))
+        self.assertTrue(asyncio.run(acheck(arr, NDArray[Any, Float, Bounds(0, 1)])))
+        self.assertFalse(asyncio.run(acheck(arr, NDArray[Any, Float, Bounds(1, 2)])))
+        self.assertFalse(asyncio.run(acheck(arr, NDArray[Any, Int, Finite])))
+        self.assertFalse(asyncio.run(acheck(arr, RecArray[Any, Any])))
+
+    def test_acheck_dataframe(self):
+        df = pd.DataFrame({"x": [1.0], "y": [2]})
+
+        self.assertTrue(asyncio.run(acheck(df, DataFrame)))
+        self.assertTrue(
+            asyncio.run(acheck(df, DataFrame[Structure["x: Float, y: Int"]]))
+        )
+        self.assertFalse(asyncio.run(acheck(df, DataFrame[Structure["x: Int"]])))
+
+    def test_acheck_other_types(self):
+        self.assertTrue(asyncio.run(acheck(42, int)))
+        self.assertFalse(asyncio.run(acheck("42", int)))
+
+    def test_acheck_respects_checking_mode(self):
+        arr = np.zeros((3, 2))
+
+        with checking("off"):
+            self.assertTrue(asyncio.run(acheck(arr, NDArray[Shape["2, 2"], Float])))
+
+    def test_acheck_with_checking_off_checks_the_type_only(self):
+        arr = np.zeros((3, 2))
+        df = pd.DataFrame({"x": [1]})
+
+        with patch.multiple(
+            checking_module,
+            _process_mode=("off", 1.0),
+            _is_context_used=False,
+            _is_always_on=False,
+        ):
+            self.assertTrue(asyncio.run(acheck(arr, NDArray[Shape["2"], Int])))
+            self.assertFalse(asyncio.run(acheck(arr, RecArray[Any, Any])))
+            self.assertTrue(asyncio.run(acheck(df, DataFrame[Structure["y: Str"]])))
+            self.assertFalse(asyncio.run(acheck(arr, DataFrame[Any])))
+            self.assertFalse(asyncio.run(acheck("42", int)))
+            # The fast path of the checking mode is kept.
+            self.assertFalse(checking_module._is_context_used)
+
+    def test_acheck_with_timeout_stops_the_check(self):
+        stops = []
+
+        def _check_values_in_parallel(array, constraints, stop):
+            stops.append(stop)
+            while not stop.is_set():
+                time.sleep(0.001)
+            return False
+
+        arr = np.zeros((3, 2))
+        with patch.object(
+            acheck_module, "check_values_in_parallel", _check_values_in_parallel
+        ):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(acheck(arr, NDArray[Any, Float, Finite], timeout=0.01))
+
+        self.assertTrue(stops[0].is_set())
+
+    def test_acheck_shares_the_thread_pool_settings(self):
+        arr = np.random.rand(1000)
+        max_workers, min_size = parallel._max_workers, parallel._min_size
+        parallel.configure_parallelism(max_workers=2, min_size=10)
+        try:
+            self.assertTrue(asyncio.run(acheck(arr, NDArray[Any, Float, Bounds(0, 1)])))
+        finally:
+            parallel.configure_parallelism(max_workers=max_workers, min_size=min_size)
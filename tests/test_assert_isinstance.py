@@ -1,6 +1,18 @@
+from importlib import import_module
 from unittest import TestCase
+from unittest.mock import patch
 
-from nptyping import assert_isinstance
+import numpy as np
+
+from nptyping import (
+    Float,
+    NDArray,
+    Shape,
+    assert_isinstance,
+)
+
+# The module, as nptyping exports a function of the same name.
+assert_isinstance_module = import_module("nptyping.assert_isinstance")
 
 
 class AssertInstanceTest(TestCase):
@@ -16,3 +28,18 @@ class AssertInstanceTest(TestCase):
         with self.assertRaises(AssertionError) as err:
             assert_isinstance(1, str, "That's no string")
         self.assertIn("That's no string", str(err.exception))
+
+    def test_assert_isinstance_false_with_array(self):
+        with self.assertRaises(AssertionError) as err:
+            assert_isinstance(np.zeros((1000, 3)), NDArray[Shape["*, 2"], Float])
+        self.assertEqual(
+            "instance=ndarray(shape=(1000, 3), dtype=float64),"
+            " cls=NDArray[Shape['*, 2'], Float]:"
+            " dimension 1 of shape (1000, 3) has size 3, expected 2",
+            str(err.exception),
+        )
+
+    def test_assert_isinstance_creates_no_message_on_success(self):
+        with patch.object(assert_isinstance_module, "explain") as explain:
+            assert_isinstance(np.zeros((3, 2)), NDArray[Shape["*, 2"], Float])
+        explain.assert_not_called()
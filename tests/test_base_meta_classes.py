@@ -11,6 +11,7 @@ from nptyping.base_meta_classes import (
     SubscriptableMeta,
 )
 from nptyping.error import NPTypingError
+from nptyping.typing_ import Literal
 
 
 class SubscriptableMetaTest(TestCase):
@@ -144,3 +145,53 @@ class SubscriptableMetaTest(TestCase):
             TestContainer["forbidden"]
 
         self.assertFalse(issubclass(int, TestContainer))
+
+    def test_container_meta_caches_types_by_expression(self):
+        validated = []
+
+        class TestContainerMeta(ContainerMeta, implementation="TestContainer"):
+            def _normalize_expression(cls, item: str) -> str:
+                return item.lower()
+
+            def _validate_expression(cls, item: str) -> None:
+                validated.append(item)
+
+        class TestContainer(metaclass=TestContainerMeta):
+            __args__ = (42,)
+
+        container = TestContainer["TeSt"]
+
+        self.assertIs(container, TestContainer["TeSt"])
+        self.assertIs(container, TestContainer["test"])
+        self.assertIs(container, TestContainer["TEST"])
+        self.assertEqual(["TeSt", "TEST"], validated)
+
+    def test_container_meta_equality_does_not_normalize_containers(self):
+        normalized = []
+
+        class TestContainerMeta(ContainerMeta, implementation="TestContainer"):
+            def _normalize_expression(cls, item: str) -> str:
+                normalized.append(item)
+                return item.lower()
+
+            def _validate_expression(cls, item: str) -> None:
+                if item == "forbidden":
+                    raise NPTypingError("That item is forbidden.")
+
+        class TestContainer(metaclass=TestContainerMeta):
+            __args__ = (42,)
+
+        container = TestContainer["test"]
+        other_container = TestContainer["other"]
+        normalized.clear()
+
+        self.assertEqual(container, container)
+        self.assertNotEqual(container, other_container)
+        self.assertNotEqual(container, int)
+        self.assertEqual([], normalized)
+        self.assertEqual(container, Literal["TEST"])
+        self.assertEqual(container, Literal["TEST"])
+        self.assertEqual(["TEST"], normalized)
+        self.assertNotEqual(container, Literal["forbidden"])
+        self.assertNotEqual(container, Literal["test", "other"])
+        self.assertNotEqual(container, 42)
@@ -0,0 +1,163 @@
+from threading import Thread
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    CacheInfo,
+    InvalidArgumentsError,
+    NDArray,
+    Shape,
+    Structure,
+    cache_info,
+    configure_cache,
+)
+from nptyping.cache import LRUCache
+
+
+class CacheTest(TestCase):
+    def test_lru_cache_get_and_put(self):
+        cache = LRUCache(2)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(42, cache.get("a", 42))
+        cache.put("a", 1)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(CacheInfo(1, 2, 0, 2, 1), cache.info())
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(3, cache.get("c"))
+        self.assertEqual(1, cache.info().evictions)
+
+    def test_lru_cache_resize_and_clear(self):
+        cache = LRUCache(3)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        cache.resize(1)
+
+        self.assertEqual(CacheInfo(0, 0, 2, 1, 1), cache.info())
+        cache.clear()
+        self.assertEqual(CacheInfo(0, 0, 0, 1, 0), cache.info())
+
+    def test_lru_cache_with_maxsize_0_stores_nothing(self):
+        cache = LRUCache(0)
+        cache.put("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_cache_info_reports_shape_checks(self):
+        # The shapes of sub arrays are checked with the shape cache.
+        structure = Structure["x: Floating[ShapeCacheVar, ShapeCacheVar]"]
+        hits_before = cache_info()["shape"].hits
+
+        isinstance(np.zeros(1, [("x", np.float64, (3, 3))]), NDArray[Any, structure])
+        isinstance(np.zeros(1, [("x", np.float32, (3, 3))]), NDArray[Any, structure])
+
+        self.assertEqual(hits_before + 1, cache_info()["shape"].hits)
+
+    def test_configure_shape_cache(self):
+        maxsize_before = cache_info()["shape"].maxsize
+        try:
+            configure_cache(shape_maxsize=1)
+            self.assertEqual(1, cache_info()["shape"].maxsize)
+            self.assertLessEqual(cache_info()["shape"].currsize, 1)
+        finally:
+            configure_cache(shape_maxsize=maxsize_before)
+        self.assertEqual(maxsize_before, cache_info()["shape"].maxsize)
+
+    def test_configure_structure_cache(self):
+        maxsize_before = cache_info()["structure"].maxsize
+        try:
+            configure_cache(structure_maxsize=2)
+            self.assertEqual(2, cache_info()["structure"].maxsize)
+            self.assertEqual(maxsize_before, cache_info()["shape"].maxsize)
+        finally:
+            configure_cache(structure_maxsize=maxsize_before)
+
+    def test_cache_info_reports_ndarray_checks(self):
+        ndarray = NDArray[Shape["NDArrayCacheVar"], Structure["x: Float"]]
+        info_before = cache_info()["ndarray"]
+
+        self.assertTrue(isinstance(np.zeros(3, [("x", float)]), ndarray))
+        self.assertTrue(isinstance(np.zeros(3, [("x", float)]), ndarray))
+        self.assertFalse(isinstance(np.zeros(3, [("x", int)]), ndarray))
+        self.assertFalse(isinstance(np.zeros(3, [("x", int)]), ndarray))
+        self.assertFalse(isinstance([(1.0,)], ndarray))
+
+        info = cache_info()["ndarray"]
+        self.assertEqual(info_before.hits + 2, info.hits)
+        self.assertEqual(info_before.misses + 2, info.misses)
+
+    def test_ndarray_checks_without_structure_are_not_cached(self):
+        ndarray = NDArray[Shape["*, 42"], np.floating]
+        info_before = cache_info()["ndarray"]
+
+        self.assertTrue(isinstance(np.zeros((3, 42)), ndarray))
+        self.assertFalse(isinstance(np.zeros((3, 42), int), ndarray))
+        self.assertFalse(isinstance(np.zeros((3, 42)), NDArray[Any, np.integer]))
+
+        self.assertEqual(info_before, cache_info()["ndarray"])
+
+    def test_configure_ndarray_cache(self):
+        ndarray = NDArray[Shape["2"], Structure["x: Float"]]
+        maxsize_before = cache_info()["ndarray"].maxsize
+        try:
+            configure_cache(ndarray_maxsize=0)
+            self.assertEqual(0, cache_info()["ndarray"].currsize)
+            self.assertTrue(isinstance(np.zeros(2, [("x", float)]), ndarray))
+            self.assertFalse(isinstance(np.zeros(3, [("x", float)]), ndarray))
+            self.assertEqual(0, cache_info()["ndarray"].currsize)
+        finally:
+            configure_cache(ndarray_maxsize=maxsize_before)
+
+    def test_configure_cache_with_invalid_maxsize(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            configure_cache(shape_maxsize=-1)
+
+        self.assertEqual(
+            "Unexpected maxsize -1 for the shape cache, expecting an int of 0 or"
+            " more.",
+            str(err.exception),
+        )
+
+    def test_configure_cache_with_bool_maxsize(self):
+        with self.assertRaises(InvalidArgumentsError):
+            configure_cache(shape_maxsize=True)
+
+    def test_configure_cache_validates_all_sizes_first(self):
+        maxsize_before = cache_info()["shape"].maxsize
+
+        with self.assertRaises(InvalidArgumentsError):
+            configure_cache(shape_maxsize=maxsize_before + 1, structure_maxsize=-1)
+
+        self.assertEqual(maxsize_before, cache_info()["shape"].maxsize)
+
+    def test_lru_cache_with_concurrent_use(self):
+        cache = LRUCache(8)
+
+        def use_cache(offset):
+            for i in range(2000):
+                key = (offset + i) % 16
+                if cache.get(key) is None:
+                    cache.put(key, i + 1)
+
+        threads = [Thread(target=use_cache, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        self.assertEqual(8, info.currsize)
+        self.assertLessEqual(info.hits + info.misses, 8000)
@@ -0,0 +1,172 @@
+import asyncio
+import inspect
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Annotated
+
+from nptyping import (
+    Bounds,
+    DataFrame,
+    Finite,
+    Float,
+    Int,
+    InvalidInstanceError,
+    NDArray,
+    Shape,
+    Structure,
+    check,
+    checking,
+)
+
+
+class CheckTest(TestCase):
+    def test_check_succeeds(self):
+        @check
+        def func(x: NDArray[Shape["N, D"], Float]) -> NDArray[Shape["N"], Float]:
+            return x.sum(axis=1)
+
+        result = func(np.zeros((3, 2)))
+
+        self.assertEqual((3,), result.shape)
+
+    def test_check_fails_on_argument(self):
+        @check
+        def func(x: NDArray[Shape["N, D"], Float]) -> None:
+            ...
+
+        with self.assertRaises(InvalidInstanceError) as err:
+            func(np.zeros((3, 2), dtype=int))
+
+        self.assertIn("Argument 'x' of", str(err.exception))
+        self.assertIn(
+            "is not an instance of NDArray[Shape['N, D'], Float]: "
+            "dtype int64 is not a Float.",
+            str(err.exception),
+        )
+
+    def test_check_fails_on_return_value(self):
+        @check
+        def func(x: NDArray[Shape["N, D"], Float]) -> NDArray[Shape["N"], Float]:
+            return x.sum(axis=0)
+
+        with self.assertRaises(InvalidInstanceError) as err:
+            func(np.zeros((3, 2)))
+
+        self.assertIn("The return value of", str(err.exception))
+        self.assertIn(
+            "has shape (2,), which does not correspond to Shape['N'] with the"
+            " variables {'N': 3, 'D': 2} of the same call.",
+            str(err.exception),
+        )
+
+    def test_check_shares_variables_between_arguments(self):
+        @check
+        def func(x: NDArray[Shape["N, D"], Float], y: NDArray[Shape["N"], Any]) -> None:
+            ...
+
+        func(np.zeros((3, 2)), np.zeros((3,)))
+        func(np.zeros((4, 2)), y=np.zeros((4,)))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.zeros((3, 2)), np.zeros((4,)))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.zeros((3, 2)), y=np.zeros((4,)))
+
+    def test_check_with_variadic_arguments(self):
+        @check
+        def func(
+            *args: NDArray[Shape["N"], Int], **kwargs: NDArray[Shape["N"], Int]
+        ) -> None:
+            ...
+
+        func(np.zeros((2,), dtype=int), np.zeros((2,), dtype=int))
+        func(x=np.zeros((2,), dtype=int), y=np.zeros((2,), dtype=int))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.zeros((2,), dtype=int), np.zeros((3,), dtype=int))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.zeros((2,), dtype=int), x=np.zeros((3,), dtype=int))
+
+    def test_check_with_keyword_only_and_defaults(self):
+        @check
+        def func(
+            x: NDArray[Shape["N"], Any],
+            *,
+            y: NDArray[Shape["N"], Any] = np.zeros((5,)),
+        ) -> None:
+            ...
+
+        func(np.zeros((2,)))
+        func(np.zeros((2,)), y=np.zeros((2,)))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.zeros((2,)), y=np.zeros((3,)))
+
+    def test_check_ignores_other_hints(self):
+        @check
+        def func(x: int, y) -> str:
+            return x
+
+        self.assertEqual(42, func(42, None))
+
+    def test_check_describes_other_values_by_their_type(self):
+        @check
+        def func(x: NDArray[Any, Any]) -> None:
+            ...
+
+        with self.assertRaises(InvalidInstanceError) as err:
+            func([1, 2, 3])
+
+        self.assertIn(
+            "NDArray[Any, Any]: expected an instance of ndarray, got list.",
+            str(err.exception),
+        )
+
+    def test_check_with_dataframe(self):
+        @check
+        def func(df: DataFrame[Structure["x: Int"]]) -> None:
+            ...
+
+        func(pd.DataFrame({"x": [1, 2]}))
+        with self.assertRaises(InvalidInstanceError) as err:
+            func(pd.DataFrame({"x": [1.0, 2.0]}))
+
+        self.assertIn("is not an instance of DataFrame[x: Int]", str(err.exception))
+        self.assertIn(
+            ": field 'x' has dtype float64, expected Int.", str(err.exception)
+        )
+
+    def test_check_with_coroutine_function(self):
+        @check
+        async def func(x: NDArray[Shape["N, D"], Float]) -> NDArray[Shape["N"], Float]:
+            return x.sum(axis=1) if x.shape[1] else x.sum(axis=0)
+
+        self.assertTrue(inspect.iscoroutinefunction(func))
+        result = asyncio.run(func(np.zeros((3, 2))))
+        self.assertEqual((3,), result.shape)
+        with self.assertRaises(InvalidInstanceError) as err:
+            asyncio.run(func(np.zeros((3, 0))))
+        self.assertIn("The return value of", str(err.exception))
+        with self.assertRaises(InvalidInstanceError):
+            asyncio.run(func(np.zeros((3, 2), dtype=int)))
+        with checking("off"):
+            asyncio.run(func(np.zeros((3, 2), dtype=int)))
+
+    def test_check_with_value_constraints_in_annotated(self):
+        @check
+        def func(
+            x: Annotated[NDArray[Shape["N"], Float], Bounds(0, 1), "other"],
+            y: Annotated[NDArray[Any, Float], "no constraints"],
+            z: Annotated[int, Bounds(0, 1)],
+        ) -> Annotated[NDArray[Shape["N"], Float], Finite]:
+            return x / y
+
+        func(np.array([0.5]), np.array([1.0]), 2)
+        with self.assertRaises(InvalidInstanceError) as err:
+            func(np.array([1.5]), np.array([1.0]), 2)
+        self.assertIn("Float, Bounds(0, 1)]: values in rows 0 to 1", str(err.exception))
+        with self.assertRaises(InvalidInstanceError):
+            func(np.array([0.5]), np.array([1]), 2)
+        with self.assertRaises(InvalidInstanceError) as err:
+            func(np.array([0.5]), np.array([0.0]), 2)
+        self.assertIn("The return value of", str(err.exception))
@@ -0,0 +1,68 @@
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    Bounds,
+    Float,
+    Int,
+    NDArray,
+    RecArray,
+    Shape,
+    check_all,
+)
+
+
+class CheckAllTest(TestCase):
+    def test_check_all(self):
+        arrays = [
+            np.zeros((2, 3)),
+            np.zeros((2, 3)),
+            np.zeros((3, 3)),
+            np.zeros((2, 3), dtype=int),
+            np.zeros((4, 3)),
+        ]
+
+        result = check_all(arrays, NDArray[Shape["2, 3"], Float])
+
+        self.assertEqual([True, True, False, False, False], result)
+
+    def test_check_all_with_variables(self):
+        arrays = [np.zeros((2, 2)), np.zeros((2, 3)), np.zeros((3, 3))]
+
+        result = check_all(arrays, NDArray[Shape["N, N"], Any])
+
+        self.assertEqual([True, False, True], result)
+
+    def test_check_all_with_non_arrays(self):
+        instances = [np.zeros((2,), dtype=int), [1, 2], 42, None]
+
+        result = check_all(instances, NDArray[Shape["2"], Int])
+
+        self.assertEqual([True, False, False, False], result)
+
+    def test_check_all_takes_the_array_type_into_account(self):
+        dtype = [("x", float)]
+        instances = [np.zeros((2,), dtype=dtype), np.recarray((2,), dtype=dtype)]
+
+        result = check_all(instances, RecArray[Any, Any])
+
+        self.assertEqual([False, True], result)
+
+    def test_check_all_with_other_types(self):
+        self.assertEqual([True, False], check_all([1, "1"], int))
+
+    def test_check_all_with_an_iterator(self):
+        arrays = (np.zeros((i,)) for i in range(3))
+
+        result = check_all(arrays, NDArray[Shape["2"], Any])
+
+        self.assertEqual([False, False, True], result)
+
+    def test_check_all_with_value_constraints(self):
+        arrays = [np.zeros((2,)), np.ones((2,)), np.full((2,), 2.0)]
+
+        result = check_all(arrays, NDArray[Shape["2"], Float, Bounds(0, 1)])
+
+        self.assertEqual([True, True, False], result)
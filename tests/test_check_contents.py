@@ -0,0 +1,77 @@
+import os
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    Bounds,
+    Excludes,
+    Finite,
+    Float,
+    InvalidArgumentsError,
+    NDArray,
+    RecArray,
+    Shape,
+    check_contents,
+)
+
+
+class CheckContentsTest(TestCase):
+    def test_check_contents(self):
+        arr = np.arange(1000, dtype=float).reshape(100, 10)
+
+        self.assertTrue(check_contents(arr, NDArray[Shape["*, 10"], Float]))
+        self.assertTrue(
+            check_contents(arr, NDArray[Any, Float, Bounds(0, 999), Finite], 64)
+        )
+        self.assertFalse(check_contents(arr, NDArray[Any, Float, Excludes(500)], 64))
+        self.assertFalse(check_contents(arr, NDArray[Shape["*, 11"], Float, Finite]))
+        self.assertFalse(check_contents([1.0], NDArray[Any, Float, Finite]))
+
+    def test_check_contents_with_memmap(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "arr.npy")
+            arr = np.lib.format.open_memmap(
+                path, mode="w+", dtype=float, shape=(1000, 100)
+            )
+            arr[:] = 0.5
+            arr[-1, -1] = -9999
+            arr.flush()
+            del arr
+
+            mapped = np.load(path, mmap_mode="r")
+            self.assertTrue(check_contents(mapped, NDArray[Any, Float, Bounds(-9999)]))
+            self.assertFalse(
+                check_contents(mapped, NDArray[Any, Float, Excludes(-9999)], 1000)
+            )
+            self.assertTrue(
+                check_contents(mapped[:-1], NDArray[Any, Float, Excludes(-9999)])
+            )
+            del mapped
+
+            writable = np.load(path, mmap_mode="r+")
+            self.assertFalse(check_contents(writable, NDArray[Any, Float, Bounds(0)]))
+            del writable
+
+    def test_check_contents_with_recarray(self):
+        arr = np.array([(1.0,)], dtype=[("x", float)])
+
+        self.assertFalse(check_contents(arr, RecArray[Any, Any]))
+        self.assertTrue(check_contents(arr.view(np.recarray), RecArray[Any, Any]))
+
+    def test_check_contents_with_invalid_arguments(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            check_contents(np.zeros(3), int)
+        self.assertEqual(
+            "Unexpected argument <class 'int'>, expecting an NDArray or a RecArray.",
+            str(err.exception),
+        )
+
+        with self.assertRaises(InvalidArgumentsError) as err:
+            check_contents(np.zeros(3), NDArray, block_size=0)
+        self.assertEqual(
+            "Unexpected block_size 0, expecting an int of 1 or more.",
+            str(err.exception),
+        )
@@ -0,0 +1,101 @@
+import io
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    Finite,
+    Float,
+    Int,
+    InvalidArgumentsError,
+    NDArray,
+    NpyCheck,
+    RecArray,
+    Shape,
+    Structure,
+    check_npy,
+)
+
+
+def _to_npy_file(arr: np.ndarray, version=None) -> io.BytesIO:
+    npy_file = io.BytesIO()
+    np.lib.format.write_array(npy_file, arr, version=version)
+    npy_file.seek(0)
+    return npy_file
+
+
+class CheckNpyTest(TestCase):
+    def test_check_npy(self):
+        npy_file = _to_npy_file(np.zeros((2, 3)))
+
+        outcome = check_npy(npy_file, NDArray[Shape["*, 3"], Float])
+
+        self.assertEqual(
+            NpyCheck(True, (2, 3), np.dtype(float), False, npy_file.tell()), outcome
+        )
+        self.assertTrue(outcome)
+
+    def test_check_npy_reads_only_the_header(self):
+        npy_file = _to_npy_file(np.zeros((1000, 1000)))
+
+        outcome = check_npy(npy_file, NDArray[Shape["1000, 1000"], Float])
+
+        self.assertTrue(outcome)
+        self.assertEqual(128, npy_file.tell())
+
+    def test_check_npy_fails(self):
+        arr = np.zeros((2, 3))
+
+        self.assertFalse(check_npy(_to_npy_file(arr), NDArray[Shape["*, 4"], Float]))
+        self.assertFalse(check_npy(_to_npy_file(arr), NDArray[Shape["2, 3"], Int]))
+        self.assertFalse(check_npy(_to_npy_file(arr), RecArray[Any, Any]))
+
+    def test_check_npy_with_all_versions(self):
+        arr = np.zeros((2, 3), order="F")
+        for version in [(1, 0), (2, 0), (3, 0)]:
+            outcome = check_npy(
+                _to_npy_file(arr, version), NDArray[Shape["2, 3"], Float]
+            )
+
+            self.assertTrue(outcome, version)
+            self.assertTrue(outcome.fortran_order, version)
+
+    def test_check_npy_with_structure(self):
+        arr = np.zeros(3, dtype=[("x", int), ("y", float)])
+        npy_file = _to_npy_file(arr)
+
+        self.assertTrue(
+            check_npy(npy_file, NDArray[Any, Structure["x: Int, y: Float"]])
+        )
+        npy_file.seek(0)
+        self.assertFalse(check_npy(npy_file, NDArray[Any, Structure["x: Float, *"]]))
+
+    def test_check_npy_with_path_and_memmap(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "arr.npy")
+            np.save(path, np.arange(6.0).reshape(2, 3))
+
+            outcome = check_npy(Path(path), NDArray[Shape["2, 3"], Float])
+            self.assertTrue(outcome)
+            self.assertTrue(check_npy(path, NDArray[Shape["2, 3"], Float]))
+
+            data = np.memmap(
+                path, outcome.dtype, "r", outcome.offset, outcome.shape, "C"
+            )
+            self.assertEqual(5.0, data[1, 2])
+            del data
+
+    def test_check_npy_with_invalid_arguments(self):
+        npy_file = _to_npy_file(np.zeros(3))
+
+        with self.assertRaises(InvalidArgumentsError):
+            check_npy(npy_file, int)
+        with self.assertRaises(InvalidArgumentsError) as err:
+            check_npy(npy_file, NDArray[Any, Float, Finite])
+        self.assertIn("value constraints cannot be checked", str(err.exception))
+        with self.assertRaises(ValueError):
+            check_npy(io.BytesIO(b"not a npy file"), NDArray)
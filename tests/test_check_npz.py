@@ -0,0 +1,95 @@
+import io
+import os
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+from zipfile import ZipFile
+
+import numpy as np
+
+from nptyping import (
+    Finite,
+    Float,
+    Int,
+    InvalidArgumentsError,
+    NDArray,
+    NpzCheck,
+    Shape,
+    check_npz,
+)
+
+
+class _CountingBytesIO(io.BytesIO):
+    # Counts the number of bytes that are read.
+    nr_of_bytes_read = 0
+
+    def read(self, size=-1):
+        result = super().read(size)
+        self.nr_of_bytes_read += len(result)
+        return result
+
+
+class CheckNpzTest(TestCase):
+    def test_check_npz(self):
+        npz_file = io.BytesIO()
+        np.savez_compressed(npz_file, a=np.zeros((2, 3)), b=np.arange(3))
+        npz_file.seek(0)
+
+        outcome = check_npz(
+            npz_file,
+            {"a": NDArray[Shape["2, 3"], Float], "b": NDArray[Shape["N"], Int]},
+        )
+
+        self.assertTrue(outcome)
+        self.assertEqual(([], [], []), outcome[:3])
+        self.assertEqual((2, 3), outcome.checks["a"].shape)
+        self.assertTrue(outcome.checks["b"])
+
+    def test_check_npz_reports_missing_extra_and_failed_members(self):
+        npz_file = io.BytesIO()
+        np.savez(npz_file, a=np.zeros((2, 3)), b=np.arange(3), c=np.zeros(1))
+        npz_file.seek(0)
+
+        outcome = check_npz(
+            npz_file,
+            {"a": NDArray[Any, Float], "b": NDArray[Any, Float], "d": NDArray},
+        )
+
+        self.assertFalse(outcome)
+        self.assertEqual(["d"], outcome.missing)
+        self.assertEqual(["c"], outcome.extra)
+        self.assertEqual(["b"], outcome.failed)
+        self.assertEqual({"a", "b"}, set(outcome.checks))
+        self.assertFalse(NpzCheck(["d"], [], [], {}))
+        self.assertFalse(NpzCheck([], ["c"], [], {}))
+
+    def test_check_npz_reports_other_files_as_extra(self):
+        npz_file = io.BytesIO()
+        np.savez(npz_file, a=np.zeros(3))
+        with ZipFile(npz_file, "a") as archive:
+            archive.writestr("notes.txt", "not an array")
+
+        outcome = check_npz(npz_file, {"a": NDArray})
+
+        self.assertEqual(["notes.txt"], outcome.extra)
+
+    def test_check_npz_reads_only_the_headers(self):
+        npz_file = _CountingBytesIO()
+        np.savez(npz_file, a=np.zeros((1000, 1000)), b=np.zeros((1000, 1000)))
+        npz_file.seek(0)
+
+        outcome = check_npz(npz_file, {"a": NDArray, "b": NDArray})
+
+        self.assertTrue(outcome)
+        self.assertLess(npz_file.nr_of_bytes_read, 100_000)
+
+    def test_check_npz_with_path(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "arrays.npz")
+            np.savez(path, a=np.zeros(3))
+
+            self.assertTrue(check_npz(path, {"a": NDArray[Shape["3"], Float]}))
+
+    def test_check_npz_with_invalid_schema(self):
+        with self.assertRaises(InvalidArgumentsError):
+            check_npz(io.BytesIO(), {"a": NDArray[Any, Float, Finite]})
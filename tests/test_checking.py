@@ -0,0 +1,145 @@
+import asyncio
+from importlib import import_module
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from nptyping import (
+    DataFrame,
+    Float,
+    Int,
+    InvalidArgumentsError,
+    NDArray,
+    RecArray,
+    Shape,
+    Structure,
+    check,
+    checking,
+    set_checking,
+)
+from nptyping.checking import should_check
+
+# The module, as nptyping exports a function of the same name.
+checking_module = import_module("nptyping.checking")
+
+
+class CheckingTest(TestCase):
+    def tearDown(self):
+        set_checking("on")
+
+    def test_checking_off(self):
+        arr = np.zeros((2, 2))
+
+        with checking("off"):
+            self.assertIsInstance(arr, NDArray[Shape["3, 3"], Int])
+            self.assertNotIsInstance([1, 2], NDArray[Shape["3, 3"], Int])
+
+        self.assertNotIsInstance(arr, NDArray[Shape["3, 3"], Int])
+
+    def test_checking_off_with_recarray_and_dataframe(self):
+        rec_arr = np.recarray((2,), dtype=[("x", float)])
+        df = pd.DataFrame({"x": [1.0]})
+
+        with checking("off"):
+            self.assertIsInstance(rec_arr, RecArray[Shape["3"], Structure["y: Int"]])
+            self.assertNotIsInstance(
+                np.zeros((2,)), RecArray[Shape["3"], Structure["y: Int"]]
+            )
+            self.assertIsInstance(df, DataFrame[Structure["y: Int"]])
+            self.assertNotIsInstance(rec_arr, DataFrame[Structure["y: Int"]])
+
+        self.assertNotIsInstance(rec_arr, RecArray[Shape["3"], Structure["y: Int"]])
+        self.assertNotIsInstance(df, DataFrame[Structure["y: Int"]])
+
+    def test_checking_sample(self):
+        arr = np.zeros((2, 2))
+
+        with checking("sample", rate=0.5):
+            with patch.object(checking_module, "random", return_value=0.4):
+                self.assertNotIsInstance(arr, NDArray[Shape["3, 3"], Int])
+            with patch.object(checking_module, "random", return_value=0.6):
+                self.assertIsInstance(arr, NDArray[Shape["3, 3"], Int])
+
+    def test_set_checking_applies_to_other_threads(self):
+        results = []
+
+        def _check():
+            results.append(isinstance(np.zeros((2,)), NDArray[Shape["3"], Float]))
+
+        set_checking("off")
+        thread = Thread(target=_check)
+        thread.start()
+        thread.join()
+
+        self.assertEqual([True], results)
+
+    def test_checking_is_scoped_per_task(self):
+        arr = np.zeros((2,))
+
+        async def _check(mode):
+            with checking(mode):
+                await asyncio.sleep(0)
+                return isinstance(arr, NDArray[Shape["3"], Float])
+
+        async def _main():
+            return await asyncio.gather(_check("off"), _check("on"))
+
+        self.assertEqual([True, False], asyncio.run(_main()))
+
+    def test_checking_outlives_its_scope_in_a_task(self):
+        arr = np.zeros((2,))
+
+        async def _check():
+            await asyncio.sleep(0)
+            return isinstance(arr, NDArray[Shape["3"], Float])
+
+        async def _main():
+            with checking("off"):
+                task = asyncio.create_task(_check())
+            return await task
+
+        with patch.multiple(
+            checking_module, _is_context_used=False, _is_always_on=True
+        ):
+            self.assertTrue(asyncio.run(_main()))
+
+    def test_modes_are_only_looked_up_when_set(self):
+        with patch.multiple(
+            checking_module, _is_context_used=False, _is_always_on=True
+        ), patch.object(checking_module, "_context_mode") as context_mode:
+            context_mode.get.return_value = None
+            self.assertTrue(should_check())
+            set_checking("off")
+            self.assertFalse(should_check())
+            set_checking("on")
+            self.assertTrue(should_check())
+            context_mode.get.assert_called_once_with()
+
+    def test_checking_off_in_check_decorator(self):
+        @check
+        def func(x: NDArray[Shape["N"], Float], y: NDArray[Shape["N"], Float]):
+            ...
+
+        with checking("off"):
+            func(np.zeros((2,)), np.zeros((3,)))
+
+    def test_invalid_mode_and_rate(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            set_checking("sometimes")
+
+        self.assertEqual(
+            "Unexpected checking mode 'sometimes', expecting 'on', 'off' or 'sample'.",
+            str(err.exception),
+        )
+
+        with self.assertRaises(InvalidArgumentsError) as err:
+            with checking("sample", rate=2):
+                ...
+
+        self.assertEqual(
+            "Unexpected rate 2, expecting a number between 0 and 1.",
+            str(err.exception),
+        )
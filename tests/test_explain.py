@@ -0,0 +1,140 @@
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from nptyping import (
+    Bounds,
+    DataFrame,
+    Finite,
+    Float,
+    Int,
+    NDArray,
+    RecArray,
+    Shape,
+    Structure,
+    explain,
+)
+from nptyping.explain import _explain_array
+
+
+class ExplainTest(TestCase):
+    def test_explain_returns_none_on_success(self):
+        self.assertIsNone(explain(np.zeros((3, 2)), NDArray[Shape["N, 2"], Float]))
+        self.assertIsNone(explain(pd.DataFrame({"x": [1]}), DataFrame))
+        self.assertIsNone(explain(42, int))
+
+    def test_explain_type(self):
+        mismatch = explain([1.0], NDArray[Any, Float])
+
+        self.assertEqual("type", mismatch.kind)
+        self.assertEqual("expected an instance of ndarray, got list", str(mismatch))
+
+        mismatch = explain(np.zeros(2, [("x", int)]), RecArray[Any, Any])
+
+        self.assertEqual(
+            "expected an instance of recarray, got ndarray(shape=(2,),"
+            " dtype=[('x', '<i8')])",
+            str(mismatch),
+        )
+        self.assertEqual("expected an instance of str, got int", str(explain(42, str)))
+
+    def test_explain_shape(self):
+        mismatch = explain(np.zeros((3, 4)), NDArray[Shape["N, N"], Float])
+
+        self.assertEqual("shape", mismatch.kind)
+        self.assertEqual(1, mismatch.dimension)
+        self.assertEqual({"N": 3}, mismatch.variables)
+        self.assertEqual(
+            "dimension 1 of shape (3, 4) has size 4, expected N=3", mismatch.message
+        )
+
+        mismatch = explain(np.zeros((3, 4)), NDArray[Shape["3, 5"], Float])
+
+        self.assertEqual(1, mismatch.dimension)
+        self.assertEqual(
+            "dimension 1 of shape (3, 4) has size 4, expected 5", mismatch.message
+        )
+
+    def test_explain_number_of_dimensions(self):
+        mismatch = explain(np.zeros((3,)), NDArray[Shape["N, N"], Float])
+
+        self.assertIsNone(mismatch.dimension)
+        self.assertEqual("shape (3,) has 1 dimension(s), expected 2", mismatch.message)
+
+        mismatch = explain(np.zeros((3,)), NDArray[Shape["N, N, ..."], Float])
+
+        self.assertEqual(
+            "shape (3,) has 1 dimension(s), expected at least 2", mismatch.message
+        )
+
+    def test_explain_dtype(self):
+        mismatch = explain(np.zeros(3, dtype=int), NDArray[Any, Float])
+
+        self.assertEqual("dtype", mismatch.kind)
+        self.assertEqual("dtype int64 is not a Float", mismatch.message)
+
+    def test_explain_structure(self):
+        arr = np.zeros(3, [("x", int), ("y", int), ("z", int, (2,))])
+
+        def _explain(structure_expression):
+            return explain(arr, NDArray[Any, Structure[structure_expression]])
+
+        mismatch = _explain("x: Int, y: Float, z: Int")
+        self.assertEqual("structure", mismatch.kind)
+        self.assertEqual("y", mismatch.field)
+        self.assertEqual("field 'y' has dtype int64, expected Float", str(mismatch))
+        self.assertEqual("field 'a' is missing", str(_explain("a: Int, *")))
+        self.assertEqual(
+            "field 'z' is not in Structure['[x, y]: Int']",
+            str(_explain("x: Int, y: Int")),
+        )
+        self.assertEqual(
+            "field 'z' has shape (2,), expected Shape['3']",
+            str(_explain("x: Int, y: Int, z: Int[3]")),
+        )
+        self.assertEqual(
+            "field 'x' has dtype int64, expected a subarray of Shape['2']",
+            str(_explain("x: Int[2], y: Int, z: Int[2]")),
+        )
+
+    def test_explain_values(self):
+        arr = np.zeros((100_000, 2))
+        arr[80_000, 1] = np.inf
+
+        mismatch = explain(arr, NDArray[Any, Float, Bounds(0), Finite])
+
+        self.assertEqual("values", mismatch.kind)
+        self.assertEqual(Finite, mismatch.constraint)
+        self.assertEqual((65536, 98304), mismatch.rows)
+        self.assertEqual(
+            "values in rows 65536 to 98304 violate Finite", mismatch.message
+        )
+        self.assertEqual(
+            "values in rows 0 to 1 violate Bounds(1, 2)",
+            str(explain(np.array(0.5), NDArray[Any, Float, Bounds(1, 2)])),
+        )
+        self.assertEqual(
+            "values of dtype <U1 cannot be checked",
+            str(explain(np.array(["a"]), NDArray[Any, Any, Finite])),
+        )
+
+    def test_explain_values_without_constraints(self):
+        # The array passes, as it would if it had changed since its check.
+        arr = np.array([None, "x"], dtype=object)
+
+        self.assertIsNone(_explain_array(arr, NDArray[Any, Any]))
+
+    def test_explain_dataframe(self):
+        df = pd.DataFrame({"x": [1.0], "y": [2]})
+
+        mismatch = explain(df, DataFrame[Structure["x: Float, y: Float"]])
+
+        self.assertEqual("structure", mismatch.kind)
+        self.assertEqual("y", mismatch.field)
+        self.assertEqual("field 'y' has dtype int64, expected Float", str(mismatch))
+        self.assertEqual(
+            "expected an instance of DataFrame, got dict",
+            str(explain({}, DataFrame[Structure["x: Int"]])),
+        )
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from nptyping.expression_parser import (
+    TokenReader,
+    UnexpectedTokenError,
+    tokenize,
+)
+
+
+class ExpressionParserTest(TestCase):
+    def test_tokenize(self):
+        self.assertEqual(
+            [
+                ("", "1"),
+                (" ", "a"),
+                ("", ","),
+                (" ", "["),
+                ("", "b_2"),
+                ("", "]"),
+                ("", ","),
+                ("", "..."),
+                (" ", "$"),
+                ("  ", ""),
+            ],
+            tokenize("1 a, [b_2],... $  "),
+        )
+
+    def test_tokenize_empty_expression(self):
+        self.assertEqual([("", "")], tokenize(""))
+        self.assertEqual([("   ", "")], tokenize("   "))
+
+    def test_token_reader(self):
+        reader = TokenReader("x: *[ 2, 2 ]")
+
+        self.assertEqual("x", reader.peek())
+        self.assertFalse(reader.accept("*"))
+        self.assertEqual("x", reader.next())
+        reader.expect(":")
+        with self.assertRaises(UnexpectedTokenError):
+            reader.expect("[")
+        self.assertTrue(reader.follows_whitespace())
+        self.assertTrue(reader.accept("*"))
+        reader.expect("[")
+        self.assertEqual(" 2, 2 ", reader.read_until("]"))
+        reader.expect("]")
+        self.assertEqual("", reader.read_until("]"))
+        self.assertEqual("", reader.next())
+        reader.expect("")
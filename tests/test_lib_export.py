@@ -8,16 +8,38 @@ class LibExportTest(TestCase):
         expected_exports = {
             "NDArray",
             "RecArray",
+            "acheck",
             "assert_isinstance",
+            "check",
+            "check_all",
+            "check_contents",
+            "check_npy",
+            "NpyCheck",
+            "check_npz",
+            "NpzCheck",
+            "explain",
+            "Mismatch",
+            "configure_parallelism",
+            "checking",
+            "set_checking",
+            "configure_cache",
+            "cache_info",
+            "CacheInfo",
+            "registry_info",
             "validate_shape_expression",
             "normalize_shape_expression",
             "NPTypingError",
             "InvalidDTypeError",
+            "InvalidInstanceError",
             "InvalidShapeError",
             "InvalidStructureError",
             "InvalidArgumentsError",
             "Shape",
             "Structure",
+            "Bounds",
+            "Excludes",
+            "Finite",
+            "ValueConstraint",
             "__version__",
             "DType",
             "Number",
@@ -42,6 +42,28 @@ class MyPyTest(TestCase):
 
         self.assertEqual(0, exit_code, stdout)
 
+    def test_mypy_accepts_ndarray_with_value_constraints_in_annotated(self):
+        exit_code, stdout, stderr = check_mypy_on_code(
+            """
+            from typing import Any
+            from typing_extensions import Annotated
+            import numpy as np
+            from nptyping import Bounds, Finite, Float, NDArray, Shape, check
+
+
+            @check
+            def func(
+                x: Annotated[NDArray[Shape["2, 2"], Float], Bounds(0, 1), Finite]
+            ) -> Annotated[NDArray[Any, Float], Bounds(lower=0)]:
+                return x
+
+
+            func(np.zeros((2, 2)))
+        """
+        )
+
+        self.assertEqual(0, exit_code, stdout)
+
     def test_mypy_disapproves_ndarray_with_wrong_function_arguments(self):
         exit_code, stdout, stderr = check_mypy_on_code(
             """
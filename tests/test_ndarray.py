@@ -5,6 +5,8 @@ import numpy as np
 
 from nptyping import (
     Bool,
+    Bounds,
+    Finite,
     Float,
     Int,
     InvalidArgumentsError,
@@ -94,6 +96,24 @@ class NDArrayTest(TestCase):
             NDArray[Shape["0"], Any],
         )
 
+    def test_isinstance_succeeds_with_subclasses_of_ndarray(self):
+        rec_arr = np.zeros((2, 3)).view(np.recarray)
+
+        self.assertIsInstance(rec_arr, NDArray[Shape["*, 3"], Float])
+        self.assertIsInstance(rec_arr, NDArray[Any, Float])
+        self.assertIsInstance(rec_arr, NDArray[Shape["2, 3"], Any])
+
+    def test_isinstance_fails_with_non_arrays_that_look_like_arrays(self):
+        class ArrayLike:
+            shape = (2, 3)
+            dtype = np.dtype(float)
+
+        self.assertNotIsInstance(ArrayLike(), NDArray)
+        self.assertNotIsInstance(ArrayLike(), NDArray[Shape["2, 3"], Float])
+        self.assertNotIsInstance(ArrayLike(), NDArray[Shape["2, 3"], Any])
+        self.assertNotIsInstance(ArrayLike(), NDArray[Any, Float])
+        self.assertNotIsInstance(ArrayLike(), NDArray[Any, Structure["x: Float"]])
+
     def test_isinstance_succeeds_with_ellipsis(self):
         self.assertIsInstance(
             np.array([[[[[[0]]]]]]),
@@ -191,6 +211,11 @@ class NDArrayTest(TestCase):
         arr = np.array([("x")], np.dtype([("x", "U10", (2, 2))]))
         self.assertIsInstance(arr, NDArray[Any, Structure["x: Str[2, 2]"]])
 
+    def test_isinstance_succeeds_if_structure_has_field_wildcard(self):
+        arr = np.array([("x", 1)], np.dtype([("x", "U10"), ("y", "i4")]))
+        self.assertIsInstance(arr, NDArray[Any, Structure["x: *, y: Int"]])
+        self.assertNotIsInstance(arr, NDArray[Any, Structure["x: *, z: Int"]])
+
     def test_isinstance_fails_if_structure_contains_invalid_types(self):
         with self.assertRaises(InvalidStructureError) as err:
             NDArray[Any, Structure["name: Str, age: Float, address: Address"]]
@@ -204,6 +229,26 @@ class NDArrayTest(TestCase):
             "Type 'AlsoAFloat' is not valid in this context.", str(err.exception)
         )
 
+    def test_isinstance_with_value_constraints(self):
+        UnitInterval = NDArray[Shape["*, 2"], Float, Bounds(0, 1), Finite]
+
+        self.assertIsInstance(np.array([[0.0, 1.0], [0.5, 0.25]]), UnitInterval)
+        self.assertIsInstance(np.empty((0, 2)), UnitInterval)
+        self.assertNotIsInstance(np.array([[0.0, 1.5], [0.5, 0.25]]), UnitInterval)
+        self.assertNotIsInstance(np.array([[0.0, np.nan]]), UnitInterval)
+        self.assertNotIsInstance(np.array([[0.0, np.inf]]), NDArray[Any, Any, Finite])
+        self.assertIsInstance(np.array([[-1, 5]]), NDArray[Any, Int, Finite])
+        self.assertNotIsInstance(np.array([[-1, 5]]), NDArray[Any, Any, Bounds(0)])
+        self.assertNotIsInstance(np.array(["a"]), NDArray[Any, Any, Bounds(0)])
+
+    def test_value_constraints_cannot_be_combined_with_structure(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            NDArray[Any, Structure["x: Float"], Finite]
+        self.assertEqual(
+            "Value constraints cannot be combined with a Structure.",
+            str(err.exception),
+        )
+
     def test_invalid_arguments_raise_errors(self):
         with self.assertRaises(InvalidArgumentsError) as err:
             NDArray[Shape["1"], Any, "Not good"]
@@ -241,6 +286,7 @@ class NDArrayTest(TestCase):
         NDArray[Any, Structure["x: Float, y: Int"]]
         NDArray[Any, Structure["[x, y]: Float, z: Int"]]
         NDArray[Any, Literal["[x, y]: Float, z: Int"]]
+        NDArray[Shape["N"], Float, Bounds(0, 1), Finite]
 
     def test_str(self):
         self.assertEqual("NDArray[Any, Any]", str(NDArray[Any, Any]))
@@ -262,6 +308,11 @@ class NDArrayTest(TestCase):
             repr(NDArray[Any, Structure["x: Float, y: Float"]]),
         )
 
+        self.assertEqual(
+            "NDArray[Shape['N'], Float, Bounds(lower=0), Finite]",
+            str(NDArray[Shape["N"], Float, Bounds(0), Finite, Finite]),
+        )
+
     def test_types_with_numpy_dtypes(self):
         self.assertIsInstance(np.array([42]), NDArray[Any, np.int_])
         self.assertIsInstance(np.array([42.0]), NDArray[Any, np.float_])
@@ -0,0 +1,97 @@
+from threading import Event
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from nptyping import (
+    Bounds,
+    Finite,
+    InvalidArgumentsError,
+    configure_parallelism,
+    parallel,
+)
+from nptyping.parallel import check_values_in_parallel
+from nptyping.value_constraints import check_values
+
+
+class ParallelTest(TestCase):
+    def setUp(self):
+        self.max_workers = parallel._max_workers
+        self.min_size = parallel._min_size
+        configure_parallelism(max_workers=4, min_size=100)
+
+    def tearDown(self):
+        configure_parallelism(max_workers=self.max_workers, min_size=self.min_size)
+
+    def test_check_values_in_parallel(self):
+        arr = np.random.rand(1000, 10)
+
+        self.assertTrue(check_values_in_parallel(arr, [Bounds(0, 1), Finite], 16))
+
+        arr[500, 5] = np.nan
+        self.assertFalse(check_values_in_parallel(arr, [Bounds(0, 1), Finite], 16))
+
+    def test_small_arrays_are_checked_serially(self):
+        with patch("concurrent.futures.ThreadPoolExecutor") as executor:
+            configure_parallelism(max_workers=2)
+            self.assertTrue(check_values_in_parallel(np.ones(99), [Finite]))
+
+        executor.return_value.submit.assert_not_called()
+
+    def test_first_failure_cancels_remaining_slabs(self):
+        calls = []
+
+        def _check_values(slab, constraints, block_size, release_pages, stop):
+            calls.append(stop)
+            return check_values(slab, constraints, block_size, release_pages, stop)
+
+        arr = np.ones(100_000)
+        arr[0] = -1.0
+        with patch.object(parallel, "check_values", _check_values):
+            self.assertFalse(check_values_in_parallel(arr, [Bounds(0, 1)], 16))
+
+        self.assertTrue(all(stop.is_set() for stop in calls))
+
+    def test_failed_submit_cancels_submitted_slabs(self):
+        stop = Event()
+        future = Mock()
+        executor = Mock()
+        executor.submit.side_effect = [future, RuntimeError("shut down")]
+
+        with patch.object(parallel, "_get_executor", return_value=executor):
+            with self.assertRaises(RuntimeError):
+                check_values_in_parallel(np.ones(1000), [Finite], 16, stop=stop)
+
+        self.assertTrue(stop.is_set())
+        future.cancel.assert_called_once_with()
+
+    def test_check_values_stops_when_asked(self):
+        stop = Event()
+        stop.set()
+
+        self.assertFalse(check_values(np.ones(10), [Finite], stop=stop))
+
+    def test_configure_parallelism(self):
+        configure_parallelism(max_workers=1)
+        self.assertIsNone(parallel._get_executor())
+
+        configure_parallelism(max_workers=3)
+        executor = parallel._get_executor()
+        self.assertEqual(3, executor._max_workers)
+        self.assertIs(executor, parallel._get_executor())
+
+    def test_configure_parallelism_with_invalid_values(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            configure_parallelism(max_workers=0)
+        self.assertEqual(
+            "Unexpected max_workers 0, expecting an int of 1 or more.",
+            str(err.exception),
+        )
+
+        with self.assertRaises(InvalidArgumentsError) as err:
+            configure_parallelism(min_size="1")
+        self.assertEqual(
+            "Unexpected min_size '1', expecting an int of 1 or more.",
+            str(err.exception),
+        )
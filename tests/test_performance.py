@@ -1,11 +1,15 @@
+import subprocess
+import sys
 from timeit import Timer
 from unittest import TestCase
 
 import numpy as np
 
 from nptyping import (
+    DataFrame,
     Float,
     NDArray,
+    RecArray,
     Shape,
 )
 
@@ -24,3 +28,44 @@ class PerformanceTest(TestCase):
         self.assertLess(first_time_sec, 0.02)
         self.assertLess(second_time_sec, first_time_sec)
         self.assertLess(second_time_sec, 0.0004)
+
+    def test_module_attribute_performance(self):
+        def _get_modules():
+            NDArray.__module__
+            RecArray.__module__
+            DataFrame.__module__
+
+        def _get_modules_in_deep_stack(depth):
+            if depth:
+                return _get_modules_in_deep_stack(depth - 1)
+            return min(Timer(_get_modules).repeat(repeat=5, number=100))
+
+        # The time should not depend on the depth of the stack. Inspecting the
+        # complete stack would make a depth of 200 over 10 times as slow.
+        shallow_time_sec = _get_modules_in_deep_stack(1)
+        self.assertLess(_get_modules_in_deep_stack(200), 3 * shallow_time_sec)
+
+    def test_import_performance(self):
+        # Numpy is imported upfront, to measure the time of nptyping itself.
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import numpy, nptyping"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        import_time_per_module = {
+            package.strip(): int(cumulative) / 1_000_000
+            for _, cumulative, package in (
+                line.split("|") for line in process.stderr.splitlines()[1:]
+            )
+        }
+
+        self.assertNotIn("pandas", import_time_per_module)
+        self.assertNotIn("asyncio", import_time_per_module)
+        self.assertNotIn("concurrent.futures", import_time_per_module)
+        self.assertNotIn("zipfile", import_time_per_module)
+        # Absolute times depend on the machine, so compare with numpy, which
+        # nptyping takes a fraction of.
+        self.assertLess(
+            import_time_per_module["nptyping"], 0.5 * import_time_per_module["numpy"]
+        )
@@ -0,0 +1,86 @@
+import pickle
+import subprocess
+import sys
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    Bounds,
+    DataFrame,
+    Excludes,
+    Finite,
+    Float32,
+    Int,
+    NDArray,
+    RecArray,
+    Shape,
+    Structure,
+)
+
+
+class PickleTest(TestCase):
+    def test_types_are_unpickled_to_the_same_types(self):
+        types = [
+            Shape,
+            Shape["N, 3"],
+            Structure["x: Int, y: Float32[2, 2]"],
+            NDArray,
+            NDArray[Shape["N, 3"], Float32],
+            NDArray[Any, Float32, Bounds(0, 1), Finite],
+            NDArray[Shape["2"], Structure["x: Int, *"]],
+            RecArray[Any, Structure["x: Int"]],
+            DataFrame,
+            DataFrame[Structure["x: Int"]],
+        ]
+
+        for type_ in types:
+            self.assertIs(type_, pickle.loads(pickle.dumps(type_)), type_)
+
+    def test_finite_is_unpickled_to_finite(self):
+        self.assertIs(Finite, pickle.loads(pickle.dumps(Finite)))
+
+    def test_value_constraints_are_pickled_with_every_protocol(self):
+        constraints = [
+            Bounds(0, 1),
+            Bounds(lower=0.5),
+            Bounds(upper=np.int8(3)),
+            Excludes(-9999, np.nan),
+        ]
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for constraint in constraints:
+                unpickled = pickle.loads(pickle.dumps(constraint, protocol))
+                self.assertEqual(constraint, unpickled, (constraint, protocol))
+                self.assertEqual(repr(constraint), repr(unpickled))
+            self.assertIs(Finite, pickle.loads(pickle.dumps(Finite, protocol)))
+            type_ = NDArray[Any, Float32, Bounds(0, 1), Excludes(2)]
+            self.assertIs(type_, pickle.loads(pickle.dumps(type_, protocol)))
+
+    def test_types_are_pickled_by_their_arguments(self):
+        data = pickle.dumps(NDArray[Shape["N, 3"], Float32])
+
+        self.assertIn(b"N, 3", data)
+        self.assertLess(len(data), 200)
+
+    def test_types_are_unpickled_in_another_process(self):
+        data = pickle.dumps(NDArray[Shape["N, 3"], Float32, Bounds(0, 1)])
+        script = (
+            "import pickle, sys, numpy as np;"
+            "type_ = pickle.loads(sys.stdin.buffer.read());"
+            "print(type_, isinstance(np.zeros((2, 3), np.float32), type_))"
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-c", script],
+            input=data,
+            capture_output=True,
+            check=True,
+        )
+
+        self.assertEqual(
+            "NDArray[Shape['N, 3'], Single, Bounds(0, 1)] True",
+            process.stdout.decode().strip(),
+        )
+        self.assertIsInstance(np.zeros((2, 3), np.float32), pickle.loads(data))
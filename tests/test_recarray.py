@@ -4,11 +4,13 @@ from unittest import TestCase
 import numpy as np
 
 from nptyping import (
+    Finite,
     Int32,
     NDArray,
     RecArray,
     Shape,
     Structure,
+    checking,
 )
 from nptyping.error import InvalidArgumentsError
 
@@ -28,6 +30,10 @@ class RecArrayTest(TestCase):
         self.assertIsInstance(
             rec_arr, NDArray[Shape["1"], Structure["name: Str, age: Int32"]]
         )
+        # The same shape and dtype, but not a recarray.
+        self.assertNotIsInstance(
+            arr, RecArray[Shape["1"], Structure["name: Str, age: Int32"]]
+        )
 
     def test_rec_array_enforces_structure(self):
         with self.assertRaises(InvalidArgumentsError) as err:
@@ -38,8 +44,22 @@ class RecArrayTest(TestCase):
             str(err.exception),
         )
 
+    def test_rec_array_does_not_take_value_constraints(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            RecArray[Any, Any, Finite]
+
+        self.assertEqual("Unexpected argument Finite.", str(err.exception))
+
     def test_rec_array_allows_any(self):
         arr = np.array([("Billy", 23)], dtype=[("name", "U8"), ("age", "i4")])
         rec_arr = arr.view(np.recarray)
 
         self.assertIsInstance(rec_arr, RecArray[Any, Any])
+
+    def test_rec_array_requires_recarray_when_checking_is_off(self):
+        arr = np.array([("Billy", 23)], dtype=[("name", "U8"), ("age", "i4")])
+        rec_array = RecArray[Shape["2"], Structure["name: Str, age: Int32"]]
+
+        with checking("off"):
+            self.assertIsInstance(arr.view(np.recarray), rec_array)
+            self.assertNotIsInstance(arr, rec_array)
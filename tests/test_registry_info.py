@@ -0,0 +1,40 @@
+import gc
+from unittest import TestCase
+
+from nptyping import (
+    Float,
+    NDArray,
+    Shape,
+    cache_info,
+    configure_cache,
+    registry_info,
+)
+
+
+class RegistryInfoTest(TestCase):
+    def test_registry_info(self):
+        shape = Shape["42, 42, 42"]
+        ndarray = NDArray[shape, Float]
+
+        info = registry_info()
+
+        self.assertGreaterEqual(info["Shape"], 1)
+        self.assertGreaterEqual(info["NDArray"], 1)
+        self.assertIs(ndarray, NDArray[Shape["42, 42, 42"], Float])
+
+    def test_unused_types_are_removed(self):
+        # The types that are cached by their expressions are kept alive.
+        maxsize = cache_info()["expression"].maxsize
+        configure_cache(expression_maxsize=0)
+        self.addCleanup(configure_cache, expression_maxsize=maxsize)
+        # An NDArray holds its Shape, which is freed in the next collection.
+        gc.collect()
+        gc.collect()
+        nr_of_shapes = registry_info().get("Shape", 0)
+
+        for i in range(1000):
+            NDArray[Shape[f"{i}, 3"], Float]
+        gc.collect()
+        gc.collect()
+
+        self.assertLessEqual(registry_info().get("Shape", 0), nr_of_shapes)
@@ -1,6 +1,10 @@
 from unittest import TestCase
 
-from nptyping import Shape
+from nptyping import (
+    NDArray,
+    Shape,
+    Structure,
+)
 from nptyping.error import InvalidArgumentsError
 from nptyping.typing_ import Literal
 
@@ -26,6 +30,16 @@ class ShapeTest(TestCase):
         self.assertEqual(Shape["2, 2"], Literal["2, 2"])
         self.assertEqual(Shape[" 2 , 2 "], Literal["2,2"])
 
+    def test_shape_is_not_equal_to_other_types(self):
+        self.assertNotEqual(Shape["2"], Structure["x: Int"])
+        self.assertNotEqual(Shape["2"], NDArray)
+        self.assertNotEqual(Shape["2"], Literal["x: Int"])
+        self.assertNotEqual(Shape["2"], Literal[2])
+        self.assertNotEqual(Shape["2"], Literal["2", "3"])
+        self.assertNotEqual(Shape["2"], "2")
+        self.assertNotEqual(Shape["2"], object())
+        self.assertNotEqual(NDArray, Shape["2"])
+
     def test_quotes_are_allowed(self):
         self.assertEqual(Shape["2, 2"], Shape["'2, 2'"])
         self.assertEqual(Shape["2, 2"], Shape['"2, 2"'])
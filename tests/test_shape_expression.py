@@ -1,10 +1,25 @@
+import random
+import re
+from timeit import Timer
 from unittest import TestCase
 
 from nptyping import (
     InvalidShapeError,
+    Shape,
     normalize_shape_expression,
     validate_shape_expression,
 )
+from nptyping.shape_expression import (
+    ParsedShapeExpression,
+    ShapeDimension,
+    ShapeMatcher,
+    bind_shape_variables,
+    check_shape,
+    compile_shape_expression,
+    create_shape_check,
+    match_shape,
+    parse_shape_expression,
+)
 
 
 class ShapeExpressionTest(TestCase):
@@ -74,3 +89,133 @@ class ShapeExpressionTest(TestCase):
             "1 label1 label2, [label3, label4]",
             normalize_shape_expression(" 1  label1  label2 ,  [ label3 , label4 ] "),
         )
+
+    def test_validate_shape_expression_agrees_with_regex(self):
+        # The former regex that defined valid shape expressions.
+        label = r"(\s*\b[a-z]\w*\s*)"
+        dimension = (
+            rf"((\s*[0-9]+\s*)|(\s*\b[A-Z]\w*\s*)|(\s*\*\s*)"
+            rf"|(\s*\[{label}(\s*,\s*{label})*\]\s*))(\s+{label})*"
+        )
+        dimensions = rf"{dimension}(\s*,\s*{dimension})*"
+        regex = rf"^({dimensions}|({dimensions}\s*,\s*\.\.\.\s*))$"
+        pieces = ["1", "N", "Ab1", "a", "bc", "_", "2a", "*", "...", ",", "[", "]"]
+        pieces += [" ", "  ", "'", "é", "Aé", "..", "$"]
+
+        rnd = random.Random(42)
+        for _ in range(5000):
+            expression = "".join(rnd.choices(pieces, k=rnd.randint(0, 8)))
+            expected = bool(re.match(regex, expression.replace("'", "")))
+            try:
+                validate_shape_expression(expression)
+                is_valid = True
+            except InvalidShapeError:
+                is_valid = False
+            self.assertEqual(expected, is_valid, expression)
+
+    def test_validate_shape_expression_takes_linear_time(self):
+        # These took seconds with the former regex that had to backtrack.
+        expressions = ["1" + " " * 1000 + "!", ", ".join(["1 a"] * 1000) + ", !"]
+
+        def _validate_all() -> None:
+            for expression in expressions:
+                with self.assertRaises(InvalidShapeError):
+                    validate_shape_expression(expression)
+
+        self.assertLess(Timer(_validate_all).timeit(number=1), 0.1)
+
+    def test_parse_shape_expression(self):
+        parsed_shape_expression = parse_shape_expression(" N, [a , b] x  y , ... ")
+
+        self.assertEqual(
+            ParsedShapeExpression(
+                (ShapeDimension("N", ()), ShapeDimension("[a, b]", ("x", "y"))),
+                True,
+            ),
+            parsed_shape_expression,
+        )
+        self.assertEqual("N, [a, b] x y, ...", parsed_shape_expression.normalize())
+        self.assertEqual(["N", "2", "..."], parsed_shape_expression.get_sizes())
+
+    def test_compile_shape_expression(self):
+        self.assertEqual(
+            ShapeMatcher((1, 2), (), False), compile_shape_expression("1, 2")
+        )
+        self.assertEqual(
+            ShapeMatcher((-1, 3), (), True), compile_shape_expression("*, 3, ...")
+        )
+        self.assertEqual(
+            ShapeMatcher((-2, -3, -2), ("N", "M"), False),
+            compile_shape_expression("N, M, N"),
+        )
+        self.assertEqual(
+            ShapeMatcher((3, 5), (), False),
+            compile_shape_expression("[a, b, c] stuff, 5 other stuff"),
+        )
+        self.assertEqual(
+            ShapeMatcher((2, 2), (), False), compile_shape_expression("'2, 2'")
+        )
+
+    def test_match_shape(self):
+        self.assertTrue(match_shape((2, 3), compile_shape_expression("2, 3")))
+        self.assertFalse(match_shape((2, 3), compile_shape_expression("2, 2")))
+        self.assertFalse(match_shape((2,), compile_shape_expression("2, 2")))
+        self.assertTrue(match_shape((4, 4, 1), compile_shape_expression("N, N, *")))
+        self.assertFalse(match_shape((4, 3, 1), compile_shape_expression("N, N, *")))
+        self.assertTrue(
+            match_shape((1, 2, 2, 2), compile_shape_expression("1, N, ..."))
+        )
+        self.assertFalse(match_shape((1, 2, 3), compile_shape_expression("1, N, ...")))
+        self.assertFalse(match_shape((1,), compile_shape_expression("1, N, ...")))
+        self.assertTrue(match_shape((5, 6), compile_shape_expression("*, ...")))
+        self.assertFalse(match_shape((), compile_shape_expression("*, ...")))
+
+    def test_check_shape_uses_matcher_of_shape(self):
+        self.assertEqual(compile_shape_expression("N, 2"), Shape["N, 2"].matcher)
+        self.assertTrue(check_shape((3, 2), Shape["N, 2"]))
+        self.assertTrue(check_shape((3, 2), Shape))
+        self.assertTrue(check_shape((2, 2), Shape["'2, 2'"]))
+
+    def test_create_shape_check(self):
+        for expression, shape, expected in [
+            ("2, 3", (2, 3), True),
+            ("2, 3", (2, 4), False),
+            ("*, 3", (7, 3), True),
+            ("*, 3", (7, 4), False),
+            ("*, 3", (3,), False),
+            ("N, 2, 3", (1, 2, 3), True),
+            ("N, 2, 3", (1, 2, 4), False),
+            ("N, *", (1, 2), True),
+            ("N, *", (1, 2, 3), False),
+            ("N, N", (2, 2), True),
+            ("N, N", (2, 3), False),
+            ("N, ...", (2, 2, 2), True),
+            ("N, ...", (2, 2, 3), False),
+        ]:
+            check = create_shape_check(Shape[expression])
+            self.assertIs(expected, check(shape), (expression, shape))
+
+    def test_create_shape_check_corresponds_to_match_shape(self):
+        rnd = random.Random(42)
+        for _ in range(2000):
+            dimensions = [rnd.choice(["1", "2", "*", "N", "M"]) for _ in range(3)]
+            expression = ", ".join(dimensions[: rnd.randint(1, 3)])
+            if rnd.random() < 0.2:
+                expression += ", ..."
+            shape = tuple(rnd.randint(1, 2) for _ in range(rnd.randint(0, 4)))
+            check = create_shape_check(Shape[expression])
+
+            self.assertEqual(
+                match_shape(shape, compile_shape_expression(expression)),
+                check(shape),
+                (expression, shape),
+            )
+
+    def test_bind_shape_variables(self):
+        variables = {}
+        matcher = compile_shape_expression("N, *, M, ...")
+
+        self.assertTrue(bind_shape_variables((2, 3, 4, 4), matcher, variables))
+        self.assertEqual({"N": 2, "M": 4}, variables)
+        self.assertTrue(bind_shape_variables((2, 5, 4), matcher, variables))
+        self.assertFalse(bind_shape_variables((3, 5, 4), matcher, variables))
@@ -1,6 +1,10 @@
 from unittest import TestCase
 
-from nptyping import Structure
+from nptyping import (
+    NDArray,
+    Shape,
+    Structure,
+)
 from nptyping.error import InvalidArgumentsError
 from nptyping.typing_ import Literal
 
@@ -25,6 +29,14 @@ class StructureTest(TestCase):
     def test_shape_and_literal_are_interchangeable(self):
         self.assertEqual(Structure["name: type"], Literal["name: type"])
 
+    def test_structure_is_not_equal_to_other_types(self):
+        self.assertNotEqual(Structure["x: Int"], Shape["2"])
+        self.assertNotEqual(Structure["x: Int"], NDArray)
+        self.assertNotEqual(Structure["x: Int"], Literal["2, 2"])
+        self.assertNotEqual(Structure["x: Int"], Literal[42])
+        self.assertNotEqual(Structure["x: Int"], "x: Int")
+        self.assertNotEqual(Structure["x: Int"], object())
+
     def test_get_types(self):
         structure = Structure["a: Float, b: Int, [c, d, e]: Complex"]
         self.assertEqual({"Float", "Int", "Complex"}, set(structure.get_types()))
@@ -33,6 +45,21 @@ class StructureTest(TestCase):
         structure = Structure["a: Float, b: Int, [c, d, e]: Complex"]
         self.assertEqual({"a", "b", "c", "d", "e"}, set(structure.get_names()))
 
+    def test_get_fields(self):
+        structure = Structure["a: Float, [b, c]: Int[2, 2], d: Str [3], e: *"]
+        fields = structure.get_fields()
+        self.assertEqual({"a", "b", "c", "d", "e"}, set(fields))
+        self.assertEqual(("Float", None), fields["a"])
+        self.assertEqual(("Int", Shape["2, 2"]), fields["b"])
+        self.assertEqual(("Int", Shape["2, 2"]), fields["c"])
+        self.assertEqual(("Str", Shape["3"]), fields["d"])
+        self.assertEqual(("*", None), fields["e"])
+
+    def test_get_type(self):
+        structure = Structure["a: Float, [b, c]: Int[2, 2]"]
+        self.assertEqual("Float", structure.get_type("a"))
+        self.assertEqual("Int[2, 2]", structure.get_type("b"))
+
     def test_structure_can_be_compared_to_literal(self):
         self.assertEqual(Structure["a: Int, b: Float"], Literal["a: Int, b: Float"])
         self.assertEqual(
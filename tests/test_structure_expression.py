@@ -1,13 +1,23 @@
+import random
+import re
+from timeit import Timer
 from unittest import TestCase
 
 import numpy as np
 
-from nptyping import Structure
+from nptyping import (
+    Shape,
+    Structure,
+    cache_info,
+)
 from nptyping.error import InvalidStructureError
 from nptyping.structure_expression import (
+    StructureField,
     check_structure,
+    create_name_to_field_dict,
     create_name_to_type_dict,
     normalize_structure_expression,
+    parse_structure_expression,
     validate_structure_expression,
 )
 from nptyping.typing_ import dtype_per_name
@@ -184,6 +194,75 @@ class StructureExpressionTest(TestCase):
             str(err.exception),
         )
 
+    def test_validate_structure_expression_agrees_with_regex(self):
+        # The former regex that defined valid structure expressions, apart
+        # from the shape expressions of sub arrays and duplicate field names.
+        name = r"(\s*[a-zA-Z]\w*\s*)"
+        names = rf"({name}|(\s*\[{name}(\s*,\s*{name})+\]\s*))"
+        type_ = rf"({name}|(\s*\*\s*))\s*(\[([^\]]+)\])?\s*"
+        field = rf"(\s*{names}(\s*:\s*){type_}\s*)"
+        regex = rf"^({field}(\s*,\s*{field})*(\s*,\s*\*\s*)?)$"
+        pieces = ["x", "y", "Ab", "_", "1", "é", "t1", "*", ",", "[", "]", ": "]
+        pieces += [" ", "[x, y]", "...", "N", "z: Int[2]", "$"]
+
+        rnd = random.Random(42)
+        for _ in range(5000):
+            expression = "".join(rnd.choices(pieces, k=rnd.randint(0, 8)))
+            expected = bool(re.match(regex, expression))
+            try:
+                validate_structure_expression(expression)
+                is_valid = True
+            except InvalidStructureError as err:
+                is_valid = not str(err).endswith("is not a valid structure expression.")
+            self.assertEqual(expected, is_valid, expression)
+
+    def test_validate_structure_expression_takes_linear_time(self):
+        # These took seconds with the former regex that had to backtrack.
+        expressions = ["x" + " " * 1000 + "!", "x:" + " " * 500 + "t" + " " * 500]
+        structure_expression = ", ".join(f"x{i}: Int[2, 2]" for i in range(1000))
+
+        def _validate_all() -> None:
+            for expression in expressions:
+                with self.assertRaises(InvalidStructureError):
+                    validate_structure_expression(expression + "!")
+            validate_structure_expression(structure_expression)
+
+        self.assertLess(Timer(_validate_all).timeit(number=1), 0.1)
+
+    def test_sub_arrays_with_colons_are_invalid(self):
+        with self.assertRaises(InvalidStructureError) as err:
+            validate_structure_expression("x: Int[y: Float]")
+
+        self.assertEqual(
+            "'x: Int[y: Float]' is not a valid structure expression; 'y: Float'"
+            " is not a valid shape expression.",
+            str(err.exception),
+        )
+
+    def test_parse_structure_expression(self):
+        parsed_structure_expression = parse_structure_expression(
+            " c: Int [ 2 , 2 ], [b, a]: Float, d: Int[2, 2], *"
+        )
+
+        self.assertTrue(parsed_structure_expression.has_wildcard)
+        self.assertEqual(
+            "[a, b]: Float, [c, d]: Int[2, 2], *",
+            parsed_structure_expression.normalize(),
+        )
+        self.assertEqual(
+            {"a": "Float", "b": "Float", "c": "Int[2, 2]", "d": "Int[2, 2]"},
+            parsed_structure_expression.get_type_per_name(),
+        )
+        self.assertEqual(
+            {
+                "a": StructureField("Float", None),
+                "b": StructureField("Float", None),
+                "c": StructureField("Int", Shape["2, 2"]),
+                "d": StructureField("Int", Shape["2, 2"]),
+            },
+            parsed_structure_expression.get_field_per_name(),
+        )
+
     def test_normalize_structure_expression(self):
         self.assertEqual("a: t", normalize_structure_expression("  a  :  t  "))
         self.assertEqual("a: t", normalize_structure_expression("a:t"))
@@ -206,12 +285,18 @@ class StructureExpressionTest(TestCase):
         self.assertEqual(
             "a: t[*, ...]", normalize_structure_expression("  a  :  t  [ * , ... ]")
         )
+        self.assertEqual("a: t[2 x, N]", normalize_structure_expression("a: t[2  x,N]"))
 
     def test_create_name_to_type_dict(self):
         output = create_name_to_type_dict("a: t1, b: t2, c: t1")
         expected = {"a": "t1", "b": "t2", "c": "t1"}
         self.assertDictEqual(expected, output)
 
+    def test_create_name_to_field_dict(self):
+        output = create_name_to_field_dict("a: t1, b: t2[2]")
+        expected = {"a": ("t1", None), "b": ("t2", Shape["2"])}
+        self.assertDictEqual(expected, output)
+
     def test_structure_depicting_at_least(self):
         # Test that you can define a Structure that expresses a structure with
         # at least some columns of some type.
@@ -226,3 +311,17 @@ class StructureExpressionTest(TestCase):
         self.assertTrue(check_structure(dtype_true2, structure, dtype_per_name))
         self.assertFalse(check_structure(dtype_false1, structure, dtype_per_name))
         self.assertFalse(check_structure(dtype_false2, structure, dtype_per_name))
+
+    def test_check_structure_is_cached(self):
+        dtype = np.dtype([("cached_x", "i4"), ("cached_y", "f8")])
+        structure = Structure["cached_x: Int32, cached_y: Float64"]
+        misses_before = cache_info()["structure"].misses
+        hits_before = cache_info()["structure"].hits
+
+        self.assertTrue(check_structure(dtype, structure, dtype_per_name))
+        self.assertTrue(check_structure(dtype, structure, dtype_per_name))
+        other_lexicon = {"Int32": np.int32, "Float64": np.float32}
+        self.assertFalse(check_structure(dtype, structure, other_lexicon))
+
+        self.assertEqual(misses_before + 2, cache_info()["structure"].misses)
+        self.assertEqual(hits_before + 1, cache_info()["structure"].hits)
@@ -0,0 +1,120 @@
+from typing import Any
+from unittest import TestCase
+
+import numpy as np
+
+from nptyping import (
+    Bounds,
+    Excludes,
+    Finite,
+    Float,
+    InvalidArgumentsError,
+    NDArray,
+)
+from nptyping.value_constraints import check_values, iterate_blocks
+
+
+class ValueConstraintsTest(TestCase):
+    def test_bounds(self):
+        self.assertTrue(Bounds(0, 1).check_extremes(0, 1))
+        self.assertTrue(Bounds(lower=0).check_extremes(0, 1000))
+        self.assertTrue(Bounds(upper=1).check_extremes(-1000, 1))
+        self.assertTrue(Bounds().check_extremes(-1000, 1000))
+        self.assertFalse(Bounds(0, 1).check_extremes(-0.1, 1))
+        self.assertFalse(Bounds(0, 1).check_extremes(0, 1.1))
+        self.assertFalse(Bounds(0, 1).check_extremes(np.nan, np.nan))
+
+    def test_invalid_bounds(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            Bounds(1, 0)
+        self.assertEqual(
+            "Unexpected bounds, lower 1 is greater than upper 0.", str(err.exception)
+        )
+
+        with self.assertRaises(InvalidArgumentsError) as err:
+            Bounds("0")
+        self.assertEqual(
+            "Unexpected bound '0', expecting a real number or None.",
+            str(err.exception),
+        )
+
+    def test_finite(self):
+        self.assertTrue(Finite.check_extremes(-1.0, 1.0))
+        self.assertFalse(Finite.check_extremes(-np.inf, 1.0))
+        self.assertFalse(Finite.check_extremes(np.nan, np.nan))
+
+    def test_excludes(self):
+        arr = np.array([[1.0, 2.0], [3.0, np.nan]])
+
+        self.assertTrue(check_values(arr[:1], [Excludes(3, np.nan)]))
+        self.assertFalse(check_values(arr, [Excludes(3)]))
+        self.assertFalse(check_values(arr, [Excludes(np.nan)]))
+        self.assertFalse(check_values(arr, [Excludes(1)], block_size=1))
+        self.assertTrue(check_values(arr, [Excludes(42)], block_size=1))
+        self.assertFalse(check_values(np.array([-1, 0]), [Bounds(0), Excludes(42)]))
+
+    def test_invalid_excludes(self):
+        with self.assertRaises(InvalidArgumentsError) as err:
+            Excludes()
+        self.assertEqual("Excludes needs at least one value.", str(err.exception))
+
+        with self.assertRaises(InvalidArgumentsError) as err:
+            Excludes("-1")
+        self.assertEqual(
+            "Unexpected value '-1', expecting a real number.", str(err.exception)
+        )
+
+    def test_repr(self):
+        self.assertEqual("Bounds(0, 1)", repr(Bounds(0, 1)))
+        self.assertEqual("Bounds(lower=0)", repr(Bounds(lower=0)))
+        self.assertEqual("Bounds(upper=1)", repr(Bounds(upper=1)))
+        self.assertEqual("Bounds()", repr(Bounds()))
+        self.assertEqual("Finite", repr(Finite))
+        self.assertEqual("Excludes(-1, nan)", repr(Excludes(-1, np.nan)))
+
+    def test_equality(self):
+        self.assertEqual(Bounds(0, 1), Bounds(0, 1))
+        self.assertEqual(hash(Bounds(0, 1)), hash(Bounds(0, 1)))
+        self.assertNotEqual(Bounds(0, 1), Bounds(0, 2))
+        self.assertNotEqual(Bounds(0, 1), "Bounds(0, 1)")
+
+    def test_equality_by_value(self):
+        self.assertEqual(Bounds(0), Bounds(0.0))
+        self.assertEqual(hash(Bounds(0)), hash(Bounds(0.0)))
+        self.assertEqual(Bounds(0, 1), Bounds(np.float64(0), np.int8(1)))
+        self.assertNotEqual(Bounds(lower=0), Bounds(upper=0))
+        self.assertEqual(Excludes(np.nan, 1), Excludes(1.0, float("nan")))
+        self.assertEqual(hash(Excludes(np.nan)), hash(Excludes(float("nan"))))
+        self.assertNotEqual(Excludes(0), Bounds(0))
+        self.assertIs(NDArray[Any, Float, Bounds(0)], NDArray[Any, Float, Bounds(0.0)])
+
+    def test_check_values(self):
+        arr = np.arange(100, dtype=float).reshape(10, 10)
+
+        self.assertTrue(check_values(arr, []))
+        self.assertTrue(check_values(arr, [Bounds(0, 99), Finite], block_size=7))
+        self.assertFalse(check_values(arr, [Bounds(0, 98), Finite], block_size=7))
+        self.assertTrue(check_values(np.array(0.5), [Bounds(0, 1)]))
+        self.assertTrue(check_values(np.array([True, False]), [Bounds(0, 1)]))
+        self.assertFalse(check_values(np.array([1 + 1j]), [Finite]))
+
+    def test_check_values_stops_at_first_failing_block(self):
+        checked = []
+
+        class Recording(Bounds):
+            def check_extremes(self, minimum, maximum):
+                checked.append((minimum, maximum))
+                return super().check_extremes(minimum, maximum)
+
+        arr = np.array([[0, 1], [2, 3], [-1, 4], [5, 6]])
+
+        self.assertFalse(check_values(arr, [Recording(0)], block_size=4))
+        self.assertEqual([(0, 3), (-1, 6)], checked)
+
+    def test_iterate_blocks(self):
+        arr = np.zeros((10, 3))
+
+        self.assertEqual([4, 4, 2], [len(b) for b in iterate_blocks(arr, 12)])
+        self.assertEqual([1] * 10, [len(b) for b in iterate_blocks(arr, 1)])
+        self.assertEqual([], list(iterate_blocks(np.zeros((0, 3)), 12)))
+        self.assertEqual([()], [b.shape for b in iterate_blocks(np.array(1), 12)])
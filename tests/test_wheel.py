@@ -27,16 +27,28 @@ if os.name == "nt":
     _VENV_PIP = "Scripts\\pip.exe"
 _EXPECTED_FILES_IN_WHEEL = {
     "__init__.py",
+    "acheck.py",
     "assert_isinstance.py",
     "base_meta_classes.py",
+    "cache.py",
+    "check.py",
+    "check_all.py",
+    "check_contents.py",
+    "check_npy.py",
+    "check_npz.py",
+    "checking.py",
     "error.py",
+    "explain.py",
+    "expression_parser.py",
     "ndarray.py",
     "ndarray.pyi",
     "nptyping_type.py",
     "package_info.py",
+    "parallel.py",
     "py.typed",
     "recarray.py",
     "recarray.pyi",
+    "registry_info.py",
     "shape.py",
     "shape.pyi",
     "shape_expression.py",
@@ -45,6 +57,7 @@ _EXPECTED_FILES_IN_WHEEL = {
     "structure_expression.py",
     "typing_.py",
     "typing_.pyi",
+    "value_constraints.py",
     "pandas_/__init__.py",
     "pandas_/dataframe.py",
     "pandas_/dataframe.pyi",